@@ -0,0 +1,92 @@
+"""
+Micro-benchmark: per-pair CPU overhead of the pipeline itself, with the model calls removed.
+
+Pooled clients are replaced by in-process fakes that return canned schema objects instantly,
+so what is measured is graph orchestration, state handling, prompt formatting and parallel
+voting. The jury always splits and the debate always runs to max_rounds (the slowest path).
+
+Usage (from project root):
+  uv run python eval/bench_overhead.py --pairs 500
+"""
+
+import argparse
+import itertools
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from langchain_core.messages import AIMessage
+
+import agents.llm
+from config import load_config
+from schemas import AxisResult, DebateStatus, Evidence, Fact, FactFrame, JuryOutput, RevoteOutput, Verdict
+from workflow import run_pipeline
+
+_FACTS = [
+    Fact(category=f"fact_{i}", claim_says=f"claim value {i}", truth_says=f"truth value {i}", note="mismatch")
+    for i in range(6)
+]
+
+
+class _FakeModel:
+    """Stands in for a pooled client: invoke(prompt) returns a canned answer for its schema."""
+
+    def __init__(self, schema: type | None) -> None:
+        self.schema = schema
+        self.votes = itertools.cycle(["Faithful", "Mutated"])
+
+    def invoke(self, prompt: str):
+        if self.schema is FactFrame:
+            return FactFrame(facts=_FACTS)
+        if self.schema is JuryOutput:
+            verdict = next(self.votes)
+            evidence = [Evidence(fact_index=i, issue="differs") for i in range(3)] if verdict == "Mutated" else []
+            return JuryOutput(verdict=verdict, confidence=0.8, evidence=evidence, reasoning="Because. " * 20)
+        if self.schema is RevoteOutput:
+            return RevoteOutput(verdict=next(self.votes), confidence=0.8, reasoning="Held. " * 8)
+        if self.schema is DebateStatus:
+            return DebateStatus(conceded=False, no_new_arguments=False)
+        if self.schema is Verdict:
+            axes = [AxisResult(axis=f"axis_{i}", passed=i % 2 == 0, note="ok") for i in range(5)]
+            return Verdict(verdict="Mutated", confidence=0.7, axis_results=axes, summary="Summary. " * 10)
+        return AIMessage(content="An argument. " * 30)
+
+    def stream(self, prompt: str, config=None):
+        yield self.invoke(prompt)
+
+
+def _install_fakes() -> None:
+    models: dict = {}
+    agents.llm._chat_openai = lambda model, temperature, spec=(): models.setdefault(None, _FakeModel(None))
+    agents.llm._structured = lambda model, temperature, schema, spec=(): models.setdefault(schema, _FakeModel(schema))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Per-pair CPU overhead of the pipeline without model calls")
+    ap.add_argument("--pairs", type=int, default=200, help="Pairs to time (after warm-up)")
+    ap.add_argument("--warmup", type=int, default=20)
+    args = ap.parse_args()
+
+    _install_fakes()
+    config = load_config()
+    claim = "The city reported 1,200 new cases last week, a 40% rise."
+    truth = "Officials reported 1,150 new cases last week, up about 38% on the week before."
+
+    for _ in range(args.warmup):
+        run_pipeline(claim, truth, config)
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    for _ in range(args.pairs):
+        run_pipeline(claim, truth, config)
+    cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+
+    print(f"Pairs: {args.pairs} (split jury, {config.get('debate', {}).get('max_rounds', 2)} debate rounds)")
+    print(f"CPU per pair:  {cpu / args.pairs * 1000:.2f} ms")
+    print(f"Wall per pair: {wall / args.pairs * 1000:.2f} ms")
+    print(f"Throughput:    {args.pairs / wall * 60:,.0f} pairs/min on one thread")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Startup benchmark: wall time of short CLI invocations in fresh interpreters (imports dominate).
+
+Each command runs --runs times in a new process; min and median are reported. With
+--importtime, the slowest imports of the dry-run path are listed (python -X importtime).
+
+Usage (from project root):
+  uv run python eval/bench_startup.py --runs 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC = PROJECT_ROOT / "src"
+
+COMMANDS = {
+    "python (baseline)": ["-c", "pass"],
+    "main.py --version": [str(SRC / "main.py"), "--version"],
+    "main.py --dry-run": [str(SRC / "main.py"), "--dry-run"],
+    "import workflow": ["-c", "import workflow"],
+    "first client (langchain_openai)": ["-c", "from agents.llm import chat_model; from config import load_config; chat_model('agents', load_config())"],
+}
+
+
+def _env() -> dict:
+    env = dict(os.environ, PYTHONPATH=str(SRC), PYTHONWARNINGS="ignore")
+    env.setdefault("OPENAI_API_KEY", "bench")  # building a client needs a key, no request is made
+    return env
+
+
+def _time(args: list[str], runs: int) -> list[float]:
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, *args], env=_env(), cwd=PROJECT_ROOT, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def _slowest_imports(args: list[str], top: int) -> list[tuple[int, str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], env=_env(), cwd=PROJECT_ROOT,
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if len(name) - len(name.lstrip()) == 1:  # top-level imports only (nested ones are indented)
+            rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="CLI startup time in fresh interpreters")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--importtime", action="store_true", help="List the slowest imports of main.py --dry-run")
+    args = ap.parse_args()
+
+    _time(COMMANDS["python (baseline)"], 1)  # warm the OS file cache
+    print(f"{'command':34s} {'min':>8s} {'median':>8s}   ({args.runs} runs)")
+    for name, cmd in COMMANDS.items():
+        times = _time(cmd, args.runs)
+        print(f"{name:34s} {min(times) * 1000:7.0f}ms {statistics.median(times) * 1000:7.0f}ms")
+
+    if args.importtime:
+        print("\nSlowest imports (cumulative) for main.py --dry-run:")
+        for us, name in _slowest_imports(COMMANDS["main.py --dry-run"], 10):
+            print(f"  {us / 1000:8.1f}ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Near-duplicate structure of a dataset: how many pairs are paraphrases or re-tokenisations of
+another pair (same numbers and qualifier kinds, overlapping claim content words; claim and truth
+both above the shingle similarity threshold), grouped into clusters. Every pair in a cluster but one could reuse a stored verdict
+(coalesce.near_duplicates), so the report also gives the share of jury runs that would be skipped.
+
+Usage (from project root):
+  uv run python eval/duplicates.py                       # data.source from config
+  uv run python eval/duplicates.py data/*.csv --top 10   # several files as one dataset
+  uv run python eval/duplicates.py --threshold 0.7 --json
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from config import load_config
+from retrieval import NearDuplicates, content_words, pair_similarity, reuse_key, word_similarity
+
+
+def load_rows(paths: list[Path], claim_col: str, truth_col: str) -> list[dict]:
+    """Every (claim, truth) row of the files, with a "file:row" id."""
+    rows = []
+    for path in paths:
+        with open(path, encoding="utf-8", newline="") as f:
+            for i, record in enumerate(csv.DictReader(f)):
+                rows.append({"id": f"{path.stem}:{i}", "claim": record[claim_col], "truth": record[truth_col]})
+    return rows
+
+
+def clusters(rows: list[dict], store: NearDuplicates) -> list[list[int]]:
+    """
+    Near-duplicate clusters (row indices, largest first; singletons left out), built the way the
+    store fills up: in dataset order, a pair joins the most similar earlier representative that
+    passes the store's checks against it, else it becomes a representative (a jury run) itself.
+    Every member is a near-duplicate of its cluster's first pair, not just of another member.
+    """
+    signatures = [store.signature(r["claim"], r["truth"]) for r in rows]
+    keys = [reuse_key(r["claim"], r["truth"]) for r in rows]
+    words = [content_words(r["claim"]) for r in rows]
+    buckets: dict[tuple[int, int], list[int]] = defaultdict(list)  # representatives only
+    members: dict[int, list[int]] = {}
+    for i, signature in enumerate(signatures):
+        bands = store.band_keys(signature)
+        candidates = {rep for band, key in enumerate(bands) for rep in buckets.get((band, key), ())}
+        best, best_score = None, 0.0
+        for rep in sorted(candidates):
+            gated = keys[rep] == keys[i] and word_similarity(words[rep], words[i]) >= store.word_threshold
+            score = pair_similarity(signature, signatures[rep]) if gated else 0.0
+            if score >= store.threshold and score > best_score:
+                best, best_score = rep, score
+        if best is not None:
+            members[best].append(i)
+            continue
+        members[i] = [i]
+        for band, key in enumerate(bands):
+            buckets[band, key].append(i)
+    return sorted((g for g in members.values() if len(g) > 1), key=lambda g: (-len(g), g[0]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the near-duplicate clusters of a dataset")
+    parser.add_argument("paths", nargs="*", type=Path, help="CSV files, read as one dataset. Default: data.source")
+    parser.add_argument("--config", type=str, default=None, help="Path to config YAML. Default: config.yaml")
+    parser.add_argument("--threshold", type=float, default=None, help="Default: coalesce.near_duplicates.threshold")
+    parser.add_argument("--word-threshold", type=float, default=None, help="Default: coalesce.near_duplicates.word_threshold")
+    parser.add_argument("--top", type=int, default=5, help="Largest clusters to print")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    data = config.get("data", {})
+    if data.get("truth_col") is None:
+        sys.exit("data.truth_col is null: near-duplicates are measured over (claim, truth) pairs")
+    cfg = (config.get("coalesce") or {}).get("near_duplicates") or {}
+    threshold = args.threshold if args.threshold is not None else cfg.get("threshold", 0.85)
+    word_threshold = args.word_threshold if args.word_threshold is not None else cfg.get("word_threshold", 0.8)
+    paths = args.paths or [PROJECT_ROOT / data["source"]]
+    rows = load_rows(paths, data.get("claim_col", "claim"), data["truth_col"])
+
+    t0 = time.perf_counter()
+    store = NearDuplicates(  # in memory: only its signatures and thresholds are used
+        ":memory:",
+        threshold=threshold,
+        word_threshold=word_threshold,
+        num_perm=cfg.get("num_perm", 128),
+        bands=cfg.get("bands", 32),
+        shingle_chars=cfg.get("shingle_chars", 5),
+    )
+    found = clusters(rows, store)
+    elapsed = time.perf_counter() - t0
+    skipped = sum(len(g) - 1 for g in found)
+    report = {
+        "pairs": len(rows),
+        "threshold": threshold,
+        "word_threshold": word_threshold,
+        "clusters": len(found),
+        "pairs_in_clusters": sum(len(g) for g in found),
+        "jury_runs": len(rows) - skipped,
+        "skippable": skipped,
+        "skippable_share": skipped / len(rows) if rows else 0.0,
+        "cluster_sizes": dict(sorted(Counter(len(g) for g in found).items())),
+        "top": [[rows[i]["id"] for i in g] for g in found[: args.top]],
+        "seconds": round(elapsed, 3),
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{report['pairs']} pairs, threshold {threshold}: {report['clusters']} near-duplicate clusters"
+          f" holding {report['pairs_in_clusters']} pairs ({elapsed:.2f}s)")
+    print(f"Jury runs: {report['jury_runs']} of {report['pairs']}"
+          f" ({report['skippable']} skippable, {report['skippable_share']:.1%})")
+    if found:
+        print("Cluster sizes: " + ", ".join(f"{size}×{count}" for size, count in report["cluster_sizes"].items()))
+    for g in found[: args.top]:
+        print(f"\n[{len(g)} pairs]")
+        for i in g:
+            print(f"  {rows[i]['id']}: {rows[i]['claim'][:100]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,261 +1,357 @@
 """
 Error analysis: inspect traces for pairs where the jury was wrong, count errors by component, focus improvement efforts.
+Reads the trace store (eval/traces.sqlite); the counts are SQL aggregates over the stored traces, so
+any run can be analysed or compared with another.
 
 Usage (from project root):
-  uv run python eval/error_analysis.py
+  uv run python eval/error_analysis.py                        # latest run
+  uv run python eval/error_analysis.py --run 20260101-120000  # a given run (ID or unique prefix)
+  uv run python eval/error_analysis.py --compare previous     # latest run vs the one before
+  uv run python eval/error_analysis.py --runs                 # list runs
 """
 
-import json
-import sys
-from pathlib import Path
+import argparse
 
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
+from trace_store import DEFAULT_PATH, TraceStore, print_runs
 
+# Per failure: average confidence of the initial votes that disagreed with the expected verdict
+_WRONG_VOTE_CONFIDENCE = """
+SELECT
+    SUM(avg_conf < 0.7) AS low,
+    SUM(avg_conf > 0.8) AS high
+FROM (
+    SELECT AVG(COALESCE(json_extract(v.value, '$.confidence'), 0)) AS avg_conf
+    FROM traces t, json_each(t.trace, '$.initial_votes') v
+    WHERE t.run_id = ? AND NOT t.jury_correct
+      AND lower(COALESCE(json_extract(v.value, '$.verdict'), '')) != lower(t.expected)
+    GROUP BY t.id
+)
+"""
 
-def load_traces() -> list[dict]:
-    """Load all trace files from eval/traces/."""
-    traces_dir = PROJECT_ROOT / "eval" / "traces"
-    if not traces_dir.exists():
-        print("No traces found. Run: uv run python eval/run_eval.py")
-        return []
+# Per failure with both vote rounds: correct votes before vs after the debate
+_DEBATE_IMPACT = """
+SELECT
+    SUM(revote_correct > initial_correct) AS helped,
+    SUM(revote_correct < initial_correct) AS hurt
+FROM (
+    SELECT
+        (SELECT COUNT(*) FROM json_each(t.trace, '$.initial_votes') v
+         WHERE lower(COALESCE(json_extract(v.value, '$.verdict'), '')) = lower(t.expected)) AS initial_correct,
+        (SELECT COUNT(*) FROM json_each(t.trace, '$.revote_votes') v
+         WHERE lower(COALESCE(json_extract(v.value, '$.verdict'), '')) = lower(t.expected)) AS revote_correct
+    FROM traces t
+    WHERE t.run_id = ? AND NOT t.jury_correct
+      AND json_array_length(t.trace, '$.initial_votes') > 0
+      AND json_array_length(t.trace, '$.revote_votes') > 0
+)
+"""
 
-    traces = []
-    for f in sorted(traces_dir.glob("pair_*.json")):
-        with open(f, encoding="utf-8") as fp:
-            traces.append(json.load(fp))
-    return traces
+# Failed rubric axes (foreperson.axis_results, falling back to the legacy jury_axis_results)
+_FAILED_AXES = """
+SELECT COALESCE(json_extract(a.value, '$.axis'), 'unknown') AS axis, COUNT(*) AS failures
+FROM traces t, json_each(
+    t.trace,
+    CASE WHEN json_array_length(t.trace, '$.foreperson.axis_results') > 0
+         THEN '$.foreperson.axis_results' ELSE '$.jury_axis_results' END
+) a
+WHERE t.run_id = ? AND NOT t.jury_correct AND NOT COALESCE(json_extract(a.value, '$.passed'), 0)
+GROUP BY axis
+ORDER BY failures DESC, axis
+"""
 
+_FAILURE_COUNTS = """
+SELECT
+    COUNT(*) AS total,
+    SUM(NOT jury_correct) AS failures,
+    SUM(NOT jury_correct AND NOT initial_split AND json_array_length(trace, '$.initial_votes') > 0) AS unanimous,
+    SUM(NOT jury_correct AND json_extract(trace, '$.foreperson.confidence') > 0.8) AS foreperson_high_conf,
+    SUM(NOT jury_correct AND COALESCE(json_extract(trace, '$.foreperson.dissent_note'), '') != '') AS dissent
+FROM traces
+WHERE run_id = ?
+"""
 
-def run_analysis() -> None:
-    traces = load_traces()
-    if not traces:
-        return
+# One row per pair judged in both runs (first trace of each pair per run)
+_COMPARE = """
+WITH a AS (SELECT * FROM traces WHERE id IN (SELECT MIN(id) FROM traces WHERE run_id = ? GROUP BY pair_id)),
+     b AS (SELECT * FROM traces WHERE id IN (SELECT MIN(id) FROM traces WHERE run_id = ? GROUP BY pair_id))
+SELECT a.pair_id, a.expected,
+       a.jury_verdict AS verdict_a, b.jury_verdict AS verdict_b,
+       a.jury_correct AS correct_a, b.jury_correct AS correct_b,
+       a.debate_ran AS debate_a, b.debate_ran AS debate_b
+FROM a JOIN b ON a.pair_id = b.pair_id
+ORDER BY a.pair_id
+"""
+
+_RUN_STATS = """
+SELECT r.run_id, r.config_fingerprint, COUNT(t.id) AS pairs,
+       AVG(t.jury_correct) AS jury_acc, AVG(t.baseline_correct) AS baseline_acc,
+       AVG(t.debate_ran) AS debate_rate, AVG(t.debate_rounds) AS avg_rounds,
+       AVG(t.jury_time_s) AS avg_time, SUM(t.jury_tokens) AS tokens, SUM(t.jury_cost_usd) AS cost
+FROM runs r LEFT JOIN traces t ON t.run_id = r.run_id
+WHERE r.run_id = ?
+GROUP BY r.run_id
+"""
+
+
+def resolve_fact(trace: dict, evidence: dict) -> dict | None:
+    """The fact an evidence entry points at: resolved in the trace, else by fact_index into its fact frame."""
+    if evidence.get("fact"):
+        return evidence["fact"]
+    facts = (trace.get("fact_frame") or {}).get("facts") or []
+    i = evidence.get("fact_index")
+    return facts[i] if isinstance(i, int) and 0 <= i < len(facts) else None
+
+
+def _print_evidence(t: dict, votes: list[dict], agents: list[str]) -> None:
+    """Evidence behind the given agents' votes, facts resolved."""
+    for v in votes:
+        if v["agent"] not in agents:
+            continue
+        for ev in v.get("evidence") or []:
+            fact = resolve_fact(t, ev) or {}
+            index = f"[{ev['fact_index']}] " if ev.get("fact_index") is not None else ""
+            print(
+                f"      {v['agent']}: {index}{fact.get('category', '?')}: claim {fact.get('claim_says')!r}"
+                f" vs truth {fact.get('truth_says')!r} - {ev.get('issue', '')}"
+            )
 
-    failures = [t for t in traces if not t.get("jury_correct", True)]
+
+def _print_failure(t: dict) -> None:
+    """Votes, debate, foreperson and reasoning of one pair the jury got wrong."""
+    pid = t["pair_id"]
+    expected = t["expected"]
+    got = t["jury_verdict"]
+    print(f"--- Pair {pid}: expected {expected}, got {got} ---")
+    print(f"  Claim: {t.get('claim', '')[:120]}...")
+    
+    # Initial votes with confidence
+    if "initial_votes" in t and t["initial_votes"]:
+        if isinstance(t["initial_votes"][0], dict):
+            votes_str = ", ".join(
+                f"{v['agent']}={v['verdict']}({v.get('confidence', 0):.2f})"
+                for v in t["initial_votes"]
+            )
+            print(f"  Initial votes: {votes_str}")
+            
+            # Show which agents were wrong initially
+            wrong_agents = [
+                v["agent"] for v in t["initial_votes"]
+                if v.get("verdict", "").lower() != expected.lower()
+            ]
+            if wrong_agents:
+                print(f"    Wrong agents: {', '.join(wrong_agents)}")
+                _print_evidence(t, t["initial_votes"], wrong_agents)
+        else:
+            votes = ", ".join(f"{n}={v}" for n, v in t["initial_votes"])
+            print(f"  Initial votes: {votes}")
+    
+    # Revote votes with confidence
+    if "revote_votes" in t and t["revote_votes"]:
+        if isinstance(t["revote_votes"][0], dict):
+            votes_str = ", ".join(
+                f"{v['agent']}={v['verdict']}({v.get('confidence', 0):.2f})"
+                for v in t["revote_votes"]
+            )
+            print(f"  Revote votes:  {votes_str}")
+            
+            # Check if debate changed any votes
+            if isinstance(t.get("initial_votes", []), list) and t["initial_votes"]:
+                if isinstance(t["initial_votes"][0], dict):
+                    initial_dict = {v["agent"]: v["verdict"] for v in t["initial_votes"]}
+                    revote_dict = {v["agent"]: v["verdict"] for v in t["revote_votes"]}
+                    changed = [
+                        agent for agent in initial_dict
+                        if initial_dict[agent] != revote_dict.get(agent)
+                    ]
+                    if changed:
+                        print(f"    Votes changed after debate: {', '.join(changed)}")
+        else:
+            votes = ", ".join(f"{n}={v}" for n, v in t["revote_votes"])
+            print(f"  Revote votes:  {votes}")
+    
+    # Debate analysis
+    if "debate_ran" in t:
+        print(f"  Debate ran: {t['debate_ran']}")
+        if t.get("debate_transcript"):
+            print(f"    Rounds: {t.get('debate_round_idx', 0)}")
+            print(f"    Status: {t.get('debate_status', 'N/A')}")
+            # Show debate length
+            transcript = t.get("debate_transcript", [])
+            if transcript:
+                print(f"    Transcript length: {len(transcript)} messages")
+    
+    # Foreperson output
+    fp = t.get("foreperson")
+    if fp:
+        print(f"  Foreperson: verdict={fp.get('verdict')}, confidence={fp.get('confidence', 0):.2f}")
+        if fp.get("dissent_note"):
+            print(f"    Dissent note: {fp['dissent_note'][:150]}...")
+        if fp.get("minimal_edit"):
+            print(f"    Minimal edit: {fp['minimal_edit'][:150]}...")
+        # Axis results with notes
+        axis_results = fp.get("axis_results") or []
+        failed_axes = [ar for ar in axis_results if not ar.get("passed")]
+        if failed_axes:
+            print(f"  Failed rubric axes:")
+            for ar in failed_axes:
+                note = f" — {ar['note']}" if ar.get("note") else ""
+                print(f"    {ar['axis']}{note}")
+        passed_all = all(ar.get("passed") for ar in axis_results) if axis_results else False
+        if passed_all and got != expected:
+            print(f"  All axes passed (but verdict was wrong!)")
+    elif "jury_axis_results" in t and t["jury_axis_results"]:
+        # Fallback to legacy format
+        failed_axes = [ar["axis"] for ar in t["jury_axis_results"] if not ar.get("passed")]
+        passed_axes = [ar["axis"] for ar in t["jury_axis_results"] if ar.get("passed")]
+        if failed_axes:
+            print(f"  Failed rubric axes: {', '.join(failed_axes)}")
+        if passed_axes and not failed_axes:
+            print(f"  All axes passed (but verdict was wrong!)")
+    
+    # Show reasoning from wrong agents
+    if "initial_votes" in t and isinstance(t["initial_votes"], list) and t["initial_votes"]:
+        if isinstance(t["initial_votes"][0], dict):
+            wrong_reasoning = [
+                (v["agent"], v.get("reasoning", ""))
+                for v in t["initial_votes"]
+                if v.get("verdict", "").lower() != expected.lower()
+            ]
+            if wrong_reasoning:
+                print(f"  Wrong agents' reasoning:")
+                for agent, reasoning in wrong_reasoning[:2]:  # Show first 2
+                    print(f"    {agent}: {reasoning[:200]}...")
+    
+    # Foreperson summary (from foreperson or legacy jury_summary)
+    summary = (fp.get("summary") if fp else None) or t.get("jury_summary")
+    if summary:
+        print(f"  Foreperson summary: {summary[:200]}...")
+    print()
+
+
+def run_analysis(store: TraceStore, run_id: str) -> None:
+    counts = store.query(_FAILURE_COUNTS, (run_id,)).fetchone()
+    if not counts["total"]:
+        print(f"Run {run_id} has no traces.")
+        return
+    failures = counts["failures"] or 0
     if not failures:
-        print("No jury failures. All pairs correct.")
+        print(f"No jury failures in run {run_id}. All pairs correct.")
         return
 
     print("=" * 70)
     print("ERROR ANALYSIS: Jury failures (expected vs predicted)")
     print("=" * 70)
-    print(f"Total pairs: {len(traces)}  |  Failures: {len(failures)}")
+    print(f"Run: {run_id}  |  Total pairs: {counts['total']}  |  Failures: {failures}")
     print()
 
-    for t in failures:
-        pid = t["pair_id"]
-        expected = t["expected"]
-        got = t["jury_verdict"]
-        print(f"--- Pair {pid}: expected {expected}, got {got} ---")
-        print(f"  Claim: {t.get('claim', '')[:120]}...")
-        
-        # Initial votes with confidence
-        if "initial_votes" in t and t["initial_votes"]:
-            if isinstance(t["initial_votes"][0], dict):
-                votes_str = ", ".join(
-                    f"{v['agent']}={v['verdict']}({v.get('confidence', 0):.2f})"
-                    for v in t["initial_votes"]
-                )
-                print(f"  Initial votes: {votes_str}")
-                
-                # Show which agents were wrong initially
-                wrong_agents = [
-                    v["agent"] for v in t["initial_votes"]
-                    if v.get("verdict", "").lower() != expected.lower()
-                ]
-                if wrong_agents:
-                    print(f"    Wrong agents: {', '.join(wrong_agents)}")
-            else:
-                votes = ", ".join(f"{n}={v}" for n, v in t["initial_votes"])
-                print(f"  Initial votes: {votes}")
-        
-        # Revote votes with confidence
-        if "revote_votes" in t and t["revote_votes"]:
-            if isinstance(t["revote_votes"][0], dict):
-                votes_str = ", ".join(
-                    f"{v['agent']}={v['verdict']}({v.get('confidence', 0):.2f})"
-                    for v in t["revote_votes"]
-                )
-                print(f"  Revote votes:  {votes_str}")
-                
-                # Check if debate changed any votes
-                if isinstance(t.get("initial_votes", []), list) and t["initial_votes"]:
-                    if isinstance(t["initial_votes"][0], dict):
-                        initial_dict = {v["agent"]: v["verdict"] for v in t["initial_votes"]}
-                        revote_dict = {v["agent"]: v["verdict"] for v in t["revote_votes"]}
-                        changed = [
-                            agent for agent in initial_dict
-                            if initial_dict[agent] != revote_dict.get(agent)
-                        ]
-                        if changed:
-                            print(f"    Votes changed after debate: {', '.join(changed)}")
-            else:
-                votes = ", ".join(f"{n}={v}" for n, v in t["revote_votes"])
-                print(f"  Revote votes:  {votes}")
-        
-        # Debate analysis
-        if "debate_ran" in t:
-            print(f"  Debate ran: {t['debate_ran']}")
-            if t.get("debate_transcript"):
-                print(f"    Rounds: {t.get('debate_round_idx', 0)}")
-                print(f"    Status: {t.get('debate_status', 'N/A')}")
-                # Show debate length
-                transcript = t.get("debate_transcript", [])
-                if transcript:
-                    print(f"    Transcript length: {len(transcript)} messages")
-        
-        # Foreperson output
-        fp = t.get("foreperson")
-        if fp:
-            print(f"  Foreperson: verdict={fp.get('verdict')}, confidence={fp.get('confidence', 0):.2f}")
-            if fp.get("dissent_note"):
-                print(f"    Dissent note: {fp['dissent_note'][:150]}...")
-            if fp.get("minimal_edit"):
-                print(f"    Minimal edit: {fp['minimal_edit'][:150]}...")
-            # Axis results with notes
-            axis_results = fp.get("axis_results") or []
-            failed_axes = [ar for ar in axis_results if not ar.get("passed")]
-            if failed_axes:
-                print(f"  Failed rubric axes:")
-                for ar in failed_axes:
-                    note = f" — {ar['note']}" if ar.get("note") else ""
-                    print(f"    {ar['axis']}{note}")
-            passed_all = all(ar.get("passed") for ar in axis_results) if axis_results else False
-            if passed_all and got != expected:
-                print(f"  All axes passed (but verdict was wrong!)")
-        elif "jury_axis_results" in t and t["jury_axis_results"]:
-            # Fallback to legacy format
-            failed_axes = [ar["axis"] for ar in t["jury_axis_results"] if not ar.get("passed")]
-            passed_axes = [ar["axis"] for ar in t["jury_axis_results"] if ar.get("passed")]
-            if failed_axes:
-                print(f"  Failed rubric axes: {', '.join(failed_axes)}")
-            if passed_axes and not failed_axes:
-                print(f"  All axes passed (but verdict was wrong!)")
-        
-        # Show reasoning from wrong agents
-        if "initial_votes" in t and isinstance(t["initial_votes"], list) and t["initial_votes"]:
-            if isinstance(t["initial_votes"][0], dict):
-                wrong_reasoning = [
-                    (v["agent"], v.get("reasoning", ""))
-                    for v in t["initial_votes"]
-                    if v.get("verdict", "").lower() != expected.lower()
-                ]
-                if wrong_reasoning:
-                    print(f"  Wrong agents' reasoning:")
-                    for agent, reasoning in wrong_reasoning[:2]:  # Show first 2
-                        print(f"    {agent}: {reasoning[:200]}...")
-        
-        # Foreperson summary (from foreperson or legacy jury_summary)
-        summary = (fp.get("summary") if fp else None) or t.get("jury_summary")
-        if summary:
-            print(f"  Foreperson summary: {summary[:200]}...")
-        print()
+    for t in store.traces(run_id, failures=True):
+        _print_failure(t)
 
     # Component-level hints (from M4: count errors by component)
     print("=" * 70)
     print("COMPONENT HINTS (where to focus)")
     print("=" * 70)
-    unanim_initial = sum(1 for t in failures if _all_same(t.get("initial_votes", [])) and t.get("initial_votes"))
-    split_initial = len(failures) - unanim_initial
-    if failures:
-        print(f"  Failures with unanimous initial vote: {unanim_initial} (parser/agents may have missed signal)")
-        print(f"  Failures with split initial vote:     {split_initial} (debate/revote/foreperson may be at fault)")
-    
+    unanim_initial = counts["unanimous"] or 0
+    print(f"  Failures with unanimous initial vote: {unanim_initial} (parser/agents may have missed signal)")
+    print(f"  Failures with split initial vote:     {failures - unanim_initial} (debate/revote/foreperson may be at fault)")
+
     # Analyze confidence patterns
-    low_confidence_count = 0
-    high_confidence_wrong = 0
-    for t in failures:
-        if isinstance(t.get("initial_votes"), list) and t["initial_votes"]:
-            if isinstance(t["initial_votes"][0], dict):
-                wrong_votes = [
-                    v for v in t["initial_votes"]
-                    if v.get("verdict", "").lower() != t.get("expected", "").lower()
-                ]
-                if wrong_votes:
-                    avg_conf = sum(v.get("confidence", 0) for v in wrong_votes) / len(wrong_votes)
-                    if avg_conf < 0.7:
-                        low_confidence_count += 1
-                    elif avg_conf > 0.8:
-                        high_confidence_wrong += 1
-    
-    if low_confidence_count > 0:
-        print(f"  Failures with low confidence wrong votes: {low_confidence_count} (agents uncertain)")
-    if high_confidence_wrong > 0:
-        print(f"  Failures with high confidence wrong votes: {high_confidence_wrong} (agents overconfident)")
-    
+    confidence = store.query(_WRONG_VOTE_CONFIDENCE, (run_id,)).fetchone()
+    if confidence["low"]:
+        print(f"  Failures with low confidence wrong votes: {confidence['low']} (agents uncertain)")
+    if confidence["high"]:
+        print(f"  Failures with high confidence wrong votes: {confidence['high']} (agents overconfident)")
+
     # Debate impact analysis
-    debate_helped = 0
-    debate_hurt = 0
-    for t in failures:
-        if isinstance(t.get("initial_votes"), list) and isinstance(t.get("revote_votes"), list):
-            if t["initial_votes"] and t["revote_votes"]:
-                if isinstance(t["initial_votes"][0], dict) and isinstance(t["revote_votes"][0], dict):
-                    initial_correct = sum(
-                        1 for v in t["initial_votes"]
-                        if v.get("verdict", "").lower() == t.get("expected", "").lower()
-                    )
-                    revote_correct = sum(
-                        1 for v in t["revote_votes"]
-                        if v.get("verdict", "").lower() == t.get("expected", "").lower()
-                    )
-                    if revote_correct > initial_correct:
-                        debate_helped += 1
-                    elif revote_correct < initial_correct:
-                        debate_hurt += 1
-    
-    if debate_helped > 0 or debate_hurt > 0:
-        print(f"  Debate helped (more correct votes): {debate_helped}")
-        print(f"  Debate hurt (fewer correct votes): {debate_hurt}")
-    
-    # Failed axes frequency (prefer foreperson.axis_results, fallback to jury_axis_results)
-    failed_axes_count = {}
-    for t in failures:
-        axis_results = (
-            t.get("foreperson", {}).get("axis_results")
-            or t.get("jury_axis_results", [])
-        )
-        for ar in axis_results:
-            if not ar.get("passed"):
-                axis = ar.get("axis", "unknown")
-                failed_axes_count[axis] = failed_axes_count.get(axis, 0) + 1
-    
-    if failed_axes_count:
+    debate = store.query(_DEBATE_IMPACT, (run_id,)).fetchone()
+    if debate["helped"] or debate["hurt"]:
+        print(f"  Debate helped (more correct votes): {debate['helped']}")
+        print(f"  Debate hurt (fewer correct votes): {debate['hurt']}")
+
+    # Failed axes frequency
+    failed_axes = store.query(_FAILED_AXES, (run_id,)).fetchall()
+    if failed_axes:
         print(f"\n  Most failed rubric axes:")
-        for axis, count in sorted(failed_axes_count.items(), key=lambda x: -x[1]):
-            print(f"    {axis}: {count} failures")
-    
+        for row in failed_axes:
+            print(f"    {row['axis']}: {row['failures']} failures")
+
     # Foreperson analysis: high confidence wrong verdicts, dissent cases
-    foreperson_high_conf_wrong = sum(
-        1 for t in failures
-        if t.get("foreperson", {}).get("confidence", 0) > 0.8
-    )
-    foreperson_dissent = sum(
-        1 for t in failures
-        if t.get("foreperson", {}).get("dissent_note")
-    )
-    if foreperson_high_conf_wrong > 0:
-        print(f"\n  Foreperson high confidence wrong: {foreperson_high_conf_wrong} (rubric may need tuning)")
-    if foreperson_dissent > 0:
-        print(f"  Failures with jury dissent: {foreperson_dissent} (foreperson overrode minority?)")
-    
+    if counts["foreperson_high_conf"]:
+        print(f"\n  Foreperson high confidence wrong: {counts['foreperson_high_conf']} (rubric may need tuning)")
+    if counts["dissent"]:
+        print(f"  Failures with jury dissent: {counts['dissent']} (foreperson overrode minority?)")
+
     print()
-    print("  Next steps: Inspect traces in eval/traces/, improve prompts or rubric for weak axes.")
+    print(f"  Next steps: Inspect traces (--run {run_id}), improve prompts or rubric for weak axes.")
 
 
-def _all_same(votes: list) -> bool:
-    """Check if all votes are the same. Handles both tuple and dict formats."""
-    if not votes or len(votes) < 2:
-        return True
-    
-    # Handle new dict format
-    if isinstance(votes[0], dict):
-        v0 = (votes[0].get("verdict") or "").strip().lower()
-        return all((v.get("verdict") or "").strip().lower() == v0 for v in votes)
-    
-    # Handle old tuple format
-    v0 = (votes[0][1] or "").strip().lower()
-    return all((v or "").strip().lower() == v0 for _, v in votes)
+def compare_runs(store: TraceStore, run_a: str, run_b: str) -> None:
+    """Side-by-side metrics of two runs, then the pairs whose outcome changed from A to B."""
+    stats = [store.query(_RUN_STATS, (run,)).fetchone() for run in (run_a, run_b)]
+    print("=" * 70)
+    print(f"COMPARE: A = {run_a}  vs  B = {run_b}")
+    print("=" * 70)
+    if stats[0]["config_fingerprint"] != stats[1]["config_fingerprint"]:
+        print(f"  Config changed: {stats[0]['config_fingerprint']} -> {stats[1]['config_fingerprint']}")
+    else:
+        print(f"  Same config: {stats[0]['config_fingerprint']}")
+
+    def fmt(value, spec: str) -> str:
+        return format(value, spec) if value is not None else "-"
+
+    print(f"\n  {'':18s} {'A':>12s} {'B':>12s}")
+    for label, key, spec in [
+        ("Pairs", "pairs", "d"),
+        ("Jury accuracy", "jury_acc", ".1%"),
+        ("Baseline accuracy", "baseline_acc", ".1%"),
+        ("Debate rate", "debate_rate", ".0%"),
+        ("Avg debate rounds", "avg_rounds", ".2f"),
+        ("Avg jury time s", "avg_time", ".1f"),
+        ("Jury tokens", "tokens", ","),
+        ("Jury cost $", "cost", ".4f"),
+    ]:
+        print(f"  {label:18s} {fmt(stats[0][key], spec):>12s} {fmt(stats[1][key], spec):>12s}")
+
+    rows = store.query(_COMPARE, (run_a, run_b)).fetchall()
+    fixed = [r for r in rows if r["correct_b"] and not r["correct_a"]]
+    regressed = [r for r in rows if r["correct_a"] and not r["correct_b"]]
+    debate_changed = [r for r in rows if bool(r["debate_a"]) != bool(r["debate_b"])]
+    print(f"\n  Pairs in both runs: {len(rows)}  |  Fixed: {len(fixed)}  |  Regressed: {len(regressed)}")
+    for title, group in [("Fixed (wrong in A, right in B)", fixed), ("Regressed (right in A, wrong in B)", regressed)]:
+        if group:
+            print(f"\n  {title}:")
+            for r in group:
+                print(f"    Pair {r['pair_id']}: expected {r['expected']}, A={r['verdict_a']} B={r['verdict_b']}")
+    if debate_changed:
+        print(f"\n  Debate ran in only one run: {', '.join(str(r['pair_id']) for r in debate_changed)}")
+    print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Error analysis over the eval trace store")
+    parser.add_argument("--store", default=str(DEFAULT_PATH), help="Trace store SQLite file (default: eval/traces.sqlite)")
+    parser.add_argument("--run", default=None, help="Run to analyse: ID, unique prefix, 'latest' (default) or 'previous'")
+    parser.add_argument("--compare", metavar="RUN", default=None, help="Compare RUN (A) against the analysed run (B)")
+    parser.add_argument("--runs", action="store_true", help="List runs and exit")
+    args = parser.parse_args()
+
+    with TraceStore(args.store) as store:
+        if args.runs:
+            print_runs(store)
+            return
+        run_id = store.resolve_run(args.run)
+        if run_id is None:
+            print("No traces found. Run: uv run python eval/run_eval.py")
+            return
+        if args.compare:
+            other = store.resolve_run(args.compare)
+            if other is None:
+                print(f"No run {args.compare!r} (see --runs)")
+                return
+            compare_runs(store, other, run_id)
+            return
+        run_analysis(store, run_id)
 
 
 if __name__ == "__main__":
-    run_analysis()
+    main()
@@ -0,0 +1,73 @@
+"""
+Render jury sessions from eval traces to audio files (no playback): one episode per pair,
+and optionally the whole dataset as a single episode.
+
+Uses the elevenlabs section of config.yaml (voices, model, output format, audio cache);
+synthesized audio is cached, so re-rendering only synthesizes lines that changed.
+
+Usage (from project root):
+  uv run python eval/run_eval.py                      # appends a run to eval/traces.sqlite
+  uv run python eval/render_episodes.py               # latest run -> eval/episodes/pair_<id>.mp3
+  uv run python eval/render_episodes.py --pairs 0,5 --dataset --workers 8
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from dotenv import load_dotenv
+
+load_dotenv(PROJECT_ROOT / ".env")
+
+from audio.cache import get_cache
+from audio.render import render_episodes
+from audio.script import episode
+from config import load_config
+from trace_store import DEFAULT_PATH, TraceStore
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Render eval traces to audio episodes")
+    ap.add_argument("--store", default=str(DEFAULT_PATH), help="Trace store SQLite file (default: eval/traces.sqlite)")
+    ap.add_argument("--run", default=None, help="Run to render: ID, unique prefix, 'latest' (default) or 'previous'")
+    ap.add_argument("--out", default=str(PROJECT_ROOT / "eval" / "episodes"), help="Output directory")
+    ap.add_argument("--pairs", default=None, help="Comma-separated pair IDs (default: every pair in the run)")
+    ap.add_argument("--dataset", action="store_true", help="Also write all pairs as one episode (dataset.<ext>)")
+    ap.add_argument("--workers", type=int, default=None, help="Concurrent synthesis requests (default: elevenlabs.synthesis_workers)")
+    ap.add_argument("--backend", default=None, help="Override elevenlabs.backend (e.g. fake)")
+    args = ap.parse_args()
+
+    config = load_config()
+    if args.backend:
+        config.setdefault("elevenlabs", {})["backend"] = args.backend
+
+    pair_ids = [int(x) for x in args.pairs.split(",")] if args.pairs else None
+    with TraceStore(args.store) as store:
+        run_id = store.resolve_run(args.run)
+        traces = list(store.traces(run_id, pair_ids=pair_ids)) if run_id else []
+    if not traces:
+        print("No traces found. Run: uv run python eval/run_eval.py")
+        return
+
+    episodes = {f"pair_{t['pair_id']}": episode(t) for t in traces}
+    if args.dataset:
+        episodes["dataset"] = [
+            line for t in traces for line in [("narrator", f"Pair {t['pair_id']}.")] + episodes[f"pair_{t['pair_id']}"]
+        ]
+
+    t0 = time.perf_counter()
+    paths = render_episodes(episodes, config, args.out, workers=args.workers)
+    elapsed = time.perf_counter() - t0
+    for name, path in paths.items():
+        print(f"  {name}: {path.relative_to(PROJECT_ROOT) if path.is_relative_to(PROJECT_ROOT) else path} ({path.stat().st_size:,} bytes)")
+    cache = get_cache(config)
+    cached = f", audio cache {cache.hits} hits / {cache.misses} misses" if cache else ""
+    print(f"Rendered {len(paths)} episodes in {elapsed:.1f}s{cached}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,27 +5,35 @@ Usage (from project root):
   uv run python eval/run_eval.py
 
 Uses ground truth from eval/ground_truth.json (derived from DATASET_ANALYSIS.md).
-Saves traces to eval/traces/ for error analysis.
-Tracks token usage and costs via LangChain's get_openai_callback (built-in pricing).
+Appends each run (config fingerprint, summary, per-pair traces) to the trace store,
+eval/traces.sqlite, for error analysis.
+Tracks token usage and costs via LangChain's get_openai_callback (built-in pricing);
+--no-cost skips it (and the langchain_community import).
 """
 
 import json
 import sys
 import time
+from contextlib import nullcontext
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Literal
 
 # Add src to path so we can import from config, workflow, etc.
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
 from dotenv import load_dotenv
+from pydantic import BaseModel
 
 load_dotenv(PROJECT_ROOT / ".env")
 
-from langchain_community.callbacks import get_openai_callback
-
-from config import load_config
-from workflow import run_pipeline
+import perf
+from agents.llm import llm_calls
+from coalesce import pair_key
+from config import config_fingerprint, load_config
+from trace_store import DEFAULT_PATH, TraceStore
+from workflow import run_pipeline, make_run_budget
 
 
 # --- Ground truth ---
@@ -40,12 +48,15 @@ def load_ground_truth() -> dict[int, str]:
 
 # --- Baseline: single stronger model ---
 
+_BASELINE_TASK = "You are a fact-checker. Given an internal fact (truth) and an external claim, decide if the claim is a FAITHFUL representation of the truth or a MUTATION (distortion, exaggeration, omission, etc.)."
+
+
 def run_baseline(claim: str, truth: str, model: str = "gpt-4o") -> str:
     """Single LLM call: claim + truth -> Faithful or Mutated."""
     from langchain_openai import ChatOpenAI
 
     llm = ChatOpenAI(model=model, temperature=0)
-    prompt = f"""You are a fact-checker. Given an internal fact (truth) and an external claim, decide if the claim is a FAITHFUL representation of the truth or a MUTATION (distortion, exaggeration, omission, etc.).
+    prompt = f"""{_BASELINE_TASK}
 
 TRUTH: {truth}
 
@@ -57,8 +68,105 @@ Answer with exactly one word: Faithful or Mutated."""
     return "Mutated" if "MUTAT" in text else "Faithful"
 
 
+def run_baseline_single(pid, claim: str, truth: str, model: str, track_cost: bool = True) -> dict:
+    """Baseline for one pair in its own call: {"verdict", "time_s", "cost_usd", "total_tokens", "packed"}."""
+    t0 = time.perf_counter()
+    result = {"verdict": "?", "cost_usd": 0.0, "total_tokens": 0, "packed": False}
+    try:
+        with cost_tracker(track_cost) as cb:
+            result["verdict"] = run_baseline(claim, truth, model)
+        result["cost_usd"] = cb.total_cost
+        result["total_tokens"] = cb.total_tokens
+    except Exception as e:
+        print(f"  [BASELINE ERROR] Pair {pid}: {e}")
+    result["time_s"] = time.perf_counter() - t0
+    return result
+
+
+class PackedVerdict(BaseModel):
+    """One pair's answer in a packed baseline call."""
+
+    id: int
+    verdict: Literal["Faithful", "Mutated"]
+
+
+class PackedVerdicts(BaseModel):
+    """Answer to a packed baseline call: one verdict per pair ID."""
+
+    verdicts: list[PackedVerdict]
+
+
+def run_baseline_pack(pairs: list[dict], model: str = "gpt-4o") -> dict[int, str]:
+    """
+    One LLM call for several pairs, each tagged with its ID: {pair id: Faithful|Mutated}.
+    IDs the answer leaves out (or that were not asked) are missing from the result.
+    """
+    from langchain_openai import ChatOpenAI
+
+    llm = ChatOpenAI(model=model, temperature=0).with_structured_output(PackedVerdicts)
+    blocks = "\n\n".join(f"[ID {p['id']}]\nTRUTH: {p['truth']}\nCLAIM: {p['claim']}" for p in pairs)
+    prompt = f"""{_BASELINE_TASK}
+
+Judge each of the {len(pairs)} pairs below on its own.
+
+{blocks}
+
+Return one verdict per ID, Faithful or Mutated."""
+    asked = {p["id"] for p in pairs}
+    out: dict[int, str] = {}
+    for v in llm.invoke(prompt).verdicts:
+        if v.id in asked:
+            out.setdefault(v.id, v.verdict)
+    return out
+
+
+def run_baseline_packed(pairs: list[dict], model: str, pack: int, track_cost: bool = True) -> dict[int, dict]:
+    """
+    Baseline for all `pairs`, `pack` pairs per request. A pair missing from its pack's answer
+    (or whose pack failed) falls back to a single call. Each pair is charged an equal share of
+    its pack's time, cost and tokens, plus its own fallback call.
+    Returns {pair id: {"verdict", "time_s", "cost_usd", "total_tokens", "packed"}}.
+    """
+    results: dict[int, dict] = {}
+    for start in range(0, len(pairs), pack):
+        chunk = pairs[start:start + pack]
+        t0 = time.perf_counter()
+        cb = SimpleNamespace(total_cost=0.0, total_tokens=0)  # what a failed pack is charged
+        try:
+            with cost_tracker(track_cost) as cb:
+                verdicts = run_baseline_pack(chunk, model)
+        except Exception as e:
+            print(f"  [BASELINE ERROR] Pack {[p['id'] for p in chunk]}: {e}")
+            verdicts = {}
+        elapsed = time.perf_counter() - t0
+        for p in chunk:
+            r = {
+                "verdict": verdicts.get(p["id"], "?"),
+                "time_s": elapsed / len(chunk),
+                "cost_usd": cb.total_cost / len(chunk),
+                "total_tokens": cb.total_tokens // len(chunk),
+                "packed": p["id"] in verdicts,
+            }
+            if not r["packed"]:
+                single = run_baseline_single(p["id"], p["claim"], p["truth"], model, track_cost)
+                r["verdict"] = single["verdict"]
+                for k in ("time_s", "cost_usd", "total_tokens"):
+                    r[k] += single[k]
+            results[p["id"]] = r
+    return results
+
+
 # --- Eval ---
 
+def cost_tracker(enabled: bool = True):
+    """get_openai_callback() when cost tracking is on, else a no-op reporting zero cost and tokens."""
+    if not enabled:
+        return nullcontext(SimpleNamespace(total_cost=0.0, total_tokens=0))
+    from langchain_community.callbacks import get_openai_callback
+
+    return get_openai_callback()
+
+
 def normalize_verdict(v: str) -> str:
     """Normalize verdict to Faithful or Mutated."""
     v = (v or "").strip().lower()
@@ -67,9 +175,96 @@ def normalize_verdict(v: str) -> str:
     return "Faithful"
 
 
-def run_eval(pair_ids: list[int] | None = None, baseline_model: str = "gpt-4o") -> None:
+def _vote_trace(name: str, output, facts: list) -> dict:
+    """
+    One agent's vote, with each evidence fact index resolved against the fact frame (None if
+    out of range). A self-consistency vote (agents[].samples) also lists every sample.
+    """
+    vote = {
+        "agent": name,
+        "verdict": output.verdict,
+        "confidence": output.confidence,
+        "reasoning": output.reasoning,
+        "evidence": [
+            {
+                "fact_index": ev.fact_index,
+                "fact": facts[ev.fact_index].model_dump() if 0 <= ev.fact_index < len(facts) else None,
+                "issue": ev.issue,
+            }
+            for ev in getattr(output, "evidence", [])
+        ],
+    }
+    if getattr(output, "samples", None):
+        vote["agreement"] = output.agreement
+        vote["samples"] = [
+            {"verdict": s.verdict, "confidence": s.confidence, "reasoning": s.reasoning} for s in output.samples
+        ]
+    return vote
+
+
+def jury_trace(state: dict) -> dict:
+    """Trace fields from a final pipeline state: foreperson, votes, debate and fact frame."""
+    trace = {}
+    v = state.get("verdict")
+    # Foreperson output (full Verdict)
+    if v:
+        trace["foreperson"] = {
+            "verdict": v.verdict,
+            "confidence": v.confidence,
+            "summary": v.summary,
+            "minimal_edit": v.minimal_edit,
+            "dissent_note": v.dissent_note,
+            "axis_results": [
+                {"axis": ar.axis, "passed": ar.passed, "note": ar.note}
+                for ar in (v.axis_results or [])
+            ],
+        }
+    else:
+        trace["foreperson"] = None
+    # Keep backward-compat keys
+    trace["jury_summary"] = v.summary if v else None
+    trace["jury_axis_results"] = [{"axis": ar.axis, "passed": ar.passed} for ar in (v.axis_results or [])] if v else []
+
+    # Initial votes and revote: full outputs with reasoning, confidence, evidence
+    facts = state["fact_frame"].facts if state.get("fact_frame") else []
+    trace["initial_votes"] = [_vote_trace(name, output, facts) for name, output in (state.get("initial_vote_outputs") or {}).items()]
+    trace["revote_votes"] = [_vote_trace(name, output, facts) for name, output in (state.get("revote_outputs") or {}).items()]
+
+    # Debate: full transcript and status
+    trace["debate_ran"] = bool(state.get("transcript"))
+    trace["debate_transcript"] = state.get("transcript") or []
+    trace["debate_status"] = state.get("debate_status")
+    trace["debate_round_idx"] = state.get("debate_round_idx", 0)
+    trace["skipped_debate"] = state.get("skipped_debate", False)
+    trace["degradations"] = state.get("degradations") or []
+
+    # Passages of a long truth the prompts saw instead of the whole truth (retrieval.prune_truth)
+    if state.get("truth_spans"):
+        truth = state["truth"]
+        trace["truth_chars"] = len(truth)
+        trace["truth_context_chars"] = len(state["truth_context"])
+        trace["truth_spans"] = [s | {"text": truth[s["start"]:s["end"]]} for s in state["truth_spans"]]
+
+    # Fact frame (parser output)
+    fact_frame = state.get("fact_frame")
+    if fact_frame:
+        trace["fact_frame"] = fact_frame.model_dump()
+    return trace
+
+
+def run_eval(
+    pair_ids: list[int] | None = None,
+    baseline_model: str = "gpt-4o",
+    track_cost: bool = True,
+    store_path: str | Path = DEFAULT_PATH,
+    baseline_pack: int = 1,
+    compare_unpacked: bool = False,
+) -> str:
     """
-    Run eval: jury system + baseline on pairs, compute metrics, save traces.
+    Run eval: jury system + baseline on pairs, compute metrics, append the run to the trace store.
+    With `baseline_pack` > 1 the baseline judges that many pairs per request, before the jury
+    runs; `compare_unpacked` also runs it one pair per call and reports both accuracies.
+    Returns the run ID.
     """
     config = load_config()
     config["interactive"] = False
@@ -86,19 +281,33 @@ def run_eval(pair_ids: list[int] | None = None, baseline_model: str = "gpt-4o")
     pairs = load_pairs(config)
     ground_truth = load_ground_truth()
 
-    traces_dir = PROJECT_ROOT / "eval" / "traces"
-    traces_dir.mkdir(parents=True, exist_ok=True)
+    store = TraceStore(store_path)
+    run_id = store.begin_run(config_fingerprint(config), baseline_model, [p["id"] for p in pairs])
 
     jury_results = []
     baseline_results = []
+    run_budget = make_run_budget(config)
+    judged: dict[str, tuple[int, dict]] = {}  # pair_key -> (first pair id, final state)
 
     print("=" * 60)
     print("EVAL: Jury System vs Single-Model Baseline")
     print("=" * 60)
     print(f"Pairs: {[p['id'] for p in pairs]}")
-    print(f"Baseline model: {baseline_model}")
+    print(f"Baseline model: {baseline_model}" + (f" ({baseline_pack} pairs per request)" if baseline_pack > 1 else ""))
+    print(f"Run: {run_id}")
     print()
 
+    packed = None
+    unpacked_results = []
+    compare_unpacked = compare_unpacked and baseline_pack > 1
+    if baseline_pack > 1:
+        t0 = time.perf_counter()
+        packed = run_baseline_packed([p for p in pairs if p["id"] in ground_truth], baseline_model, baseline_pack, track_cost)
+        fallbacks = sum(1 for r in packed.values() if not r["packed"])
+        print(f"  Baseline: {len(packed)} pairs in {-(-len(packed) // baseline_pack)} packed requests,"
+              f" {fallbacks} single-call fallbacks ({time.perf_counter() - t0:.1f}s)")
+        print()
+
     for pair in pairs:
         pid = pair["id"]
         claim = pair["claim"]
@@ -109,17 +318,23 @@ def run_eval(pair_ids: list[int] | None = None, baseline_model: str = "gpt-4o")
             print(f"  [SKIP] Pair {pid}: no ground truth")
             continue
 
-        # --- Jury system ---
+        # --- Jury system (a repeated pair reuses the first run's state, a near-duplicate a stored verdict) ---
         state = None
         t0 = time.perf_counter()
         jury_cost = 0.0
         jury_tokens = 0
+        key = pair_key(claim, truth, config)
+        reused_from = judged[key][0] if key in judged else None
         try:
-            with get_openai_callback() as cb:
-                state = run_pipeline(claim, truth, config)
+            if reused_from is not None:
+                state = judged[key][1]
+            else:
+                with cost_tracker(track_cost) as cb:
+                    state = run_pipeline(claim, truth, config, run_budget=run_budget, pair_id=pid)
+                jury_cost = cb.total_cost
+                jury_tokens = cb.total_tokens
+                judged[key] = (pid, state)
             jury_time = time.perf_counter() - t0
-            jury_cost = cb.total_cost
-            jury_tokens = cb.total_tokens
             verdict_obj = state.get("verdict")
             jury_verdict = normalize_verdict(verdict_obj.verdict) if verdict_obj else "?"
         except Exception as e:
@@ -136,22 +351,15 @@ def run_eval(pair_ids: list[int] | None = None, baseline_model: str = "gpt-4o")
             "time_s": jury_time,
             "cost_usd": jury_cost,
             "total_tokens": jury_tokens,
+            "reused": reused_from is not None or bool(state and state.get("reused_from")),
         })
 
-        # --- Baseline ---
-        t0 = time.perf_counter()
-        baseline_cost = 0.0
-        baseline_tokens = 0
-        try:
-            with get_openai_callback() as cb:
-                baseline_verdict = run_baseline(claim, truth, baseline_model)
-            baseline_time = time.perf_counter() - t0
-            baseline_cost = cb.total_cost
-            baseline_tokens = cb.total_tokens
-        except Exception as e:
-            baseline_time = time.perf_counter() - t0
-            baseline_verdict = "?"
-            print(f"  [BASELINE ERROR] Pair {pid}: {e}")
+        # --- Baseline (packed: already answered before the loop) ---
+        baseline = packed[pid] if packed is not None else run_baseline_single(pid, claim, truth, baseline_model, track_cost)
+        baseline_verdict = baseline["verdict"]
+        baseline_time = baseline["time_s"]
+        baseline_cost = baseline["cost_usd"]
+        baseline_tokens = baseline["total_tokens"]
 
         baseline_correct = baseline_verdict == expected if baseline_verdict != "?" else False
         baseline_results.append({
@@ -163,6 +371,9 @@ def run_eval(pair_ids: list[int] | None = None, baseline_model: str = "gpt-4o")
             "cost_usd": baseline_cost,
             "total_tokens": baseline_tokens,
         })
+        if compare_unpacked:
+            single = run_baseline_single(pid, claim, truth, baseline_model, track_cost)
+            unpacked_results.append(single | {"id": pid, "correct": single["verdict"] == expected})
 
         # Save trace for error analysis
         trace = {
@@ -175,85 +386,21 @@ def run_eval(pair_ids: list[int] | None = None, baseline_model: str = "gpt-4o")
             "jury_time_s": jury_time,
             "jury_cost_usd": jury_cost,
             "jury_tokens": jury_tokens,
+            "reused_from": reused_from,
+            "near_duplicate_of": state.get("reused_from") if state else None,
             "baseline_verdict": baseline_verdict,
             "baseline_correct": baseline_correct,
             "baseline_time_s": baseline_time,
             "baseline_cost_usd": baseline_cost,
             "baseline_tokens": baseline_tokens,
+            "baseline_packed": baseline["packed"],
         }
+        if compare_unpacked:
+            trace["baseline_unpacked_verdict"] = unpacked_results[-1]["verdict"]
         if state:
-            v = state.get("verdict")
-            # Foreperson output (full Verdict)
-            if v:
-                trace["foreperson"] = {
-                    "verdict": v.verdict,
-                    "confidence": v.confidence,
-                    "summary": v.summary,
-                    "minimal_edit": v.minimal_edit,
-                    "dissent_note": v.dissent_note,
-                    "axis_results": [
-                        {"axis": ar.axis, "passed": ar.passed, "note": ar.note}
-                        for ar in (v.axis_results or [])
-                    ],
-                }
-            else:
-                trace["foreperson"] = None
-            # Keep backward-compat keys
-            trace["jury_summary"] = v.summary if v else None
-            trace["jury_axis_results"] = [{"axis": ar.axis, "passed": ar.passed} for ar in (v.axis_results or [])] if v else []
-            
-            # Initial votes: full outputs with reasoning, confidence, evidence
-            initial_outputs = state.get("initial_vote_outputs") or []
-            trace["initial_votes"] = [
-                {
-                    "agent": name,
-                    "verdict": output.verdict,
-                    "confidence": output.confidence,
-                    "reasoning": output.reasoning,
-                    "evidence": [
-                        {
-                            "fact": ev.fact.model_dump(),
-                            "issue": ev.issue,
-                        }
-                        for ev in output.evidence
-                    ],
-                }
-                for name, output in initial_outputs
-            ]
-            
-            # Revote votes: full outputs with reasoning, confidence, evidence
-            revote_outputs = state.get("revote_outputs") or []
-            trace["revote_votes"] = [
-                {
-                    "agent": name,
-                    "verdict": output.verdict,
-                    "confidence": output.confidence,
-                    "reasoning": output.reasoning,
-                    "evidence": [
-                        {
-                            "fact": ev.fact.model_dump(),
-                            "issue": ev.issue,
-                        }
-                        for ev in output.evidence
-                    ],
-                }
-                for name, output in revote_outputs
-            ]
-            
-            # Debate: full transcript and status
-            trace["debate_ran"] = bool(state.get("transcript"))
-            trace["debate_transcript"] = state.get("transcript") or []
-            trace["debate_status"] = state.get("debate_status")
-            trace["debate_round_idx"] = state.get("debate_round_idx", 0)
-            trace["skipped_debate"] = state.get("skipped_debate", False)
-            
-            # Fact frame (parser output)
-            fact_frame = state.get("fact_frame")
-            if fact_frame:
-                trace["fact_frame"] = fact_frame.model_dump()
-
-        with open(traces_dir / f"pair_{pid}.json", "w", encoding="utf-8") as f:
-            json.dump(trace, f, indent=2)
+            trace.update(jury_trace(state))
+
+        store.append(run_id, trace)
 
         mark_j = "✓" if jury_correct else "✗"
         mark_b = "✓" if baseline_correct else "✗"
@@ -281,42 +428,64 @@ def run_eval(pair_ids: list[int] | None = None, baseline_model: str = "gpt-4o")
     print(f"  Cost/pair:   Jury ${jury_cost_per_pair:.4f}  |  Baseline ${baseline_cost_per_pair:.4f}")
     print(f"  Total cost:  Jury ${jury_total_cost:.4f}  |  Baseline ${baseline_total_cost:.4f}")
     print(f"  Total tokens: Jury {jury_total_tokens:,}  |  Baseline {baseline_total_tokens:,}")
-    print(f"  Traces:      eval/traces/")
+    if compare_unpacked:
+        unpacked_acc = sum(1 for r in unpacked_results if r["correct"]) / n if n else 0
+        unpacked_avg_time = sum(r["time_s"] for r in unpacked_results) / n if n else 0
+        agreement = sum(1 for b, u in zip(baseline_results, unpacked_results) if b["verdict"] == u["verdict"]) / n if n else 0
+        print(f"  Baseline:    packed {baseline_acc:.1%} ({baseline_avg_time:.2f}s/pair)"
+              f"  |  unpacked {unpacked_acc:.1%} ({unpacked_avg_time:.2f}s/pair)  |  agree {agreement:.1%}")
+    reused = sum(1 for r in jury_results if r["reused"])
+    print(f"  Dedup:       {reused}/{n} pairs reused  |  {llm_calls.shared}/{llm_calls.calls} LLM calls coalesced")
+    store_name = Path(store_path).resolve()
+    store_name = store_name.relative_to(PROJECT_ROOT) if store_name.is_relative_to(PROJECT_ROOT) else store_name
+    print(f"  Traces:      {store_name} (run {run_id})")
     print("  (Costs from LangChain built-in OpenAI pricing)")
     print()
 
-    # Save complete summary to traces directory
-    summary_path = traces_dir / "summary.json"
-    with open(summary_path, "w", encoding="utf-8") as f:
-        json.dump(
-            {
-                "num_pairs": n,
-                "accuracy": {
-                    "jury": jury_acc,
-                    "baseline": baseline_acc,
-                },
-                "avg_time_s": {
-                    "jury": jury_avg_time,
-                    "baseline": baseline_avg_time,
-                },
-                "cost_per_pair_usd": {
-                    "jury": jury_cost_per_pair,
-                    "baseline": baseline_cost_per_pair,
-                },
-                "total_cost_usd": {
-                    "jury": jury_total_cost,
-                    "baseline": baseline_total_cost,
-                },
-                "total_tokens": {
-                    "jury": jury_total_tokens,
-                    "baseline": baseline_total_tokens,
-                },
-                "note": "Costs from LangChain built-in OpenAI pricing",
+    store.finish_run(
+        run_id,
+        {
+            "num_pairs": n,
+            "accuracy": {
+                "jury": jury_acc,
+                "baseline": baseline_acc,
+            },
+            "avg_time_s": {
+                "jury": jury_avg_time,
+                "baseline": baseline_avg_time,
             },
-            f,
-            indent=2,
-        )
-    print(f"  Summary saved to: {summary_path}")
+            "cost_per_pair_usd": {
+                "jury": jury_cost_per_pair,
+                "baseline": baseline_cost_per_pair,
+            },
+            "total_cost_usd": {
+                "jury": jury_total_cost,
+                "baseline": baseline_total_cost,
+            },
+            "total_tokens": {
+                "jury": jury_total_tokens,
+                "baseline": baseline_total_tokens,
+            },
+            "baseline_pack": baseline_pack,
+            **({
+                "baseline_unpacked": {
+                    "accuracy": unpacked_acc,
+                    "avg_time_s": unpacked_avg_time,
+                    "total_cost_usd": sum(r["cost_usd"] for r in unpacked_results),
+                    "agreement": agreement,
+                }
+            } if compare_unpacked else {}),
+            "dedup": {
+                "pairs_reused": reused,
+                "pair_dedup_ratio": reused / n if n else 0,
+                "llm_calls_coalesced": llm_calls.shared,
+                "llm_call_dedup_ratio": llm_calls.dedup_ratio,
+            },
+            "note": "Costs from LangChain built-in OpenAI pricing",
+        },
+    )
+    store.close()
+    return run_id
 
 
 if __name__ == "__main__":
@@ -325,6 +494,11 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--pairs", type=str, default=None, help="Comma-separated pair IDs, e.g. 0,5,9. Default: from config or all 15")
     parser.add_argument("--baseline", type=str, default=None, help="Baseline model. Default: from config or gpt-4o")
+    parser.add_argument("--no-cost", action="store_true", help="Skip token/cost tracking (costs and tokens reported as 0)")
+    parser.add_argument("--store", default=str(DEFAULT_PATH), help="Trace store SQLite file (default: eval/traces.sqlite)")
+    parser.add_argument("--baseline-pack", type=int, default=None, help="Baseline pairs per request. Default: from config or 1")
+    parser.add_argument("--compare-unpacked", action="store_true", help="With a packed baseline, also run it one pair per call and compare")
+    perf.add_arguments(parser)
     args = parser.parse_args()
 
     config = load_config()
@@ -337,5 +511,15 @@ if __name__ == "__main__":
         pair_ids = eval_cfg["pair_ids"]
 
     baseline_model = args.baseline or eval_cfg.get("baseline_model", "gpt-4o")
-
-    run_eval(pair_ids=pair_ids, baseline_model=baseline_model)
+    baseline_pack = args.baseline_pack or eval_cfg.get("baseline_pack", 1)
+
+    profiler = perf.start(args)
+    run_eval(
+        pair_ids=pair_ids,
+        baseline_model=baseline_model,
+        track_cost=not args.no_cost,
+        store_path=args.store,
+        baseline_pack=baseline_pack,
+        compare_unpacked=args.compare_unpacked,
+    )
+    perf.finish(profiler, args)
@@ -0,0 +1,207 @@
+"""
+Local OpenAI-compatible stub server: deterministic fake LLM for offline runs.
+
+Serves /v1/chat/completions (plain, json_schema, streaming) with canned answers
+synthesised from the requested schema, so the full pipeline can run without an API key.
+
+Usage (from project root):
+  uv run python eval/stub_openai.py --port 8765 --latency 0.05
+  uv run python eval/stub_openai.py --max-concurrency 4   # 429 beyond 4 in-flight requests
+  OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=stub uv run python src/main.py
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _digest(text: str) -> int:
+    return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+
+
+def _resolve(schema: dict, root: dict) -> dict:
+    ref = schema.get("$ref")
+    if ref:
+        name = ref.rsplit("/", 1)[-1]
+        return root.get("$defs", {}).get(name) or root.get("definitions", {}).get(name) or {}
+    if "anyOf" in schema:
+        options = [s for s in schema["anyOf"] if s.get("type") != "null"]
+        return _resolve(options[0], root) if options else {"type": "null"}
+    return schema
+
+
+def _synthesise(schema: dict, root: dict, key: str, seed: int):
+    """Build a value for a JSON schema. Verdict-like fields are derived from the prompt hash."""
+    schema = _resolve(schema, root)
+    if "enum" in schema:
+        return schema["enum"][seed % len(schema["enum"])]
+    kind = schema.get("type")
+    if kind == "object" or "properties" in schema:
+        return {
+            name: _synthesise(sub, root, name, seed + i)
+            for i, (name, sub) in enumerate(schema.get("properties", {}).items())
+        }
+    if kind == "array":
+        return [_synthesise(schema.get("items", {}), root, key, seed + i) for i in range(1 + seed % 2)]
+    if kind == "boolean":
+        return False if key in ("conceded", "no_new_arguments") else bool(seed % 3)
+    if kind == "number":
+        return 0.8
+    if kind == "integer":
+        return seed % 3
+    if key == "verdict":
+        return "Mutated" if seed % 2 else "Faithful"
+    if key in ("reasoning", "summary"):  # free-text fields are the long part of a real answer
+        return f"stub {key}: " + "the figures and scope in the claim were compared with the truth. " * 4
+    return f"stub {key}"
+
+
+def _answer(body: dict) -> str:
+    prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+    seed = _digest(prompt)
+    fmt = body.get("response_format") or {}
+    if fmt.get("type") == "json_schema":
+        schema = fmt["json_schema"].get("schema", {})
+        answer = _synthesise(schema, schema, "", seed)
+        ids = re.findall(r"^\[ID (-?\d+)\]", prompt, re.MULTILINE)
+        if ids and isinstance(answer.get("verdicts"), list):  # packed baseline: one verdict per ID asked
+            answer["verdicts"] = [
+                {"id": int(i), "verdict": "Mutated" if _digest(f"{prompt}{i}") % 3 else "Faithful"} for i in ids
+            ]
+        return json.dumps(answer)
+    if fmt.get("type") == "json_object":
+        return json.dumps({"verdict": "Mutated" if seed % 3 else "Faithful"})
+    if "Faithful or Mutated" in prompt:
+        return "Mutated" if seed % 3 else "Faithful"
+    return "Stub argument: the claim and the truth differ in the figures they report, which matters here."
+
+
+class _Handler(BaseHTTPRequestHandler):
+    latency = 0.0
+    chunk_delay = 0.0  # simulated generation time per 16-character chunk
+    slots: threading.BoundedSemaphore | None = None  # in-flight limit; beyond it requests get 429
+    stats: dict  # per server: requests, rate_limited, in_flight, peak (most requests in flight at once)
+    stats_lock: threading.Lock
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        with self.stats_lock:
+            self.stats["requests"] += 1
+            self.stats["in_flight"] += 1
+            self.stats["peak"] = max(self.stats["peak"], self.stats["in_flight"])
+        try:
+            if self.slots is None:
+                return self._complete(body)
+            if not self.slots.acquire(blocking=False):
+                with self.stats_lock:
+                    self.stats["rate_limited"] += 1
+                return self._rate_limited()
+            try:
+                self._complete(body)
+            finally:
+                self.slots.release()
+        finally:
+            with self.stats_lock:
+                self.stats["in_flight"] -= 1
+
+    def _rate_limited(self) -> None:
+        data = json.dumps({"error": {"message": "stub rate limit", "type": "rate_limit_exceeded"}}).encode()
+        self.send_response(429)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("retry-after-ms", "200")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _complete(self, body: dict) -> None:
+        time.sleep(self.latency)
+        n = int(body.get("n") or 1)
+        contents = [_answer(body) for _ in range(n)]
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in body.get("messages", [])) // 4
+        completion_tokens = sum(len(c) for c in contents) // 4
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        base = {"id": "chatcmpl-stub", "created": int(time.time()), "model": body.get("model", "stub")}
+        if body.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for i, content in enumerate(contents):
+                for start in range(0, len(content), 16):
+                    delta = {"role": "assistant", "content": content[start:start + 16]}
+                    chunk = base | {"object": "chat.completion.chunk", "choices": [{"index": i, "delta": delta, "finish_reason": None}]}
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                    self.wfile.flush()
+                    time.sleep(self.chunk_delay)
+            done = base | {"object": "chat.completion.chunk", "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+            self.wfile.write(f"data: {json.dumps(done)}\n\n".encode())
+            if (body.get("stream_options") or {}).get("include_usage"):
+                usage_chunk = base | {"object": "chat.completion.chunk", "choices": [], "usage": usage}
+                self.wfile.write(f"data: {json.dumps(usage_chunk)}\n\n".encode())
+            self.wfile.write(b"data: [DONE]\n\n")
+            return
+        time.sleep(self.chunk_delay * max(-(-len(c) // 16) for c in contents))
+        payload = base | {
+            "object": "chat.completion",
+            "choices": [
+                {"index": i, "message": {"role": "assistant", "content": c}, "finish_reason": "stop"}
+                for i, c in enumerate(contents)
+            ],
+            "usage": usage,
+        }
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def serve(
+    port: int = 8765,
+    latency: float = 0.0,
+    *,
+    chunk_delay: float = 0.0,
+    max_concurrency: int = 0,
+    background: bool = False,
+) -> ThreadingHTTPServer:
+    """
+    Start the stub server. With background=True, serve from a daemon thread and return immediately.
+    `max_concurrency` > 0 answers 429 (retry-after 200 ms) to requests beyond that many in flight.
+    `server.stats` counts requests, 429s and the most requests in flight at once (peak).
+    """
+    slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency > 0 else None
+    stats = {"requests": 0, "rate_limited": 0, "in_flight": 0, "peak": 0}
+    handler = type("Handler", (_Handler,), {
+        "latency": latency, "chunk_delay": chunk_delay, "slots": slots, "stats": stats, "stats_lock": threading.Lock(),
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.stats = stats
+    if background:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    else:
+        server.serve_forever()
+    return server
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to sleep per request")
+    parser.add_argument("--chunk-delay", type=float, default=0.0, help="Seconds of simulated generation per 16-char chunk")
+    parser.add_argument("--max-concurrency", type=int, default=0, help="Answer 429 beyond this many in-flight requests (0 = no limit)")
+    args = parser.parse_args()
+    print(f"Stub OpenAI server on http://127.0.0.1:{args.port}/v1")
+    serve(args.port, args.latency, chunk_delay=args.chunk_delay, max_concurrency=args.max_concurrency)
@@ -0,0 +1,193 @@
+"""
+Config sweep: judge the eval pairs under a grid of config overrides and compare the variants in
+one accuracy / cost / latency table. Variants share every upstream stage they agree on (see
+src/workflow/sweep.py): parse runs once per pair unless the parser config varies, the initial
+vote once per jury setup, and so on, so an ablation of the debate or foreperson costs a fraction
+of running each variant through run_eval. Each variant is also appended to the trace store as
+its own run (label "sweep: <variant>"), for error_analysis.py --run / --compare.
+
+Usage (from project root):
+  uv run python eval/sweep.py --set debate.max_rounds=1,2 --set components.foreperson.model=gpt-4.1-mini,gpt-4.1
+  uv run python eval/sweep.py --grid sweep.yaml --pairs 0,5,9
+
+Grid file (YAML):
+  grid:                          # every combination is a variant
+    debate.max_rounds: [1, 2]
+  variants:                      # named variants: {dotted config path: value}
+    no_sceptic:
+      agents: [{name: literal, role: "Literal Fact-Checker"}, {name: context, role: "Context Guardian"}]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+import yaml
+from dotenv import load_dotenv
+
+load_dotenv(PROJECT_ROOT / ".env")
+
+import perf
+from config import config_fingerprint, load_config
+from data import load_pairs
+from run_eval import cost_tracker, jury_trace, load_ground_truth, normalize_verdict
+from trace_store import DEFAULT_PATH, TraceStore
+from workflow import Sweep, expand_grid
+from workflow.sweep import STAGES
+
+
+def parse_set(items: list[str]) -> dict[str, list]:
+    """--set PATH=V1,V2 options -> {path: [values]} (values parsed as YAML scalars)."""
+    grid = {}
+    for item in items:
+        path, _, values = item.partition("=")
+        if not values:
+            raise SystemExit(f"--set expects PATH=V1,V2,...: {item!r}")
+        grid[path.strip()] = [yaml.safe_load(v) for v in values.split(",")]
+    return grid
+
+
+def run_sweep(
+    variants: dict[str, dict],
+    pairs: list[dict],
+    *,
+    track_cost: bool = True,
+    store_path: str | Path = DEFAULT_PATH,
+) -> dict[str, dict]:
+    """Judge `pairs` under every variant, append one trace-store run per variant, print the comparison."""
+    ground_truth = load_ground_truth()
+    sweep = Sweep(variants, meter=lambda: cost_tracker(track_cost))
+    store = TraceStore(store_path)
+    pair_ids = [p["id"] for p in pairs]
+    run_ids = {
+        name: store.begin_run(config_fingerprint(config), None, pair_ids, label=f"sweep: {name}")
+        for name, config in variants.items()
+    }
+    totals = {name: {"correct": 0, "pairs": 0, "time_s": 0.0, "tokens": 0, "cost_usd": 0.0} for name in variants}
+    shared = {"runs": 0, "independent": 0, "time_s": 0.0, "cost_usd": 0.0, "tokens": 0}
+
+    print("=" * 78)
+    print(f"SWEEP: {len(variants)} variants x {len(pairs)} pairs")
+    print("=" * 78)
+    for level, (stage, _, _) in enumerate(STAGES):
+        print(f"  {stage:13s} {len({keys[level] for keys in sweep.keys.values()})} distinct run(s) per pair")
+    print()
+
+    for pair in pairs:
+        pid = pair["id"]
+        expected = ground_truth.get(pid)
+        if expected is None:
+            print(f"  [SKIP] Pair {pid}: no ground truth")
+            continue
+        t0 = time.perf_counter()
+        try:
+            result = sweep.run_pair(pair["claim"], pair["truth"], pair_id=pid)
+        except Exception as e:
+            print(f"  [SWEEP ERROR] Pair {pid}: {e}")
+            continue
+        shared["time_s"] += time.perf_counter() - t0
+        shared["runs"] += len(result.runs)
+        shared["cost_usd"] += sum(run.cost_usd for run in result.runs)
+        shared["tokens"] += sum(run.tokens for run in result.runs)
+
+        marks = []
+        for name, state in result.states.items():
+            path = result.path(name)
+            shared["independent"] += len(path)
+            verdict = state.get("verdict")
+            jury_verdict = normalize_verdict(verdict.verdict) if verdict else "?"
+            correct = jury_verdict == expected
+            row = totals[name]
+            row["pairs"] += 1
+            row["correct"] += correct
+            row["time_s"] += sum(run.seconds for run in path)
+            row["tokens"] += sum(run.tokens for run in path)
+            row["cost_usd"] += sum(run.cost_usd for run in path)
+            marks.append("✓" if correct else "✗")
+            claim, truth = pair["claim"], pair["truth"]
+            store.append(run_ids[name], {
+                "pair_id": pid,
+                "claim": claim[:200] + "..." if len(claim) > 200 else claim,
+                "truth": truth[:200] + "..." if len(truth) > 200 else truth,
+                "expected": expected,
+                "jury_verdict": jury_verdict,
+                "jury_correct": correct,
+                "jury_time_s": sum(run.seconds for run in path),
+                "jury_cost_usd": sum(run.cost_usd for run in path),
+                "jury_tokens": sum(run.tokens for run in path),
+                "reused_from": None,
+                **jury_trace(state),
+            })
+        print(f"  Pair {pid}: expected={expected}  {' '.join(marks)}  ({len(result.runs)} stage runs)")
+
+    print()
+    print("=" * 78)
+    print("RESULTS (per variant: time, tokens and cost of its own stage path, as if run alone)")
+    print("=" * 78)
+    width = max(len(name) for name in variants)
+    print(f"  {'variant':{width}s} {'accuracy':>9s} {'s/pair':>7s} {'tokens':>9s} {'cost $':>9s}  run")
+    summaries = {}
+    for name, row in totals.items():
+        n = row["pairs"]
+        summaries[name] = {
+            "num_pairs": n,
+            "accuracy": {"jury": row["correct"] / n if n else 0},
+            "avg_time_s": {"jury": row["time_s"] / n if n else 0},
+            "total_cost_usd": {"jury": row["cost_usd"]},
+            "total_tokens": {"jury": row["tokens"]},
+            "sweep_variant": name,
+        }
+        print(
+            f"  {name:{width}s} {summaries[name]['accuracy']['jury']:9.1%} {summaries[name]['avg_time_s']['jury']:7.1f}"
+            f" {row['tokens']:9,d} {row['cost_usd']:9.4f}  {run_ids[name]}"
+        )
+        store.finish_run(run_ids[name], summaries[name])
+    store.close()
+
+    independent_time = sum(row["time_s"] for row in totals.values())
+    independent_cost = sum(row["cost_usd"] for row in totals.values())
+    independent_tokens = sum(row["tokens"] for row in totals.values())
+    print()
+    print(f"  Stage runs:  {shared['runs']} shared vs {shared['independent']} running each variant alone")
+    print(f"  Time:        {shared['time_s']:.1f}s vs {independent_time:.1f}s")
+    print(f"  Tokens:      {shared['tokens']:,} vs {independent_tokens:,}")
+    print(f"  Cost:        ${shared['cost_usd']:.4f} vs ${independent_cost:.4f}")
+    print("  Compare variants: uv run python eval/error_analysis.py --run RUN --compare OTHER_RUN")
+    print()
+    return summaries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the eval pairs under a grid of config overrides")
+    parser.add_argument("--grid", default=None, help="YAML file with `grid` and/or `variants` (see module docstring)")
+    parser.add_argument("--set", action="append", default=[], metavar="PATH=V1,V2", help="Grid axis, e.g. debate.max_rounds=1,2 (repeatable)")
+    parser.add_argument("--pairs", type=str, default=None, help="Comma-separated pair IDs. Default: from config or all 15")
+    parser.add_argument("--no-cost", action="store_true", help="Skip token/cost tracking (costs and tokens reported as 0)")
+    parser.add_argument("--store", default=str(DEFAULT_PATH), help="Trace store SQLite file (default: eval/traces.sqlite)")
+    perf.add_arguments(parser)
+    args = parser.parse_args()
+
+    config = load_config()
+    config["interactive"] = False
+    config["data"] = config.get("data", {}) | {"source": "data/Nova.csv", "claim_col": "claim", "truth_col": "truth"}
+    if args.pairs:
+        config["data"]["pair_ids"] = [int(x.strip()) for x in args.pairs.split(",")]
+    else:
+        config["data"]["pair_ids"] = config.get("eval", {}).get("pair_ids", list(range(15)))
+
+    spec = {}
+    if args.grid:
+        with open(args.grid, encoding="utf-8") as f:
+            spec = yaml.safe_load(f) or {}
+    grid = (spec.get("grid") or {}) | parse_set(args.set)
+    variants = expand_grid(config, grid, spec.get("variants"))
+    if len(variants) < 2:
+        parser.error("a sweep needs at least two variants (--set PATH=V1,V2 or --grid FILE)")
+
+    profiler = perf.start(args)
+    run_sweep(variants, load_pairs(config), track_cost=not args.no_cost, store_path=args.store)
+    perf.finish(profiler, args)
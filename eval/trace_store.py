@@ -0,0 +1,307 @@
+"""
+Append-only eval trace store: one SQLite file holding every run_eval run (run ID, config
+fingerprint, summary) and its per-pair traces as JSON. The fields analysis filters on (pair,
+verdict, correctness, debate) are also indexed columns; anything else is reachable with SQLite's
+JSON functions on the `trace` column. Writes go through a background thread, so the eval loop
+never waits on the disk.
+
+Usage (from project root):
+  uv run python eval/trace_store.py --runs                # list runs
+  uv run python eval/trace_store.py --import eval/traces  # load legacy pair_*.json files as a run
+"""
+
+import json
+import queue
+import secrets
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PATH = PROJECT_ROOT / "eval" / "traces.sqlite"
+
+_SCHEMA = """
+PRAGMA journal_mode=WAL;
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    config_fingerprint TEXT NOT NULL,
+    baseline_model TEXT,
+    label TEXT,
+    pair_ids TEXT,
+    summary TEXT
+);
+CREATE TABLE IF NOT EXISTS traces (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    pair_id INTEGER NOT NULL,
+    expected TEXT,
+    jury_verdict TEXT,
+    jury_correct INTEGER,
+    baseline_verdict TEXT,
+    baseline_correct INTEGER,
+    initial_split INTEGER,
+    debate_ran INTEGER,
+    debate_rounds INTEGER,
+    debate_status TEXT,
+    reused_from INTEGER,
+    jury_time_s REAL,
+    jury_cost_usd REAL,
+    jury_tokens INTEGER,
+    trace TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS traces_run_pair ON traces(run_id, pair_id);
+CREATE INDEX IF NOT EXISTS traces_pair ON traces(pair_id);
+CREATE INDEX IF NOT EXISTS traces_verdict ON traces(run_id, jury_verdict);
+CREATE INDEX IF NOT EXISTS traces_correct ON traces(run_id, jury_correct);
+CREATE INDEX IF NOT EXISTS traces_debate ON traces(run_id, debate_ran, debate_status);
+"""
+
+_COLUMNS = (
+    "run_id", "pair_id", "expected", "jury_verdict", "jury_correct", "baseline_verdict", "baseline_correct",
+    "initial_split", "debate_ran", "debate_rounds", "debate_status", "reused_from",
+    "jury_time_s", "jury_cost_usd", "jury_tokens", "trace",
+)
+_INSERT_TRACE = f"INSERT INTO traces ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+
+_STOP = object()
+
+
+def _split(votes: list[dict]) -> bool:
+    """True if the votes disagree on the verdict."""
+    return len({(v.get("verdict") or "").strip().lower() for v in votes}) > 1
+
+
+def _trace_row(run_id: str, trace: dict) -> tuple:
+    return (
+        run_id,
+        trace["pair_id"],
+        trace.get("expected"),
+        trace.get("jury_verdict"),
+        trace.get("jury_correct"),
+        trace.get("baseline_verdict"),
+        trace.get("baseline_correct"),
+        _split(trace.get("initial_votes") or []),
+        trace.get("debate_ran"),
+        trace.get("debate_round_idx"),
+        trace.get("debate_status"),
+        trace.get("reused_from"),
+        trace.get("jury_time_s"),
+        trace.get("jury_cost_usd"),
+        trace.get("jury_tokens"),
+        json.dumps(trace, separators=(",", ":"), default=str),
+    )
+
+
+class TraceStore:
+    """
+    Runs and traces in one SQLite file. `begin_run` / `append` / `finish_run` are queued to a
+    writer thread (its own connection, one transaction per batch); reads use the caller's
+    connection and see everything written once `flush()` returns.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_PATH, *, batch: int = 64) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch = batch
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+        if "label" not in {row["name"] for row in self.conn.execute("PRAGMA table_info(runs)")}:
+            self.conn.execute("ALTER TABLE runs ADD COLUMN label TEXT")  # stores from before sweeps
+        self._queue: queue.Queue = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._error: BaseException | None = None
+        self._lock = threading.Lock()
+
+    # --- Writes (background thread) ---
+
+    def _put(self, item: tuple) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"trace store writer failed: {self._error}") from self._error
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="trace-store", daemon=True)
+                self._writer.start()
+        self._queue.put(item)
+
+    def _write_loop(self) -> None:
+        conn = sqlite3.connect(str(self.path))
+        try:
+            while True:
+                items = [self._queue.get()]
+                while len(items) < self.batch:
+                    try:
+                        items.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = any(item is _STOP for item in items)
+                try:
+                    if self._error is None:
+                        with conn:
+                            for item in items:
+                                if item is not _STOP:
+                                    self._write(conn, *item)
+                except Exception as e:  # surfaced to the caller on the next write / flush / close
+                    self._error = e
+                finally:
+                    for _ in items:
+                        self._queue.task_done()
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _write(conn: sqlite3.Connection, kind: str, *args: Any) -> None:
+        if kind == "run":
+            run_id, fingerprint, baseline_model, label, pair_ids = args
+            conn.execute(
+                "INSERT INTO runs (run_id, started_at, config_fingerprint, baseline_model, label, pair_ids) VALUES (?, ?, ?, ?, ?, ?)",
+                (run_id, time.strftime("%Y-%m-%dT%H:%M:%S"), fingerprint, baseline_model, label, json.dumps(pair_ids)),
+            )
+        elif kind == "trace":
+            conn.execute(_INSERT_TRACE, _trace_row(*args))
+        elif kind == "summary":
+            run_id, summary = args
+            conn.execute("UPDATE runs SET summary = ? WHERE run_id = ? AND summary IS NULL", (json.dumps(summary), run_id))
+
+    def begin_run(
+        self,
+        fingerprint: str,
+        baseline_model: str | None = None,
+        pair_ids: list[int] | None = None,
+        *,
+        label: str | None = None,
+    ) -> str:
+        """Register a new run and return its ID (start time plus a random suffix)."""
+        run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(2)}"
+        self._put(("run", run_id, fingerprint, baseline_model, label, pair_ids))
+        return run_id
+
+    def append(self, run_id: str, trace: dict) -> None:
+        """Queue one pair's trace (serialised on the writer thread)."""
+        self._put(("trace", run_id, trace))
+
+    def finish_run(self, run_id: str, summary: dict) -> None:
+        """Attach the run's summary metrics (once)."""
+        self._put(("summary", run_id, summary))
+
+    def flush(self) -> None:
+        """Wait until everything queued so far is committed."""
+        self._queue.join()
+        if self._error is not None:
+            raise RuntimeError(f"trace store writer failed: {self._error}") from self._error
+
+    def close(self) -> None:
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(_STOP)
+            writer.join()
+        self.conn.close()
+        if self._error is not None:
+            raise RuntimeError(f"trace store writer failed: {self._error}") from self._error
+
+    def __enter__(self) -> "TraceStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --- Reads ---
+
+    def query(self, sql: str, params: Iterable = ()) -> sqlite3.Cursor:
+        """Run a read query (rows are sqlite3.Row); iterate the cursor to stream results."""
+        return self.conn.execute(sql, tuple(params))
+
+    def runs(self) -> list[sqlite3.Row]:
+        """Runs, newest first, with pair count and jury / baseline accuracy."""
+        return self.query(
+            "SELECT r.run_id, r.started_at, r.config_fingerprint, r.baseline_model, r.label, COUNT(t.id) AS pairs,"
+            " AVG(t.jury_correct) AS jury_acc, AVG(t.baseline_correct) AS baseline_acc"
+            " FROM runs r LEFT JOIN traces t ON t.run_id = r.run_id"
+            " GROUP BY r.run_id ORDER BY r.started_at DESC, r.rowid DESC"
+        ).fetchall()
+
+    def resolve_run(self, ref: str | None = None) -> str | None:
+        """Run ID for `ref`: None / "latest", "previous", an exact ID or a unique prefix."""
+        if ref in (None, "latest", "previous"):
+            row = self.query(
+                "SELECT run_id FROM runs ORDER BY started_at DESC, rowid DESC LIMIT 1 OFFSET ?",
+                (1 if ref == "previous" else 0,),
+            ).fetchone()
+            return row["run_id"] if row else None
+        rows = self.query("SELECT run_id FROM runs WHERE run_id = ? OR run_id LIKE ? || '%'", (ref, ref)).fetchall()
+        exact = [r["run_id"] for r in rows if r["run_id"] == ref]
+        if exact or len(rows) == 1:
+            return exact[0] if exact else rows[0]["run_id"]
+        if rows:
+            raise ValueError(f"run {ref!r} is ambiguous: {', '.join(r['run_id'] for r in rows)}")
+        return None
+
+    def summary(self, run_id: str) -> dict | None:
+        row = self.query("SELECT summary FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return json.loads(row["summary"]) if row and row["summary"] else None
+
+    def traces(self, run_id: str, *, pair_ids: Iterable[int] | None = None, failures: bool = False) -> Iterator[dict]:
+        """Stream a run's traces in pair order (optionally only some pairs, or only jury failures)."""
+        sql, params = "SELECT trace FROM traces WHERE run_id = ?", [run_id]
+        if pair_ids is not None:
+            pair_ids = list(pair_ids)
+            sql += f" AND pair_id IN ({', '.join('?' * len(pair_ids))})"
+            params += pair_ids
+        if failures:
+            sql += " AND NOT jury_correct"
+        for row in self.query(sql + " ORDER BY pair_id, id", params):
+            yield json.loads(row["trace"])
+
+    def import_json(self, traces_dir: str | Path) -> str | None:
+        """Load a legacy eval/traces/ directory (pair_*.json, summary.json) as one run."""
+        traces_dir = Path(traces_dir)
+        files = sorted(traces_dir.glob("pair_*.json"), key=lambda f: int(f.stem.split("_")[1]))
+        if not files:
+            return None
+        traces = [json.loads(f.read_text(encoding="utf-8")) for f in files]
+        run_id = self.begin_run("imported", None, [t["pair_id"] for t in traces], label=f"import {traces_dir}")
+        for trace in traces:
+            self.append(run_id, trace)
+        summary = traces_dir / "summary.json"
+        if summary.exists():
+            self.finish_run(run_id, json.loads(summary.read_text(encoding="utf-8")))
+        self.flush()
+        return run_id
+
+
+def print_runs(store: TraceStore) -> None:
+    runs = store.runs()
+    if not runs:
+        print("No runs yet. Run: uv run python eval/run_eval.py")
+        return
+    print(f"  {'run':22s} {'started':19s} {'config':16s} {'baseline':10s} {'pairs':>5s} {'jury':>6s} {'base':>6s}  label")
+    for r in runs:
+        jury = f"{r['jury_acc']:.0%}" if r["jury_acc"] is not None else "-"
+        base = f"{r['baseline_acc']:.0%}" if r["baseline_acc"] is not None else "-"
+        print(
+            f"  {r['run_id']:22s} {r['started_at']:19s} {r['config_fingerprint']:16s}"
+            f" {r['baseline_model'] or '-':10.10s} {r['pairs']:5d} {jury:>6s} {base:>6s}  {r['label'] or ''}"
+        )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Eval trace store")
+    parser.add_argument("--store", default=str(DEFAULT_PATH), help="SQLite file (default: eval/traces.sqlite)")
+    parser.add_argument("--runs", action="store_true", help="List runs")
+    parser.add_argument("--import", dest="import_dir", metavar="DIR", default=None, help="Import legacy pair_*.json traces as a run")
+    args = parser.parse_args()
+
+    with TraceStore(args.store) as store:
+        if args.import_dir:
+            run_id = store.import_json(args.import_dir)
+            print(f"Imported {args.import_dir} as run {run_id}" if run_id else f"No pair_*.json traces in {args.import_dir}")
+        if args.runs or not args.import_dir:
+            print_runs(store)
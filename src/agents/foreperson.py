@@ -1,9 +1,9 @@
 """Foreperson agent: applies rubric to produce final Verdict."""
 
-from langchain_openai import ChatOpenAI
-
 from schemas import Verdict
-from prompts import load
+from prompts import template
+
+from .llm import structured_model, invoke, length_instruction
 
 
 def run_foreperson(
@@ -16,17 +16,14 @@ def run_foreperson(
     config: dict,
 ) -> Verdict:
     """Run Foreperson to produce final Verdict."""
-    cfg = config.get("components", {}).get("foreperson", {})
-    model_name = cfg.get("model", "gpt-4.1-mini")
-    temperature = cfg.get("temperature", 0.2)
-    llm = ChatOpenAI(model=model_name, temperature=temperature).with_structured_output(Verdict)
+    llm = structured_model("foreperson", config, Verdict)
 
-    prompt = load("foreperson.txt").format(
+    prompt = template("foreperson.txt").render(
         claim=claim,
         truth=truth,
         fact_frame=fact_frame_str,
         transcript=transcript_str,
         revote_outputs=revote_outputs_str,
         rubric_questions=rubric_questions,
-    )
-    return llm.invoke(prompt)
+    ) + length_instruction("foreperson", config)
+    return invoke(llm, prompt, config)
@@ -0,0 +1,67 @@
+"""Incremental JSON parser for streamed structured output: yields top-level fields as they complete."""
+
+import json
+from typing import Any
+
+
+class FieldStream:
+    """
+    Feed the text of one streamed JSON object chunk by chunk; `feed` returns the top-level
+    (key, value) pairs completed by that chunk. Each character is scanned once, so the cost
+    is linear in the output length. A field is complete when the `,` or `}` after it arrives,
+    which for a schema like JuryOutput means `verdict` is known long before `reasoning`.
+    """
+
+    def __init__(self) -> None:
+        self.buffer = ""
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.key: str | None = None
+        self.key_start: int | None = None
+        self.value_start: int | None = None
+        self.fields: dict[str, Any] = {}
+        self.done = False
+
+    def feed(self, text: str) -> list[tuple[str, Any]]:
+        self.buffer += text
+        completed: list[tuple[str, Any]] = []
+        buf = self.buffer
+        for i in range(self.pos, len(buf)):
+            if self.done:
+                break
+            ch = buf[i]
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+                    if self.depth == 1 and self.key_start is not None:
+                        self.key = json.loads(buf[self.key_start:i + 1])
+                        self.key_start = None
+                continue
+            if ch == '"':
+                self.in_string = True
+                if self.depth == 1 and self.key is None:
+                    self.key_start = i
+            elif ch in "{[":
+                self.depth += 1
+            elif ch == ":" and self.depth == 1 and self.key is not None and self.value_start is None:
+                self.value_start = i + 1
+            elif ch in ",}]":
+                if self.depth == 1 and ch in ",}" and self.value_start is not None:
+                    completed.append(self._complete(buf[self.value_start:i]))
+                if ch in "}]":
+                    self.depth -= 1
+                    self.done = self.depth == 0
+        self.pos = len(buf)
+        return completed
+
+    def _complete(self, raw: str) -> tuple[str, Any]:
+        key, value = self.key, json.loads(raw)
+        self.fields[key] = value
+        self.key = self.value_start = None
+        return key, value
@@ -1,17 +1,27 @@
 """Jury agents: each votes Faithful or Mutated based on claim, truth, and FactFrame."""
 
-from langchain_openai import ChatOpenAI
+from typing import Any, Callable
 
-from schemas import FactFrame, JuryOutput
-from prompts import load_jury_template, load_role_instruction
+from schemas import FactFrame, JuryOutput, RevoteOutput, SampledJuryOutput
+from prompts import jury_template, load_role_instruction
 
-def _create_jury(config: dict) -> ChatOpenAI:
-    """Create a jury agent with structured output (JuryOutput)."""
-    cfg = config.get("components", {}).get("agents", {})
-    model_name = cfg.get("model", "gpt-4.1-mini")
-    temperature = cfg.get("temperature", 0.2)
-    llm = ChatOpenAI(model=model_name, temperature=temperature)
-    return llm.with_structured_output(JuryOutput)
+from .llm import structured_model, invoke, invoke_samples, length_instruction
+
+# Output schema and prompt per stage: the revote drops the evidence list (it is in the initial vote)
+_STAGES = {
+    "vote": (JuryOutput, "vote_template"),
+    "revote": (RevoteOutput, "revote_template"),
+}
+
+
+def _create_jury(config: dict, schema: type = JuryOutput):
+    """Jury agent with structured output (JuryOutput or RevoteOutput) (pooled client)."""
+    return structured_model("agents", config, schema)
+
+
+def format_facts(fact_frame: FactFrame) -> str:
+    """Facts one per line with their [index], which evidence refers to (compact JSON, nulls dropped)."""
+    return "\n".join(f"[{i}] {fact.model_dump_json(exclude_none=True)}" for i, fact in enumerate(fact_frame.facts))
 
 
 def run_jury(
@@ -22,11 +32,19 @@ def run_jury(
     config: dict,
     *,
     transcript: list[dict] | None = None,
-) -> JuryOutput:
-    """Run a jury agent on a (claim, truth) pair and FactFrame. Optional debate transcript for revote."""
-    template = load_jury_template("vote_template")
+    on_field: Callable[[str, Any], None] | None = None,
+    stage: str = "vote",
+    initial_verdict: str | None = None,
+) -> JuryOutput | RevoteOutput:
+    """
+    Run a jury agent on a (claim, truth) pair and FactFrame. Optional debate transcript for revote.
+    `stage="revote"` asks for the lean RevoteOutput, given the agent's `initial_verdict`.
+    `on_field(key, value)` streams the output and reports each field as it completes.
+    With `samples: k` on the agent, returns the majority of up to k samples (SampledJuryOutput).
+    """
+    schema, template_name = _STAGES[stage]
+    template = jury_template(template_name)
     role_instruction = load_role_instruction(agent_name)
-    fact_frame_str = fact_frame.model_dump_json(indent=2)
 
     debate_section = ""
     if transcript:
@@ -36,12 +54,65 @@ def run_jury(
         ]
         debate_section = "\n\nDEBATE TRANSCRIPT:\n" + "\n".join(lines) + "\n\nConsider the arguments above before voting.\n\n---\n"
 
-    prompt = template.format(
+    prompt = template.render(
         role_instruction=role_instruction.strip(),
         claim=claim,
         truth=truth,
-        fact_frame=fact_frame_str,
+        fact_frame=format_facts(fact_frame),
         debate_section=debate_section,
+        initial_verdict=initial_verdict or "(unknown)",
+    ) + length_instruction("agents", config)
+    jury = _create_jury(config, schema)
+    agent = next((a for a in config.get("agents", []) if a.get("name") == agent_name), {})
+    samples = agent.get("samples", 1)
+    if samples > 1:
+        output = self_consistent(jury, prompt, config, samples, early_stop=agent.get("early_stop", True))
+        if on_field is not None:
+            on_field("verdict", output.verdict)
+        return output
+    return invoke(jury, prompt, config, on_field=on_field)
+
+
+def _tally(outputs: list) -> dict[str, list]:
+    votes: dict[str, list] = {}
+    for output in outputs:
+        votes.setdefault(output.verdict.strip().lower(), []).append(output)
+    return votes
+
+
+def majority(outputs: list[JuryOutput | RevoteOutput], k: int | None = None) -> SampledJuryOutput:
+    """
+    Majority verdict of the samples (ties go to the side with the higher mean confidence).
+    Agreement is the share of the `k` samples asked for (default: those drawn) that back it, so
+    samples an early stop did not draw count as dissent. Confidence is the agreement times the
+    majority samples' mean confidence; the rest is the most confident majority sample's.
+    """
+    votes = _tally(outputs)
+    side = max(votes.values(), key=lambda v: (len(v), sum(o.confidence for o in v) / len(v)))
+    best = max(side, key=lambda o: o.confidence)
+    agreement = len(side) / max(k or 0, len(outputs))
+    confidence = agreement * sum(o.confidence for o in side) / len(side)
+    return SampledJuryOutput(
+        **best.model_dump(exclude={"confidence"}), confidence=confidence, agreement=agreement, samples=outputs,
     )
-    jury = _create_jury(config)
-    return jury.invoke(prompt)
\ No newline at end of file
+
+
+def self_consistent(jury, prompt: str, config: dict, k: int, *, early_stop: bool = True) -> SampledJuryOutput:
+    """
+    Up to `k` samples of one prompt, drawn with `n` so the prompt is sent once per request.
+    The first request asks for a bare majority (k // 2 + 1); while no verdict has one, the
+    next asks for just enough more samples to decide it. A unanimous first request stops there,
+    and its agreement is a lower bound (see majority). Without `early_stop`, all k are drawn.
+    """
+    needed = k // 2 + 1 if early_stop else k
+    outputs: list[JuryOutput | RevoteOutput] = []
+    while len(outputs) < k:
+        top = max((len(v) for v in _tally(outputs).values()), default=0)
+        if top >= needed:
+            break
+        n = min(needed - top, k - len(outputs))
+        drawn = invoke_samples(jury, prompt, config, n, offset=len(outputs))
+        if not drawn:
+            raise RuntimeError("jury sampling returned no completions")
+        outputs += drawn[:n]
+    return majority(outputs, k)
\ No newline at end of file
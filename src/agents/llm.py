@@ -0,0 +1,241 @@
+"""Shared chat-model clients: one per (model, temperature, client spec), reused across calls and pairs."""
+
+import os
+import threading
+from contextlib import nullcontext
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.runnables.config import ensure_config, merge_configs
+
+import perf
+from coalesce import SingleFlight, prompt_key
+
+from .json_stream import FieldStream
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+# Identical prompts in flight on the same pooled client share one request
+llm_calls = SingleFlight()
+
+# lru_cache may build twice under a race; the lock keeps one client per key
+_clients_lock = threading.Lock()
+
+# id(client) -> "model" / "model:Schema", to label LLM calls in profiles
+_labels: dict[int, str] = {}
+
+# id(client) -> (model, temperature, schema or None), to rebuild a call as a raw request
+_params: dict[int, tuple[str, float, type | None]] = {}
+
+# id(structured client) -> the plain client it wraps, for multi-sample calls
+_bases: dict[int, "ChatOpenAI"] = {}
+
+# id(client) -> client spec: backend and output caps (empty for the default endpoint, no caps)
+_specs: dict[int, dict] = {}
+
+
+class _BackendSlots:
+    """In-flight requests to one backend, capped at the smallest max_concurrency configured for it."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self._cond = threading.Condition()
+
+    def lower(self, limit: int) -> None:
+        with self._cond:
+            self.limit = min(self.limit, limit)
+
+    def __enter__(self) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    def __exit__(self, *exc) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+
+# base_url (None: the default endpoint) -> its in-flight limit, shared by every client on that backend
+_backend_slots: dict[str | None, _BackendSlots] = {}
+
+# Bulk mode: when set, calls are answered from provider batch results instead of sent (see bulk.collect)
+call_handler: ContextVar[Callable | None] = ContextVar("call_handler", default=None)
+
+PROVIDERS = ("openai", "openai_compatible")
+_SPEC_KEYS = ("provider", "base_url", "api_key_env", "max_concurrency", "timeout", "max_tokens")
+
+
+def _client_spec(cfg: dict) -> tuple:
+    """Hashable client spec of a components entry: its backend keys and max_tokens, where set."""
+    spec = {k: cfg[k] for k in _SPEC_KEYS if cfg.get(k) is not None}
+    provider = spec.get("provider", "openai")
+    if provider not in PROVIDERS:
+        raise ValueError(f"Unknown provider {provider!r} (expected one of {', '.join(PROVIDERS)})")
+    if provider == "openai_compatible" and "base_url" not in spec:
+        raise ValueError("provider openai_compatible needs a base_url")
+    return tuple(sorted(spec.items()))
+
+
+@lru_cache(maxsize=None)
+def _chat_openai(model: str, temperature: float, spec: tuple = ()) -> "ChatOpenAI":
+    # Imported on first use: langchain_openai (and openai) take most of the CLI's startup time
+    from .openai_chat import UsageChatOpenAI
+
+    spec = dict(spec)
+    kwargs: dict[str, Any] = {k: spec[k] for k in ("base_url", "timeout", "max_tokens") if k in spec}
+    if "api_key_env" in spec:
+        kwargs["api_key"] = os.environ.get(spec["api_key_env"], "")
+    elif spec.get("provider") == "openai_compatible":
+        kwargs["api_key"] = "unused"  # local servers usually take any key
+    llm = UsageChatOpenAI(model=model, temperature=temperature, stream_usage=True, **kwargs)
+    _labels[id(llm)] = _label(model, spec)
+    _params[id(llm)] = (model, temperature, None)
+    _register_spec(llm, spec)
+    return llm
+
+
+@lru_cache(maxsize=None)
+def _structured(model: str, temperature: float, schema: type, spec: tuple = ()):
+    base = _chat_openai(model, temperature, spec)
+    llm = base.with_structured_output(schema)
+    _bases[id(llm)] = base
+    _labels[id(llm)] = f"{_label(model, dict(spec))}:{schema.__name__}"
+    _params[id(llm)] = (model, temperature, schema)
+    _register_spec(llm, dict(spec))
+    return llm
+
+
+def _label(model: str, spec: dict) -> str:
+    return f"{model}@{spec['base_url']}" if spec.get("base_url") else model
+
+
+def _register_spec(llm, spec: dict) -> None:
+    _specs[id(llm)] = spec
+    if spec.get("max_concurrency"):
+        slots = _backend_slots.setdefault(spec.get("base_url"), _BackendSlots(spec["max_concurrency"]))
+        slots.lower(spec["max_concurrency"])
+
+
+def _backend(llm):
+    """The in-flight limit of the client's backend, if any component on it sets max_concurrency."""
+    return _backend_slots.get(_specs.get(id(llm), {}).get("base_url")) or nullcontext()
+
+
+def _model_params(component: str, config: dict) -> tuple[str, float, tuple]:
+    cfg = config.get("components", {}).get(component, {})
+    return cfg.get("model", "gpt-4.1-mini"), cfg.get("temperature", 0.2), _client_spec(cfg)
+
+
+def chat_model(component: str, config: dict) -> "ChatOpenAI":
+    """Pooled client for a components entry (parser, agents, debate_status, foreperson)."""
+    model, temperature, spec = _model_params(component, config)
+    with _clients_lock:
+        return _chat_openai(model, temperature, spec)
+
+
+def structured_model(component: str, config: dict, schema: type):
+    """Pooled client for a components entry with structured output bound to `schema`."""
+    model, temperature, spec = _model_params(component, config)
+    with _clients_lock:
+        return _structured(model, temperature, schema, spec)
+
+
+def client_params(llm) -> tuple[str, float, type | None]:
+    """(model, temperature, structured-output schema or None) of a pooled client."""
+    return _params[id(llm)]
+
+
+def client_spec(llm) -> dict:
+    """Client spec of a pooled client: backend keys and max_tokens ({} for the defaults)."""
+    return _specs.get(id(llm), {})
+
+
+def length_instruction(component: str, config: dict) -> str:
+    """Prompt line capping free-text fields at components.<component>.reasoning_words ("" if unset)."""
+    words = config.get("components", {}).get(component, {}).get("reasoning_words")
+    return f"\nKeep each free-text answer or field under {words} words.\n" if words else ""
+
+
+class _FieldCallback(BaseCallbackHandler):
+    """Feeds streamed tokens of one structured-output call to a FieldStream."""
+
+    def __init__(self, on_field: Callable[[str, Any], None]) -> None:
+        self.fields = FieldStream()
+        self.on_field = on_field
+
+    def on_llm_new_token(self, token: str, **kwargs) -> None:
+        for key, value in self.fields.feed(token):
+            self.on_field(key, value)
+
+
+def _stream_fields(llm, prompt: str, on_field: Callable[[str, Any], None]):
+    """Stream a structured-output call, reporting top-level fields as they complete; returns the parsed result."""
+    # Merge into the inherited config so budget / cost callbacks still see the call
+    run_config = merge_configs(ensure_config(), {"callbacks": [_FieldCallback(on_field)]})
+    result = None
+    for result in llm.stream(prompt, config=run_config):
+        pass
+    return result
+
+
+def invoke(llm, prompt: str, config: dict, *, on_field: Callable[[str, Any], None] | None = None):
+    """
+    Invoke a pooled client. With coalesce.llm_calls on (default), concurrent calls with the
+    same rendered prompt on the same client wait for one request instead of issuing their own.
+    With `on_field`, a structured-output call is streamed and each top-level field is reported
+    as soon as it is complete (a call that joins another's request reports nothing early).
+    Under a bulk-mode `call_handler`, the handler answers the call instead.
+    """
+    handler = call_handler.get()
+    if handler is not None:
+        return handler(llm, prompt, config, on_field=on_field)
+    return send(llm, prompt, config, on_field=on_field)
+
+
+def send(llm, prompt: str, config: dict, *, on_field: Callable[[str, Any], None] | None = None):
+    """Send a call to the client's backend (`invoke` without the bulk-mode handler)."""
+    slots = _backend(llm)
+
+    def call():
+        with slots:  # backend max_concurrency
+            return llm.invoke(prompt) if on_field is None else _stream_fields(llm, prompt, on_field)
+
+    with perf.llm_call(_labels.get(id(llm), type(llm).__name__)):
+        if not config.get("coalesce", {}).get("llm_calls", True):
+            return call()
+        return llm_calls.do((id(llm), prompt_key(prompt)), call)
+
+
+def invoke_samples(llm, prompt: str, config: dict, n: int, *, offset: int = 0) -> list:
+    """
+    `n` completions of a structured-output prompt in one request (the `n` parameter), parsed.
+    A provider that ignores `n` returns fewer. `offset` (samples already drawn for this prompt)
+    tells follow-up requests apart, so they are neither coalesced nor answered from bulk results.
+    """
+    handler = call_handler.get()
+    if handler is not None:
+        return handler(llm, prompt, config, n=n, offset=offset)
+    from langchain_core.messages import HumanMessage
+
+    _, _, schema = client_params(llm)
+    base = _bases[id(llm)]
+    slots = _backend(llm)
+
+    def call() -> list:
+        # stream=False: n completions cannot share one token stream (and callbacks may ask for one)
+        with slots:
+            result = base.generate(
+                [[HumanMessage(prompt)]], callbacks=ensure_config().get("callbacks"),
+                n=n, stream=False, response_format=schema,
+            )
+        return [schema.model_validate_json(g.message.content) for g in result.generations[0]]
+
+    with perf.llm_call(f"{_labels.get(id(llm), type(llm).__name__)} x{n}"):
+        if not config.get("coalesce", {}).get("llm_calls", True):
+            return call()
+        return llm_calls.do((id(llm), prompt_key(prompt), n, offset), call)
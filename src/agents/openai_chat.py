@@ -0,0 +1,22 @@
+"""ChatOpenAI subclass used by the pooled clients (imported lazily by agents.llm)."""
+
+from langchain_openai import ChatOpenAI
+
+
+class UsageChatOpenAI(ChatOpenAI):
+    """
+    ChatOpenAI that reports usage on every streamed response. Streamed structured output only
+    carries it as token_usage metadata, which the token/cost callbacks (budgets, eval) do not read.
+    """
+
+    def _stream(self, *args, **kwargs):
+        for chunk in super()._stream(*args, **kwargs):
+            message = chunk.message
+            usage = (chunk.generation_info or {}).get("token_usage")
+            if usage and not message.usage_metadata:
+                message.usage_metadata = {
+                    "input_tokens": usage.get("prompt_tokens") or 0,
+                    "output_tokens": usage.get("completion_tokens") or 0,
+                    "total_tokens": usage.get("total_tokens") or 0,
+                }
+            yield chunk
@@ -1,22 +1,127 @@
 """Parser agent: extracts FactFrame from (claim, truth) pairs."""
 
-from langchain_openai import ChatOpenAI
+import re
+from concurrent.futures import wait
 
-from schemas import FactFrame
-from prompts import load
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 
-def _create_parser(config: dict) -> ChatOpenAI:
-    """Create a parser agent that extracts a FactFrame from a (claim, truth) pair."""
-    cfg = config.get("components", {}).get("parser", {})
-    model_name = cfg.get("model", "gpt-4.1-mini")
-    temperature = cfg.get("temperature", 0.2)
-    model = ChatOpenAI(model=model_name, temperature=temperature)
-    return model.with_structured_output(FactFrame)
+import perf
+from schemas import Fact, FactFrame
+from prompts import template
+from retrieval import select_passages, split_passages
+
+from .llm import structured_model, invoke, length_instruction
+
+# Chunk extractions of every pair share one pool; tasks run in a copy of the caller's context
+# (callbacks, budgets, the bulk-mode call handler)
+_pool = ContextThreadPoolExecutor(max_workers=32, thread_name_prefix="parse-chunk")
+
+
+def _create_parser(config: dict):
+    """Parser agent that extracts a FactFrame from a (claim, truth) pair (pooled client)."""
+    return structured_model("parser", config, FactFrame)
 
 
 def parse(claim: str, truth: str, config: dict) -> FactFrame:
-    """Parse a (claim, truth) pair into a FactFrame."""
-    prompt = load("parser.txt")
-    prompt = prompt.format(claim=claim, truth=truth)
+    """
+    Parse a (claim, truth) pair into a FactFrame. With parse.mode "chunked", a long claim is
+    parsed chunk by chunk in parallel, plus one omission pass over the whole claim (see parse_chunked).
+    """
+    cfg = config.get("parse") or {}
+    if cfg.get("mode", "single") == "chunked":
+        chunks = claim_chunks(claim, cfg.get("chunk_chars", 300))
+        if len(chunks) > 1:
+            return parse_chunked(chunks, truth, config, claim=claim)
+    prompt = template("parser.txt").render(claim=claim, truth=truth) + length_instruction("parser", config)
+    parser = _create_parser(config)
+    return invoke(parser, prompt, config)
+
+
+def claim_chunks(claim: str, chunk_chars: int = 300) -> list[str]:
+    """Sentences of the claim, neighbours grouped while a chunk stays within `chunk_chars`."""
+    chunks: list[str] = []
+    for start, end in split_passages(claim):
+        sentence = claim[start:end]
+        if chunks and len(chunks[-1]) + 1 + len(sentence) <= chunk_chars:
+            chunks[-1] += " " + sentence
+        else:
+            chunks.append(sentence)
+    return chunks
+
+
+def _chunk_truth(chunk: str, truth: str, config: dict) -> str:
+    """The truth passages relevant to one chunk, up to parse.truth_chars (the whole truth if shorter)."""
+    limit = (config.get("parse") or {}).get("truth_chars", 800)
+    if len(truth) <= limit:
+        return truth
+    passages = config.get("passages") or {}
+    return select_passages(
+        chunk,
+        truth,
+        unit=passages.get("unit", "sentence"),
+        top_k=passages.get("top_k", 4),
+        window=passages.get("window", 1),
+        max_chars=limit,
+        weights=passages.get("weights"),
+    ).text
+
+
+def parse_chunked(chunks: list[str], truth: str, config: dict, *, claim: str | None = None) -> FactFrame:
+    """
+    Extract facts for every claim chunk concurrently, each against its own truth passages, and
+    merge them into one FactFrame. Parse latency is that of the slowest chunk, not of one long
+    call. No chunk sees the whole claim, so with parse.omissions on (default) one more call,
+    running alongside, lists the truth facts the whole `claim` (default: the chunks joined)
+    leaves out. All calls are waited for before a failure is raised (so none is left running).
+    """
+    chunk_template = template("parser_chunk.txt")
     parser = _create_parser(config)
-    return parser.invoke(prompt)
\ No newline at end of file
+    suffix = length_instruction("parser", config)
+
+    def _run(part: int, chunk: str) -> FactFrame:
+        with perf.task(f"parse chunk {part}"):
+            prompt = chunk_template.render(
+                part=part, parts=len(chunks), claim=chunk, truth=_chunk_truth(chunk, truth, config)
+            )
+            return invoke(parser, prompt + suffix, config)
+
+    def _omissions() -> FactFrame:
+        with perf.task("parse omissions"):
+            prompt = template("parser_omissions.txt").render(claim=claim or " ".join(chunks), truth=truth)
+            return invoke(parser, prompt + suffix, config)
+
+    futures = [_pool.submit(_run, part, chunk) for part, chunk in enumerate(chunks, 1)]
+    omissions = _pool.submit(_omissions) if (config.get("parse") or {}).get("omissions", True) else None
+    wait(futures + ([omissions] if omissions else []))
+    return merge_facts([f.result() for f in futures], omissions.result() if omissions else None)
+
+
+def _norm(value: str | None) -> str:
+    # Case, spacing and punctuation do not make a different fact ("650,000" == "650000")
+    return re.sub(r"[^\w%$]+", "", (value or "").lower())
+
+
+def merge_facts(frames: list[FactFrame], omissions: FactFrame | None = None) -> FactFrame:
+    """
+    One FactFrame from per-chunk frames, in chunk order. A fact with the same category and
+    normalised claim_says / truth_says as an earlier one is dropped; its note fills in a
+    missing note on the kept fact. `omissions` (whole-claim omission pass) are appended unless a
+    chunk already matched the same truth fact. Deterministic for the same inputs.
+    """
+    facts: list[Fact] = []
+    seen: dict[tuple[str, str, str], int] = {}
+    for frame in frames:
+        for fact in frame.facts:
+            key = (_norm(fact.category), _norm(fact.claim_says), _norm(fact.truth_says))
+            if key not in seen:
+                seen[key] = len(facts)
+                facts.append(fact)
+            elif fact.note and not facts[seen[key]].note:
+                facts[seen[key]] = facts[seen[key]].model_copy(update={"note": fact.note})
+    matched = {_norm(fact.truth_says) for fact in facts if fact.truth_says}
+    for fact in omissions.facts if omissions else []:
+        truth_says = _norm(fact.truth_says)
+        if truth_says and truth_says not in matched:
+            matched.add(truth_says)
+            facts.append(fact if fact.note else fact.model_copy(update={"note": "omitted in claim"}))
+    return FactFrame(facts=facts)
@@ -1,3 +1,22 @@
-from .tts import speak, is_available
+from .tts import speak, is_available, get_backend, split_sentences, synthesize
+from .pipeline import AudioPipeline
+from .backends import ElevenLabsBackend, FakeBackend
+from .cache import AudioCache, audio_key, get_cache
+from .render import render_episodes
+from . import script
 
-__all__ = ["speak", "is_available"]
+__all__ = [
+    "speak",
+    "is_available",
+    "get_backend",
+    "split_sentences",
+    "synthesize",
+    "AudioPipeline",
+    "ElevenLabsBackend",
+    "FakeBackend",
+    "AudioCache",
+    "audio_key",
+    "get_cache",
+    "render_episodes",
+    "script",
+]
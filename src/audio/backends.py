@@ -0,0 +1,52 @@
+"""TTS backends: ElevenLabs (streaming synthesis) and a local fake for offline runs."""
+
+import threading
+import time
+from typing import Iterator
+
+
+class ElevenLabsBackend:
+    """One pooled ElevenLabs client; synthesis streams audio bytes as they are generated."""
+
+    def __init__(self, api_key: str) -> None:
+        from elevenlabs.client import ElevenLabs  # imported when TTS is actually used
+
+        self.client = ElevenLabs(api_key=api_key)
+
+    def synthesize(self, text: str, voice_id: str, model_id: str, output_format: str) -> Iterator[bytes]:
+        return self.client.text_to_speech.stream(
+            voice_id=voice_id,
+            text=text,
+            model_id=model_id,
+            output_format=output_format,
+        )
+
+    def play(self, audio: bytes) -> None:
+        from elevenlabs.play import play
+
+        play(audio)
+
+
+class FakeBackend:
+    """
+    Offline stand-in: no API key, network or audio device. Synthesis and playback take time
+    proportional to the text, and the "audio" is the utf-8 text, so played utterances can be
+    checked in order (`played`).
+    """
+
+    def __init__(self, synth_chars_per_s: float = 2000.0, play_chars_per_s: float = 150.0) -> None:
+        self.synth_chars_per_s = synth_chars_per_s
+        self.play_chars_per_s = play_chars_per_s
+        self.played: list[str] = []
+        self._lock = threading.Lock()
+
+    def synthesize(self, text: str, voice_id: str, model_id: str, output_format: str) -> Iterator[bytes]:
+        data = text.encode("utf-8")
+        for i in range(0, len(data), 64):
+            time.sleep(64 / self.synth_chars_per_s)
+            yield data[i:i + 64]
+
+    def play(self, audio: bytes) -> None:
+        time.sleep(len(audio) / self.play_chars_per_s)
+        with self._lock:
+            self.played.append(audio.decode("utf-8", errors="replace"))
@@ -0,0 +1,79 @@
+"""Content-addressed disk cache of synthesized audio."""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+
+def audio_key(text: str, voice_id: str, model_id: str, output_format: str) -> str:
+    """Everything that determines the audio bytes; equal keys give equal audio."""
+    payload = "\x1f".join([text, voice_id, model_id, output_format])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """
+    One file per key under `path`. Reads refresh the file's mtime, so the least recently used
+    files (by mtime, which also carries over between runs) are evicted once the cache holds
+    more than `max_bytes`. Writes are atomic; safe to share between threads.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        files = sorted(self.path.glob("*.audio"), key=lambda f: f.stat().st_mtime)
+        self._sizes: OrderedDict[str, int] = OrderedDict((f.stem, f.stat().st_size) for f in files)
+        self._total = sum(self._sizes.values())
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.audio"
+
+    def get(self, key: str) -> bytes | None:
+        file = self._file(key)
+        try:
+            audio = file.read_bytes()
+            os.utime(file)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+            if key in self._sizes:
+                self._sizes.move_to_end(key)
+        return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        file = self._file(key)
+        tmp = file.with_name(f"{file.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(audio)
+        os.replace(tmp, file)
+        with self._lock:
+            self._total += len(audio) - self._sizes.pop(key, 0)
+            self._sizes[key] = len(audio)
+            while self._total > self.max_bytes and len(self._sizes) > 1:
+                old, size = self._sizes.popitem(last=False)
+                self._total -= size
+                self._file(old).unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=None)
+def _cache(path: str, max_bytes: int) -> AudioCache:
+    return AudioCache(path, max_bytes)
+
+
+def get_cache(config: dict) -> AudioCache | None:
+    """Shared cache for `elevenlabs.cache`, or None when disabled. Each backend gets its own directory."""
+    eleven_cfg = config.get("elevenlabs", {}) or {}
+    cache_cfg = eleven_cfg.get("cache", {}) or {}
+    if not cache_cfg.get("enabled", False):
+        return None
+    path = Path(cache_cfg.get("path", ".cache/tts")) / eleven_cfg.get("backend", "elevenlabs")
+    return _cache(str(path), int(cache_cfg.get("max_mb", 500) * 1024 * 1024))
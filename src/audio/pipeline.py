@@ -0,0 +1,107 @@
+"""Audio pipeline: synthesize utterances ahead of playback so speaking never blocks the caller."""
+
+import contextvars
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import perf
+
+from .cache import get_cache
+from .tts import get_backend, prepare_text, split_sentences, synthesize_chunk, voice_params
+
+
+class AudioPipeline:
+    """
+    `say()` splits an utterance into sentence chunks, queues them and returns at once.
+    A synthesis pool works on queued chunks concurrently, ahead of playback; one playback
+    thread plays chunks in the order they were said. A long utterance starts playing once its
+    first sentence is ready, while the rest is still being synthesized (or read from the audio
+    cache). At most `max_ahead` chunks are synthesized before being played (bounds memory and
+    wasted synthesis).
+
+    Call `drain()` to wait for everything said so far to finish playing, `close()` to stop.
+    """
+
+    def __init__(self, config: dict, backend=None) -> None:
+        eleven_cfg = config.get("elevenlabs", {}) or {}
+        self.config = config
+        self.backend = backend or get_backend(config)
+        self.cache = get_cache(config)
+        self.chunk_chars = eleven_cfg.get("chunk_chars", 300)
+        self.max_ahead = max(1, eleven_cfg.get("max_ahead", 6))
+        self.failed = 0  # chunks that could not be synthesized or played (skipped, never fatal)
+        self._synth = ThreadPoolExecutor(
+            max_workers=eleven_cfg.get("synthesis_workers", 3), thread_name_prefix="tts-synth"
+        )
+        self._queue: queue.Queue[tuple | None] = queue.Queue()  # (synthesis, context, role, chars)
+        self._said = 0  # chunks queued
+        self._say_lock = threading.Lock()  # say() may be called from several threads
+        self._played = 0  # chunks done playing (or failed)
+        self._progress = threading.Condition()
+        self._player = threading.Thread(target=self._play_loop, name="tts-play", daemon=True)
+        self._player.start()
+
+    def say(self, text: str, role: str = "narrator") -> None:
+        """
+        Queue text to be spoken in `role`'s voice after everything said before it. Thread-safe: an
+        utterance's chunks stay together, and each chunk's sequence number matches its queue position
+        (a chunk synthesized out of turn could otherwise wait for a slot that never frees).
+        """
+        text = prepare_text(text, self.config)
+        if not text:
+            return
+        params = voice_params(self.config, role)
+        with self._say_lock:
+            for chunk in split_sentences(text, self.chunk_chars):
+                seq = self._said
+                self._said += 1
+                # The caller's context (pair, for traces) follows the chunk through synthesis and playback
+                future = self._synth.submit(contextvars.copy_context().run, self._synthesize, seq, chunk, params)
+                self._queue.put((future, contextvars.copy_context(), role, len(chunk)))
+
+    def _synthesize(self, seq: int, text: str, params: dict) -> bytes:
+        # Wait for a slot: the chunk about to play always has one, so this cannot deadlock
+        with self._progress:
+            self._progress.wait_for(lambda: seq < self._played + self.max_ahead)
+        return synthesize_chunk(self.backend, text, params, self.cache)
+
+    def _play_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            future, context, role, chars = item
+            failed = False
+            try:
+                context.run(self._play, future.result(), role, chars)
+            except Exception:
+                failed = True
+            finally:
+                with self._progress:  # guards the counters, read from other threads
+                    self._played += 1
+                    self.failed += failed
+                    self._progress.notify_all()
+                self._queue.task_done()
+
+    def _play(self, audio: bytes, role: str, chars: int) -> None:
+        with perf.span("tts play", "tts", role=role, chars=chars):
+            self.backend.play(audio)
+
+    def drain(self) -> None:
+        """Wait until everything said so far has been played."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Play what is queued, then stop the workers."""
+        self.drain()
+        self._queue.put(None)
+        self._player.join()
+        self._synth.shutdown()
+
+    def __enter__(self) -> "AudioPipeline":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
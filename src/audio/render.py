@@ -0,0 +1,61 @@
+"""Offline rendering: synthesize whole episodes to audio files, no playback."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from .cache import audio_key, get_cache
+from .tts import get_backend, prepare_text, split_sentences, synthesize_chunk, voice_params
+
+
+def file_extension(output_format: str) -> str:
+    """mp3_44100_128 -> mp3. MP3 frames (and raw PCM/μ-law samples) can be concatenated as-is."""
+    codec = output_format.split("_", 1)[0]
+    return {"mp3": "mp3", "pcm": "pcm", "opus": "opus"}.get(codec, "raw")
+
+
+def render_episodes(
+    episodes: dict[str, list[tuple[str, str]]],
+    config: dict,
+    out_dir: str | Path,
+    *,
+    workers: int | None = None,
+    backend=None,
+) -> dict[str, Path]:
+    """
+    Write each episode ({name: [(role, text), ...]}) to `out_dir/<name>.<ext>`.
+    Every sentence chunk of every episode is synthesized concurrently (identical chunks once,
+    cached chunks read from disk); each file is the in-order concatenation of its chunks.
+
+    Returns:
+        {name: path} in the order given.
+    """
+    eleven_cfg = config.get("elevenlabs", {}) or {}
+    backend = backend or get_backend(config)
+    cache = get_cache(config)
+    chunk_chars = eleven_cfg.get("chunk_chars", 300)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    ext = file_extension(eleven_cfg.get("output_format", "mp3_44100_128"))
+
+    pool = ThreadPoolExecutor(max_workers=workers or eleven_cfg.get("synthesis_workers", 3), thread_name_prefix="tts-render")
+    futures: dict[str, Future] = {}  # audio_key -> synthesis, shared by repeated chunks
+    plan: dict[str, list[Future]] = {}
+    with pool:
+        for name, lines in episodes.items():
+            plan[name] = []
+            for role, text in lines:
+                params = voice_params(config, role)
+                for chunk in split_sentences(prepare_text(text, config), chunk_chars):
+                    key = audio_key(chunk, **params)
+                    if key not in futures:
+                        futures[key] = pool.submit(synthesize_chunk, backend, chunk, params, cache)
+                    plan[name].append(futures[key])
+
+        paths: dict[str, Path] = {}
+        for name, parts in plan.items():
+            path = out_dir / f"{name}.{ext}"
+            with open(path, "wb") as f:
+                for part in parts:
+                    f.write(part.result())
+            paths[name] = path
+    return paths
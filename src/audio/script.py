@@ -0,0 +1,59 @@
+"""
+What gets spoken, as (role, text) lines. Shared by live playback and offline rendering, so a
+replayed pair produces the same text (and hits the same cached audio). Builders take schema
+objects or their dict form (as stored in eval traces).
+"""
+
+
+def _get(obj, key: str):
+    return obj.get(key) if isinstance(obj, dict) else getattr(obj, key, None)
+
+
+def intro_line(claim: str, truth: str) -> str:
+    return f"The claim is: {claim} The truth states: {truth}"
+
+
+def facts_line(facts) -> str:
+    facts_text = " ".join(
+        f"Fact {i}: {_get(f, 'category')}. Claim says {_get(f, 'claim_says') or 'nothing'}. "
+        f"Truth says {_get(f, 'truth_says') or 'nothing'}. {_get(f, 'note') or ''}"
+        for i, f in enumerate(facts, 1)
+    )
+    return f"Here are the extracted facts. {facts_text}"
+
+
+def vote_line(name: str, output) -> str:
+    role_name = name.replace("_", " ").title()
+    return f"The {role_name} votes {_get(output, 'verdict')}. Their reasoning: {_get(output, 'reasoning')}"
+
+
+def turn_line(speaker: str, content: str) -> str:
+    return f"{speaker} says: {content}"
+
+
+def verdict_line(verdict) -> str:
+    rubric_parts = " ".join(
+        f"{_get(ar, 'axis')}: {'Yes' if _get(ar, 'passed') else 'No'}" for ar in _get(verdict, "axis_results") or []
+    )
+    text = f"Applying the rubric. {rubric_parts}. The verdict is {_get(verdict, 'verdict')}. Summary: {_get(verdict, 'summary')}"
+    if _get(verdict, "minimal_edit"):
+        text += f" Minimal edit suggestion: {_get(verdict, 'minimal_edit')}"
+    return text
+
+
+def episode(trace: dict) -> list[tuple[str, str]]:
+    """A pair's session in the order it is spoken live, from an eval trace."""
+    lines = [("narrator", intro_line(trace.get("claim", ""), trace.get("truth", "")))]
+    facts = (trace.get("fact_frame") or {}).get("facts")
+    if facts:
+        lines.append(("narrator", facts_line(facts)))
+    lines += [(v["agent"], vote_line(v["agent"], v)) for v in trace.get("initial_votes") or []]
+    lines += [
+        (t["speaker"], turn_line(t["speaker"], t["content"].strip()))
+        for t in trace.get("debate_transcript") or []
+        if (t.get("content") or "").strip()
+    ]
+    lines += [(v["agent"], vote_line(v["agent"], v)) for v in trace.get("revote_votes") or []]
+    if trace.get("foreperson"):
+        lines.append(("foreperson", verdict_line(trace["foreperson"])))
+    return lines
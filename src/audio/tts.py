@@ -1,26 +1,42 @@
 """ElevenLabs text-to-speech for the jury pipeline."""
 
 import os
-from typing import Optional
+import re
+from functools import lru_cache
 
-from elevenlabs.client import ElevenLabs
-from elevenlabs.play import play
+import perf
+
+from .backends import ElevenLabsBackend, FakeBackend
+from .cache import AudioCache, audio_key, get_cache
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def _api_key(config: dict) -> str | None:
+    eleven_cfg = config.get("elevenlabs", {}) or {}
+    return os.environ.get("ELEVENLABS_API_KEY") or eleven_cfg.get("api_key")
 
 
 def is_available(config: dict) -> bool:
-    """True if TTS is enabled and API key is set."""
+    """True if TTS is enabled and API key is set (the fake backend needs no key)."""
     eleven_cfg = config.get("elevenlabs", {}) or {}
     if not eleven_cfg.get("enabled", False):
         return False
-    api_key = os.environ.get("ELEVENLABS_API_KEY") or eleven_cfg.get("api_key")
-    return bool(api_key)
+    return eleven_cfg.get("backend", "elevenlabs") == "fake" or bool(_api_key(config))
+
 
+@lru_cache(maxsize=None)
+def _backend(name: str, api_key: str | None):
+    """One backend (and so one HTTP client) per process, shared by every utterance."""
+    if name == "fake":
+        return FakeBackend()
+    return ElevenLabsBackend(api_key)
 
-def _get_client(config: dict):
-    """Create ElevenLabs client."""
+
+def get_backend(config: dict):
+    """Pooled backend for `elevenlabs.backend`: "elevenlabs" (default) or "fake"."""
     eleven_cfg = config.get("elevenlabs", {}) or {}
-    api_key = os.environ.get("ELEVENLABS_API_KEY") or eleven_cfg.get("api_key")
-    return ElevenLabs(api_key=api_key)
+    return _backend(eleven_cfg.get("backend", "elevenlabs"), _api_key(config))
 
 
 def _get_voice(config: dict, role: str) -> str:
@@ -31,38 +47,79 @@ def _get_voice(config: dict, role: str) -> str:
     return voice_id
 
 
+def voice_params(config: dict, role: str) -> dict:
+    """voice_id, model_id and output_format for one utterance."""
+    eleven_cfg = config.get("elevenlabs", {}) or {}
+    return {
+        "voice_id": _get_voice(config, role),
+        "model_id": eleven_cfg.get("model_id", "eleven_multilingual_v2"),
+        "output_format": eleven_cfg.get("output_format", "mp3_44100_128"),
+    }
+
+
+def prepare_text(text: str, config: dict) -> str:
+    """Strip, and truncate very long text to avoid timeout/cost (e.g. 3000 chars ~ 3-4 min speech)."""
+    text = (text or "").strip()
+    max_chars = config.get("elevenlabs", {}).get("max_chars_per_utterance", 2000)
+    if len(text) > max_chars:
+        text = text[: max_chars - 3].rsplit(".", 1)[0] + "..."
+    return text
+
+
+def split_sentences(text: str, max_chars: int) -> list[str]:
+    """
+    Split text into chunks of whole sentences up to `max_chars` each. The first sentence is
+    always its own chunk, so playback can start as soon as it has been synthesized.
+    """
+    sentences = [s for s in _SENTENCE_END.split(text) if s]
+    if not sentences:
+        return []
+    chunks = [sentences[0]]
+    current = ""
+    for sentence in sentences[1:]:
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = ""
+        current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def synthesize_chunk(backend, text: str, params: dict, cache: AudioCache | None = None) -> bytes:
+    """Audio for text with voice_params `params`: from the cache, else streamed from the backend and cached."""
+    key = audio_key(text, **params) if cache is not None else None
+    if key is not None and (audio := cache.get(key)) is not None:
+        return audio
+    with perf.span("tts synth", "tts", voice=params["voice_id"], chars=len(text)):
+        audio = b"".join(backend.synthesize(text, **params))
+    if key is not None:
+        cache.put(key, audio)
+    return audio
+
+
+def synthesize(text: str, config: dict, role: str = "narrator") -> bytes:
+    """Synthesize text to audio bytes (cached when `elevenlabs.cache` is enabled)."""
+    return synthesize_chunk(get_backend(config), text, voice_params(config, role), get_cache(config))
+
+
 def speak(
     text: str,
     config: dict,
     role: str = "narrator",
 ) -> bool:
     """
-    Speak text via ElevenLabs. Returns True if spoken, False if skipped.
-    Truncates very long text to avoid timeout/cost.
+    Speak text and wait for playback to finish. Returns True if spoken, False if skipped.
+    For speech that does not block the caller, use AudioPipeline.
     """
-    if not text or not text.strip():
-        return False
     if not is_available(config):
         return False
-
-    # Truncate to avoid very long generation (e.g. 3000 chars ~ 3-4 min speech)
-    max_chars = config.get("elevenlabs", {}).get("max_chars_per_utterance", 2000)
-    if len(text) > max_chars:
-        text = text[: max_chars - 3].rsplit(".", 1)[0] + "..."
-
-    eleven_cfg = config.get("elevenlabs", {}) or {}
-    model_id = eleven_cfg.get("model_id", "eleven_multilingual_v2")
-    voice_id = _get_voice(config, role)
+    text = prepare_text(text, config)
+    if not text:
+        return False
 
     try:
-        client = _get_client(config)
-        audio = client.text_to_speech.convert(
-            text=text.strip(),
-            voice_id=voice_id,
-            model_id=model_id,
-            output_format="mp3_44100_128",
-        )
-        play(audio)
+        get_backend(config).play(synthesize(text, config, role))
         return True
     except Exception:
         return False
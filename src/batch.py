@@ -0,0 +1,57 @@
+"""
+Bulk mode for overnight corpus runs: judge every selected pair through a provider batch
+interface, one stage at a time across all pairs (see src/bulk/run.py). Batch pricing is
+discounted and has no rate limits to wait on; each wave can take up to the completion window.
+
+  uv run python src/batch.py                            # pairs from data.*, OpenAI Batch API
+  uv run python src/batch.py --pairs 0,5,9 --executor local --out results.jsonl
+
+Rerun the same command to resume: answers already on file in bulk.dir are reused.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from config import config_fingerprint, load_config
+from data import load_pairs
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Judge pairs stage by stage through a provider batch interface")
+    parser.add_argument("--config", type=str, default=None, help="Path to config YAML. Default: config.yaml")
+    parser.add_argument("--pairs", type=str, default=None, help="Comma-separated pair IDs (overrides data.pair_ids)")
+    parser.add_argument("--executor", choices=["openai", "local"], default=None, help="Default: bulk.executor")
+    parser.add_argument("--dir", type=str, default=None, help="Run directory. Default: bulk.dir/<config fingerprint>")
+    parser.add_argument("--out", type=str, default=None, help="Results file (JSON lines). Default: <run dir>/results.jsonl")
+    parser.add_argument("--no-cost", action="store_true", help="Skip pricing the token usage")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    if args.pairs:
+        config["data"] = config.get("data", {}) | {"pair_ids": [int(x) for x in args.pairs.split(",")]}
+    pairs = load_pairs(config)
+    directory = Path(args.dir) if args.dir else PROJECT_ROOT / config.get("bulk", {}).get("dir", "eval/bulk") / config_fingerprint(config)
+
+    from bulk import BulkRun, make_executor
+
+    run = BulkRun(config, directory, make_executor(config, args.executor), track_cost=not args.no_cost)
+    result = run.run(pairs)
+
+    out = Path(args.out) if args.out else directory / "results.jsonl"
+    records = result.records()
+    with open(out, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(record) + "\n" for record in records)
+    tokens, cost = sum(result.tokens.values()), sum(result.cost_usd.values())
+    print(f"Done: {len(result.states)} judged, {len(result.errors)} failed")
+    print(f"  {result.waves} waves, {result.requests} requests sent; {tokens:,} tokens, ${cost:.4f}")
+    print(f"  Results: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+from .collect import Collector, Deferred, RequestFailed
+from .executors import LocalExecutor, OpenAIBatchExecutor, make_executor
+from .run import BulkResult, BulkRun
+
+__all__ = [
+    "Collector",
+    "Deferred",
+    "RequestFailed",
+    "LocalExecutor",
+    "OpenAIBatchExecutor",
+    "make_executor",
+    "BulkResult",
+    "BulkRun",
+]
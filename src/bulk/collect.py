@@ -0,0 +1,152 @@
+"""Turn LLM calls into batch requests, and answer them from batch results."""
+
+import hashlib
+import json
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable
+
+from agents.llm import call_handler, client_spec, client_params, invoke_samples, send
+
+URL = "/v1/chat/completions"
+
+
+class Deferred(Exception):
+    """A call whose request is queued for the next batch; the pair resumes once it is answered."""
+
+
+class RequestFailed(RuntimeError):
+    """The batch answered a request with an error (the pair fails)."""
+
+
+def request_body(model: str, temperature: float, schema: type | None, prompt: str, max_tokens: int | None = None) -> dict:
+    """Chat completions body for one call, as the pooled client would send it."""
+    body = {"model": model, "temperature": temperature, "messages": [{"role": "user", "content": prompt}]}
+    if max_tokens:
+        body["max_tokens"] = max_tokens
+    if schema is not None:
+        from openai.lib._parsing._completions import type_to_response_format_param
+
+        body["response_format"] = type_to_response_format_param(schema)
+    return body
+
+
+def custom_id(body: dict, offset: int = 0) -> str:
+    """Request id in the batch file: identical requests (from any pair) share one line."""
+    payload = json.dumps([body, offset] if offset else body, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def usage(output: dict) -> tuple[str, int, int]:
+    """(model, prompt tokens, completion tokens) of one batch output line."""
+    body = (output.get("response") or {}).get("body") or {}
+    tokens = body.get("usage") or {}
+    return body.get("model", ""), tokens.get("prompt_tokens") or 0, tokens.get("completion_tokens") or 0
+
+
+def _content(output: dict, message: dict) -> str:
+    if message.get("content") is None:
+        raise RequestFailed(f"batch request {output.get('custom_id')}: no content ({message.get('refusal')})")
+    return message["content"]
+
+
+def _answer(output: dict, schema: type | None, on_field: Callable[[str, Any], None] | None, n: int | None):
+    response = output.get("response") or {}
+    if output.get("error") or response.get("status_code") != 200:
+        error = output.get("error") or (response.get("body") or {}).get("error") or response
+        raise RequestFailed(f"batch request {output.get('custom_id')} failed: {error}")
+    choices = response["body"]["choices"]
+    if n is not None:
+        return [schema.model_validate_json(_content(output, c["message"])) for c in choices]
+    message = choices[0]["message"]
+    content = message.get("content")
+    if schema is None:
+        from langchain_core.messages import AIMessage
+
+        return AIMessage(content=content or "")
+    result = schema.model_validate_json(_content(output, message))
+    if on_field is not None:
+        for key in type(result).model_fields:
+            on_field(key, getattr(result, key))
+    return result
+
+
+class Collector:
+    """
+    Bulk-mode call handler. A call already answered by a batch returns the parsed answer; any
+    other call is queued as a batch line and raises Deferred, which stops its pair at that node.
+    Parallel calls of one node (a vote's agents) are all queued before the node fails.
+    Components on their own backend (components.*.base_url, e.g. a local server) are not
+    batched: they are called directly and their answers kept for the replays.
+    """
+
+    def __init__(self) -> None:
+        self.results: dict[str, dict] = {}  # custom_id -> batch output line
+        self.pending: dict[str, dict] = {}  # custom_id -> batch input line
+        self.direct: dict[str, Any] = {}  # custom_id -> answer of a call sent directly
+        self.owner: dict[str, Any] = {}  # custom_id -> first pair to ask for it (usage is billed to it)
+        self.pair = None  # pair being driven (set by the caller)
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        llm,
+        prompt: str,
+        config: dict,
+        *,
+        on_field: Callable[[str, Any], None] | None = None,
+        n: int | None = None,
+        offset: int = 0,
+    ):
+        model, temperature, schema = client_params(llm)
+        spec = client_spec(llm)
+        body = request_body(model, temperature, schema, prompt, spec.get("max_tokens"))
+        if n is not None:
+            body["n"] = n
+        cid = custom_id(body, offset)
+        if spec.get("base_url"):
+            if cid not in self.direct:
+                token = call_handler.set(None)  # send this one for real
+                try:
+                    self.direct[cid] = (
+                        send(llm, prompt, config, on_field=on_field) if n is None
+                        else invoke_samples(llm, prompt, config, n, offset=offset)
+                    )
+                finally:
+                    call_handler.reset(token)
+            return self.direct[cid]
+        output = self.results.get(cid)
+        with self._lock:
+            self.owner.setdefault(cid, self.pair)
+            if output is None:
+                self.pending.setdefault(cid, {"custom_id": cid, "method": "POST", "url": URL, "body": body})
+        if output is None:
+            raise Deferred(cid)
+        return _answer(output, schema, on_field, n)
+
+    @contextmanager
+    def active(self):
+        """Route every LLM call made in this context (and threads copying it) to the collector."""
+        token = call_handler.set(self)
+        try:
+            yield self
+        finally:
+            call_handler.reset(token)
+
+    def take(self) -> list[dict]:
+        """Queued requests for the next batch (and clear the queue)."""
+        with self._lock:
+            lines, self.pending = list(self.pending.values()), {}
+        return lines
+
+    def load(self, path: Path) -> int:
+        """Add the answers in a batch output file; returns how many lines it had."""
+        n = 0
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    output = json.loads(line)
+                    self.results[output["custom_id"]] = output
+                    n += 1
+        return n
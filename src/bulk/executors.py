@@ -0,0 +1,114 @@
+"""Batch executors: run a batch input file (OpenAI Batch JSONL) and write its output file."""
+
+import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+def _read(path: Path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _write(path: Path, text: str) -> None:
+    # Output files mark a wave as answered, so they only appear once complete
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
+
+
+class OpenAIBatchExecutor:
+    """
+    OpenAI Batch API: upload the input file, create a batch, poll until it ends and download
+    the output and error files. The batch id is saved next to the input, so a rerun after a
+    crash waits for the same batch instead of paying for it twice. Requests missing from an
+    expired batch are simply asked again in the next wave.
+    """
+
+    price_factor = 0.5  # Batch API discount on input and output tokens
+
+    def __init__(self, *, poll_s: float = 60.0, completion_window: str = "24h", print_fn=print) -> None:
+        self.poll_s = poll_s
+        self.completion_window = completion_window
+        self.print_fn = print_fn
+
+    def run(self, input_path: Path, output_path: Path) -> None:
+        from openai import OpenAI
+
+        client = OpenAI()
+        handle = input_path.with_name(input_path.name.replace(".input.jsonl", ".batch.json"))
+        if handle.exists():
+            batch_id = json.loads(handle.read_text(encoding="utf-8"))["id"]
+            self.print_fn(f"  resuming batch {batch_id}")
+        else:
+            with open(input_path, "rb") as f:
+                uploaded = client.files.create(file=f, purpose="batch")
+            batch = client.batches.create(
+                input_file_id=uploaded.id, endpoint="/v1/chat/completions", completion_window=self.completion_window
+            )
+            batch_id = batch.id
+            handle.write_text(json.dumps({"id": batch_id, "input_file_id": uploaded.id}), encoding="utf-8")
+            self.print_fn(f"  submitted batch {batch_id}")
+        while True:
+            batch = client.batches.retrieve(batch_id)
+            if batch.status in ("completed", "failed", "expired", "cancelled"):
+                break
+            counts = batch.request_counts
+            if counts is not None:
+                self.print_fn(f"  {batch.status}: {counts.completed + counts.failed}/{counts.total}")
+            time.sleep(self.poll_s)
+        if batch.status == "failed" and not batch.output_file_id:
+            raise RuntimeError(f"batch {batch_id} failed: {batch.errors}")
+        parts = [client.files.content(f).text for f in (batch.output_file_id, batch.error_file_id) if f]
+        _write(output_path, "".join(p if p.endswith("\n") or not p else p + "\n" for p in parts))
+        self.print_fn(f"  batch {batch_id} {batch.status}")
+
+
+class LocalExecutor:
+    """
+    Stand-in for the Batch API: sends every line of the input file now, to OPENAI_BASE_URL
+    (e.g. eval/stub_openai.py), and writes the output in the Batch API's format. For tests and
+    small runs; it is not discounted.
+    """
+
+    price_factor = 1.0
+
+    def __init__(self, *, concurrency: int = 8, print_fn=print) -> None:
+        self.concurrency = concurrency
+        self.print_fn = print_fn
+
+    def run(self, input_path: Path, output_path: Path) -> None:
+        import openai
+
+        client = openai.OpenAI(max_retries=5)
+
+        def send(line: dict) -> dict:
+            out = {"id": f"batch_req_{uuid.uuid4().hex}", "custom_id": line["custom_id"], "response": None, "error": None}
+            try:
+                completion = client.chat.completions.create(**line["body"])
+            except openai.APIStatusError as e:
+                out["response"] = {"status_code": e.status_code, "request_id": e.request_id, "body": e.body}
+            except openai.OpenAIError as e:
+                out["error"] = {"code": type(e).__name__, "message": str(e)}
+            else:
+                out["response"] = {"status_code": 200, "request_id": completion.id, "body": completion.model_dump()}
+            return out
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="bulk-local") as pool:
+            outputs = list(pool.map(send, _read(input_path)))
+        _write(output_path, "".join(json.dumps(o) + "\n" for o in outputs))
+
+
+def make_executor(config: dict, name: str | None = None, *, print_fn=print):
+    """Executor from config['bulk'] (`name` overrides bulk.executor: openai | local)."""
+    cfg = config.get("bulk", {}) or {}
+    name = name or cfg.get("executor", "openai")
+    if name == "openai":
+        return OpenAIBatchExecutor(
+            poll_s=cfg.get("poll_s", 60.0), completion_window=cfg.get("completion_window", "24h"), print_fn=print_fn
+        )
+    if name == "local":
+        return LocalExecutor(concurrency=cfg.get("local_concurrency", 8), print_fn=print_fn)
+    raise ValueError(f"Unknown bulk executor: {name!r} (openai or local)")
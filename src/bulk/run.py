@@ -0,0 +1,141 @@
+"""Stage-synchronous bulk judging: every pair advances one LLM step per provider batch."""
+
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from service import pair_result
+from workflow.checkpoint import SqliteCheckpointer
+from workflow.graph import build_graph
+from workflow.state import JuryContext, make_input
+
+from .collect import Collector, Deferred, usage
+
+
+@dataclass
+class BulkResult:
+    """Final states and per-pair usage of a bulk run."""
+
+    states: dict = field(default_factory=dict)  # pair id -> final state
+    errors: dict = field(default_factory=dict)  # pair id -> error
+    tokens: Counter = field(default_factory=Counter)  # pair id -> tokens
+    cost_usd: Counter = field(default_factory=Counter)  # pair id -> USD at the executor's pricing
+    waves: int = 0
+    requests: int = 0
+    finished_s: dict = field(default_factory=dict)  # pair id -> seconds from start until done
+
+    def records(self) -> list[dict]:
+        """One JSON-safe record per pair (as work.py export writes them)."""
+        out = [
+            pair_result(pid, state, self.finished_s[pid])
+            | {"tokens": self.tokens[pid], "cost_usd": round(self.cost_usd[pid], 6)}
+            for pid, state in self.states.items()
+        ]
+        return out + [{"id": pid, "error": error} for pid, error in self.errors.items()]
+
+
+def _price(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    from langchain_community.callbacks.openai_info import TokenType, get_openai_token_cost_for_model
+
+    try:
+        return get_openai_token_cost_for_model(model, prompt_tokens) + get_openai_token_cost_for_model(
+            model, completion_tokens, token_type=TokenType.COMPLETION
+        )
+    except ValueError:  # not in langchain_community's price table
+        return 0.0
+
+
+class BulkRun:
+    """
+    Judges a corpus level by level. Each wave drives every unfinished pair through the graph
+    (from its in-memory checkpoint) until each one needs an LLM answer it does not have yet;
+    those requests go into one batch file for the executor, and the next wave resumes with the
+    answers. So all parses go in the first batch, all initial votes in the second, then the
+    debate turns of split pairs (next to the revotes of unanimous ones), and so on.
+
+    Answers are kept as batch output files in `directory`. Replaying a pair from them is
+    deterministic and costs no requests, so rerunning after a crash (or with more pairs)
+    only sends what is missing; the OpenAI executor also reattaches to a batch in progress.
+    Budgets and the `checkpoint` section do not apply in bulk mode.
+    """
+
+    def __init__(self, config: dict, directory: str | Path, executor, *, track_cost: bool = True, print_fn=print) -> None:
+        self.config = config | {"interactive": False}
+        self.directory = Path(directory)
+        self.executor = executor
+        self.track_cost = track_cost
+        self.print_fn = print_fn
+        self.graph = build_graph(SqliteCheckpointer(":memory:"))
+        self.collector = Collector()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.answered = 0
+        for path in sorted(self.directory.glob("wave-*.output.jsonl")):
+            self.answered += self.collector.load(path)
+
+    def _advance(self, pair: dict, result: BulkResult, started: float) -> str | None:
+        """Run one pair as far as the known answers go: None when it finished or failed, else the node it waits in."""
+        pid = pair["id"]
+        thread = {"configurable": {"thread_id": f"bulk-{pid}"}}
+        inputs = None if self.graph.get_state(thread).values else make_input(pair["claim"], pair["truth"])
+        self.collector.pair = pid
+        try:
+            result.states[pid] = self.graph.invoke(
+                inputs, thread, context=JuryContext(config=self.config), durability="sync"
+            )
+            result.finished_s[pid] = time.perf_counter() - started
+        except Deferred:
+            return (self.graph.get_state(thread).next or ("?",))[0]
+        except Exception as e:
+            result.errors[pid] = f"{type(e).__name__}: {e}"
+        return None
+
+    def run(self, pairs: list[dict]) -> BulkResult:
+        result = BulkResult()
+        waiting = {pair["id"]: pair for pair in pairs}
+        started = time.perf_counter()
+        self.print_fn(f"Bulk run: {len(pairs)} pairs in {self.directory} ({self.answered} answers on file)")
+        while waiting:
+            nodes = Counter()
+            with self.collector.active():
+                for pid, pair in list(waiting.items()):
+                    node = self._advance(pair, result, started)
+                    if node is None:
+                        del waiting[pid]
+                    else:
+                        nodes[node] += 1
+            requests = self.collector.take()
+            if not requests:
+                break
+            wave = len(list(self.directory.glob("wave-*.output.jsonl"))) + 1
+            stages = ", ".join(f"{node} {n}" for node, n in nodes.items())
+            self.print_fn(f"Wave {wave}: {len(requests)} requests for {len(waiting)} pairs ({stages})")
+            input_path = self.directory / f"wave-{wave:03d}.input.jsonl"
+            output_path = self.directory / f"wave-{wave:03d}.output.jsonl"
+            with open(input_path, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(line) + "\n" for line in requests)
+            t0 = time.perf_counter()
+            self.executor.run(input_path, output_path)
+            answered = self.collector.load(output_path)
+            self.print_fn(f"  {answered} answers in {time.perf_counter() - t0:.1f}s")
+            if not any(line["custom_id"] in self.collector.results for line in requests):
+                raise RuntimeError(f"wave {wave} answered none of its requests; see {output_path}")
+            result.waves += 1
+            result.requests += len(requests)
+        for pid in waiting:  # nothing left to ask but not finished: should not happen
+            result.errors[pid] = "pair stopped without pending requests"
+        self._bill(result)
+        return result
+
+    def _bill(self, result: BulkResult) -> None:
+        """Usage per pair, from the answers each pair was the first to ask for."""
+        for cid, pid in self.collector.owner.items():
+            output = self.collector.results.get(cid)
+            if output is None:
+                continue
+            model, prompt_tokens, completion_tokens = usage(output)
+            result.tokens[pid] += prompt_tokens + completion_tokens
+            if self.track_cost:
+                result.cost_usd[pid] += _price(model, prompt_tokens, completion_tokens) * self.executor.price_factor
+
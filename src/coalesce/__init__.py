@@ -0,0 +1,4 @@
+from .singleflight import SingleFlight
+from .keys import normalize_text, pair_key, prompt_key
+
+__all__ = ["SingleFlight", "normalize_text", "pair_key", "prompt_key"]
@@ -0,0 +1,24 @@
+"""Stable keys for deduplicating pairs and LLM calls."""
+
+import hashlib
+import re
+import unicodedata
+
+from config import config_fingerprint
+
+
+def normalize_text(text: str) -> str:
+    """NFKC, collapse whitespace, drop the space the CSVs put before punctuation ("Amharic ," → "Amharic,")."""
+    text = unicodedata.normalize("NFKC", text or "")
+    text = re.sub(r"\s+", " ", text).strip()
+    return re.sub(r" ([,.;:!?%)\]])", r"\1", text)
+
+
+def pair_key(claim: str, truth: str, config: dict) -> str:
+    """Hash of the normalised pair plus the config fingerprint: equal keys give equal verdicts."""
+    payload = "\x1f".join([normalize_text(claim), normalize_text(truth), config_fingerprint(config)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def prompt_key(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
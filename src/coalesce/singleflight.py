@@ -0,0 +1,69 @@
+"""Singleflight: concurrent callers with the same key share one in-flight computation."""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    The first caller for a key (the leader) runs the work; callers arriving while it is
+    in flight wait on the same Future. Keys are forgotten once the work finishes, so
+    later callers run it again. Counts calls and shared calls for the dedup ratio.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def claim(self, key: Hashable) -> tuple[Future, bool]:
+        """Future for `key` and whether the caller is the leader (and must resolve it)."""
+        with self._lock:
+            self.calls += 1
+            future = self._inflight.get(key)
+            if future is not None:
+                self.shared += 1
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    def resolve(self, key: Hashable, future: Future, result=None, error: BaseException | None = None) -> None:
+        """Leader only: publish the result (or error) to every waiter and forget the key."""
+        with self._lock:
+            self._inflight.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def note_shared(self) -> None:
+        """Count a call answered from an earlier result without going through claim()."""
+        with self._lock:
+            self.calls += 1
+            self.shared += 1
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run fn() once per concurrent key; waiters block and get the leader's result."""
+        future, leader = self.claim(key)
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            self.resolve(key, future, error=e)
+            raise
+        self.resolve(key, future, result)
+        return result
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Fraction of calls served by another caller's work."""
+        return self.shared / self.calls if self.calls else 0.0
+
+    def stats(self) -> dict:
+        return {"calls": self.calls, "shared": self.shared, "dedup_ratio": self.dedup_ratio}
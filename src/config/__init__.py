@@ -1,3 +1,4 @@
-from .loader import load_config
+from .loader import load_config, validate_config
+from .fingerprint import config_fingerprint
 
-__all__ = ["load_config"]
+__all__ = ["load_config", "validate_config", "config_fingerprint"]
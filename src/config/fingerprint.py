@@ -0,0 +1,21 @@
+"""Fingerprint of the config sections (and prompts) that can change a verdict."""
+
+import hashlib
+import json
+
+from prompts import prompts_version
+
+# Sections that only affect input selection, output or presentation (corpus: which truth a claim
+# gets, and the truth is part of every pair key)
+_IGNORED = {"data", "interactive", "eval", "elevenlabs", "service", "coalesce", "checkpoint", "jobs", "bulk", "corpus"}
+
+
+def config_fingerprint(config: dict) -> str:
+    """
+    Short stable hash of the verdict-relevant config (agents, debate, rubric, components, ...)
+    and of the prompt texts, so an edited prompt does not reuse checkpoints or stored verdicts.
+    """
+    relevant = {k: v for k, v in sorted(config.items()) if k not in _IGNORED}
+    relevant["_prompts"] = prompts_version()
+    payload = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
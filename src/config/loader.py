@@ -9,8 +9,27 @@ def _default_config_path() -> Path:
     return Path(__file__).resolve().parent.parent.parent / "config.yaml"
 
 
+def validate_config(config: dict) -> dict:
+    """
+    Reject settings that would run but not do what they say: self-consistency `samples` must be
+    an odd k >= 1 (a tie has no majority), and k > 1 needs agents temperature > 0 (else the
+    samples are identical completions). Returns `config`.
+    """
+    temperature = ((config.get("components") or {}).get("agents") or {}).get("temperature", 0.2)
+    for agent in config.get("agents") or []:
+        k = agent.get("samples", 1)
+        if not isinstance(k, int) or isinstance(k, bool) or k < 1 or k % 2 == 0:
+            raise ValueError(f"agents[{agent.get('name')}].samples must be an odd integer >= 1, got {k!r}")
+        if k > 1 and not temperature:
+            raise ValueError(
+                f"agents[{agent.get('name')}].samples = {k} needs components.agents.temperature > 0"
+                " (at temperature 0 every sample is the same completion)"
+            )
+    return config
+
+
 def load_config(path: str | Path | None = None) -> dict:
-    """Load config from YAML. If path is None, uses config.yaml in project root."""
+    """Load config from YAML (checked with validate_config). If path is None, uses config.yaml in project root."""
     if path is None:
         path = _default_config_path()
     else:
@@ -18,4 +37,4 @@ def load_config(path: str | Path | None = None) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"Config not found: {path}")
     with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return validate_config(yaml.safe_load(f))
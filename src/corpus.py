@@ -0,0 +1,47 @@
+"""
+Reference corpus index for claim-only mode (data.truth_col: null): build/update it, or look
+claims up in it.
+
+  uv run python src/corpus.py sync                      # index corpus.sources (only what changed)
+  uv run python src/corpus.py search "Claim text" -k 5  # best matching statements, with timing
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from config import load_config
+from retrieval import open_index
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the reference corpus index")
+    parser.add_argument("--config", type=str, default=None, help="Path to config YAML. Default: config.yaml")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("sync", help="Index new or changed sources, drop removed ones")
+    search = sub.add_parser("search", help="Best matching statements for a claim")
+    search.add_argument("claim", type=str)
+    search.add_argument("-k", type=int, default=None, help="Statements to return. Default: corpus.top_k")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    t0 = time.perf_counter()
+    index = open_index(config, PROJECT_ROOT)
+    if args.command == "sync":
+        print(f"Corpus index {index.path}: {index.n_docs} statements ({time.perf_counter() - t0:.2f}s)")
+        return
+    k = args.k or (config.get("corpus") or {}).get("top_k", 3)
+    t0 = time.perf_counter()
+    hits = index.search(args.claim, k)
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+    for i, hit in enumerate(hits, 1):
+        source = Path(hit.source)
+        source = source.relative_to(PROJECT_ROOT) if source.is_relative_to(PROJECT_ROOT) else source
+        print(f"{i}. [{hit.score:.2f}] {source}:{hit.row}\n   {hit.text}")
+    print(f"{len(hits)} of {index.n_docs} statements in {elapsed_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,8 +14,11 @@ def load_pairs(config: dict) -> list[dict[str, str]]:
     """
     Load claim/truth pairs from CSV based on config.
 
+    With data.truth_col null (claim-only), each claim's truth is retrieved from the corpus
+    index (config['corpus']) and the candidates are listed under "matches".
+
     Returns:
-        List of {"claim": str, "truth": str}
+        List of {"id": int, "claim": str, "truth": str}
     """
     data_cfg = config.get("data", {})
     source = data_cfg.get("source", "")
@@ -49,5 +52,12 @@ def load_pairs(config: dict) -> list[dict[str, str]]:
     for i in pair_ids:
         if i >= len(rows):
             raise IndexError(f"pair_ids index {i} out of range (max {len(rows) - 1})")
-        result.append({"id": i, "claim": rows[i][claim_col], "truth": rows[i][truth_col]})
+        pair = {"id": i, "claim": rows[i][claim_col]}
+        if truth_col is not None:
+            pair["truth"] = rows[i][truth_col]
+        result.append(pair)
+    if truth_col is None:
+        from retrieval import match_truths
+
+        return match_truths(result, config, _project_root())
     return result
@@ -0,0 +1,5 @@
+# jobs.worker (the LLM stack) is not imported here, so submit / status stay fast: from jobs.worker import Worker
+from .workqueue import WorkQueue, open_queue, worker_id
+from .status import print_status
+
+__all__ = ["WorkQueue", "open_queue", "worker_id", "print_status"]
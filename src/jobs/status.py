@@ -0,0 +1,86 @@
+"""Progress and throughput of the work queue (work.py status)."""
+
+import time
+
+from .workqueue import DONE, FAILED, LEASED, QUEUED, WorkQueue
+
+
+def _duration(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def print_status(queue: WorkQueue, batch: str | None = None, *, window_s: float = 60.0, print_fn=print) -> None:
+    """Per-batch progress, recent and overall throughput, ETA, live workers and top errors."""
+    args = (batch,) if batch else ()
+    batches = queue.query(
+        "SELECT b.batch, b.fingerprint, COUNT(j.job_id) AS total,"
+        f" SUM(j.status = '{QUEUED}') AS queued, SUM(j.status = '{LEASED}') AS leased,"
+        f" SUM(j.status = '{DONE}') AS done, SUM(j.status = '{FAILED}') AS failed"
+        " FROM batches b LEFT JOIN jobs j ON j.batch = b.batch"
+        f" {'WHERE b.batch = ?' if batch else ''}"
+        " GROUP BY b.batch ORDER BY b.created_at",
+        args,
+    )
+    print_fn("=" * 78)
+    print_fn(f"WORK QUEUE: {queue.path}")
+    print_fn("=" * 78)
+    if not batches:
+        print_fn("  No batches. Submit one with: uv run python src/work.py submit")
+        return
+    print_fn(f"  {'batch':24s} {'config':16s} {'total':>7s} {'queued':>7s} {'leased':>7s} {'done':>7s} {'failed':>7s} {'progress':>9s}")
+    for b in batches:
+        finished = (b["done"] or 0) + (b["failed"] or 0)
+        progress = finished / b["total"] if b["total"] else 0
+        print_fn(
+            f"  {b['batch']:24.24s} {b['fingerprint']:16s} {b['total']:7d} {b['queued'] or 0:7d} {b['leased'] or 0:7d}"
+            f" {b['done'] or 0:7d} {b['failed'] or 0:7d} {progress:9.1%}"
+        )
+
+    now = time.time()
+    where_j = "AND j.batch = ?" if batch else ""
+    stats = queue.query(
+        "SELECT COUNT(*) AS done, SUM(j.finished_at >= ?) AS recent, MIN(j.started_at) AS first, MAX(j.finished_at) AS last,"
+        " AVG(json_extract(j.result, '$.latency_s')) AS latency"
+        f" FROM jobs j WHERE j.status = '{DONE}' {where_j}",
+        (now - window_s, *args),
+    )[0]
+    counts = queue.counts(batch)
+    remaining = counts[QUEUED] + counts[LEASED]
+    if stats["done"]:
+        overall = stats["done"] / max(stats["last"] - stats["first"], 1e-9) * 60
+        recent = (stats["recent"] or 0) / window_s * 60
+        print_fn(
+            f"\n  Throughput: {recent:.1f} pairs/min over the last {window_s:.0f}s, {overall:.1f}/min overall;"
+            f" mean pair latency {stats['latency']:.1f}s"
+        )
+        rate = recent or overall
+        if remaining and rate:
+            print_fn(f"  Remaining:  {remaining} pairs, ETA {_duration(remaining / rate * 60)} at {rate:.1f}/min")
+    elif remaining:
+        print_fn(f"\n  Remaining:  {remaining} pairs, none finished yet")
+
+    workers = queue.query(
+        f"SELECT j.worker, SUM(j.status = '{LEASED}') AS leased, SUM(j.status = '{DONE}') AS done,"
+        f" MAX(j.lease_until) AS lease_until FROM jobs j WHERE j.worker IS NOT NULL {where_j}"
+        " GROUP BY j.worker ORDER BY j.worker",
+        args,
+    )
+    if workers:
+        print_fn(f"\n  {'worker':32s} {'in flight':>9s} {'done':>7s}  lease")
+        for w in workers:
+            lease = ""
+            if w["leased"]:
+                left = (w["lease_until"] or 0) - now
+                lease = f"renewed, {left:.0f}s left" if left > 0 else "EXPIRED (worker gone?)"
+            print_fn(f"  {w['worker']:32.32s} {w['leased'] or 0:9d} {w['done'] or 0:7d}  {lease}")
+
+    errors = queue.query(
+        f"SELECT j.error, COUNT(*) AS n FROM jobs j WHERE j.status = '{FAILED}' {where_j}"
+        " GROUP BY j.error ORDER BY n DESC LIMIT 5",
+        args,
+    )
+    if errors:
+        print_fn("\n  Top errors:")
+        for e in errors:
+            print_fn(f"    {e['n']:5d}  {(e['error'] or '')[:100]}")
@@ -0,0 +1,109 @@
+"""Worker: claims pairs from the work queue, judges them and records the results."""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from service import pair_result
+from workflow import make_run_budget, run_pipeline
+
+from .workqueue import WorkQueue, worker_id
+
+
+class Worker:
+    """
+    Runs up to `concurrency` pairs at a time, each under the config of the batch it was submitted
+    with. A heartbeat thread renews the leases of pairs in flight; if this process dies, its leases
+    expire and other workers pick the pairs up again. With checkpointing enabled (on a shared path),
+    a requeued pair resumes from its last completed node.
+    """
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        *,
+        concurrency: int = 4,
+        batch: str | None = None,
+        poll_s: float = 2.0,
+        print_fn=print,
+    ) -> None:
+        self.queue = queue
+        self.concurrency = concurrency
+        self.batch = batch
+        self.poll_s = poll_s
+        self.print_fn = print_fn
+        self.id = worker_id()
+        self.done = 0
+        self.failed = 0
+        self._in_flight: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._configs: dict[str, tuple[dict, object]] = {}  # batch -> (config, run budget)
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="jobs-worker")
+
+    def _config(self, batch: str) -> tuple[dict, object]:
+        with self._lock:
+            if batch not in self._configs:
+                config = self.queue.batch_config(batch) | {"interactive": False}
+                self._configs[batch] = (config, make_run_budget(config))
+            return self._configs[batch]
+
+    def _run(self, job) -> None:
+        config, run_budget = self._config(job["batch"])
+        t0 = time.perf_counter()
+        try:
+            state = run_pipeline(job["claim"], job["truth"], config, run_budget=run_budget, pair_id=job["pair_id"])
+        except Exception as e:
+            with self._lock:
+                self.failed += 1
+            self.queue.fail(self.id, job["job_id"], f"{type(e).__name__}: {e}")
+            self.print_fn(f"  [{self.id}] pair {job['pair_id']} failed (attempt {job['attempts']}): {e}")
+            return
+        result = pair_result(job["pair_id"], state, time.perf_counter() - t0)
+        if self.queue.complete(self.id, job["job_id"], result):
+            with self._lock:
+                self.done += 1
+        else:
+            self.print_fn(f"  [{self.id}] pair {job['pair_id']}: lease lost, result dropped")
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(self.queue.lease_s / 3):
+            with self._lock:
+                job_ids = list(self._in_flight)
+            self.queue.renew(self.id, job_ids)
+
+    def run(self, *, forever: bool = False) -> None:
+        """
+        Claim and judge pairs until nothing is left to do (no queued or leased jobs: a leased one
+        may still expire and come back), or until interrupted with `forever`. On Ctrl-C no new
+        pairs are claimed and the ones in flight finish.
+        """
+        heartbeat = threading.Thread(target=self._heartbeat, name="jobs-heartbeat", daemon=True)
+        heartbeat.start()
+        try:
+            while True:
+                with self._lock:
+                    free = self.concurrency - len(self._in_flight)
+                jobs = self.queue.claim(self.id, free, self.batch) if free else []
+                for job in jobs:
+                    with self._lock:
+                        future = self._in_flight[job["job_id"]] = self._executor.submit(self._run, job)
+                    future.add_done_callback(lambda _, job_id=job["job_id"]: self._finished(job_id))
+                with self._lock:
+                    futures = list(self._in_flight.values())
+                if futures:
+                    wait(futures, timeout=self.poll_s, return_when=FIRST_COMPLETED)
+                elif not forever and self.queue.pending(self.batch) == 0:
+                    return
+                else:
+                    time.sleep(self.poll_s)
+        finally:
+            self._stop.set()
+            with self._lock:
+                unfinished = [job_id for job_id, future in self._in_flight.items() if future.cancel()]
+            self.queue.release(self.id, unfinished)
+            self._executor.shutdown(wait=True)
+
+    def _finished(self, job_id: int) -> None:
+        with self._lock:
+            self._in_flight.pop(job_id, None)
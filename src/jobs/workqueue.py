@@ -0,0 +1,207 @@
+"""Shared work queue of pairs in one SQLite file, claimed by workers under time-limited leases."""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from config import config_fingerprint
+
+# Rollback journal, not WAL: WAL needs shared memory, so it does not work for workers on other hosts
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    batch TEXT PRIMARY KEY,
+    config TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id INTEGER PRIMARY KEY,
+    batch TEXT NOT NULL REFERENCES batches(batch),
+    pair_id INTEGER,
+    claim TEXT NOT NULL,
+    truth TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    started_at REAL,
+    finished_at REAL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status, lease_until);
+CREATE INDEX IF NOT EXISTS jobs_batch ON jobs(batch, status);
+CREATE INDEX IF NOT EXISTS jobs_finished ON jobs(finished_at);
+"""
+
+# Job states: queued -> leased -> done | failed (a failed attempt or an expired lease requeues
+# the job until it has used max_attempts)
+QUEUED, LEASED, DONE, FAILED = "queued", "leased", "done", "failed"
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """
+    Pairs to judge, grouped in batches (one per `submit`, with the config to judge them under).
+    Safe for many processes on one or more hosts, as long as the file is on a filesystem with
+    working locks: every state change is one short IMMEDIATE transaction.
+    """
+
+    def __init__(self, path: str | Path, *, lease_s: float = 300.0, max_attempts: int = 3) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_s = lease_s
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(str(self.path), timeout=60, isolation_level=None, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()  # one connection, shared by a worker's threads
+        with self._transaction() as cur:
+            for statement in filter(str.strip, _SCHEMA.split(";")):
+                cur.execute(statement)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                yield cur
+                cur.execute("COMMIT")
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+            finally:
+                cur.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # --- Producer ---
+
+    def submit(self, pairs: list[dict], config: dict, batch: str | None = None) -> str:
+        """Queue pairs ({"id", "claim", "truth"}) as a new batch judged under `config`; returns the batch name."""
+        batch = batch or time.strftime("batch-%Y%m%d-%H%M%S")
+        with self._transaction() as cur:
+            cur.execute(
+                "INSERT INTO batches (batch, config, fingerprint, created_at) VALUES (?, ?, ?, ?)",
+                (batch, json.dumps(config), config_fingerprint(config), time.time()),
+            )
+            cur.executemany(
+                "INSERT INTO jobs (batch, pair_id, claim, truth) VALUES (?, ?, ?, ?)",
+                [(batch, pair.get("id"), pair["claim"], pair["truth"]) for pair in pairs],
+            )
+        return batch
+
+    def batch_config(self, batch: str) -> dict:
+        with self._lock:
+            row = self.conn.execute("SELECT config FROM batches WHERE batch = ?", (batch,)).fetchone()
+        if row is None:
+            raise KeyError(f"Unknown batch: {batch}")
+        return json.loads(row["config"])
+
+    # --- Workers ---
+
+    def _expire(self, cur: sqlite3.Cursor, now: float) -> None:
+        """Requeue jobs whose worker stopped renewing the lease (fail them after max_attempts)."""
+        cur.execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, worker = NULL, lease_until = NULL,"
+            " error = 'lease expired on ' || worker WHERE status = ? AND lease_until < ?",
+            (self.max_attempts, FAILED, QUEUED, LEASED, now),
+        )
+
+    def claim(self, worker: str, n: int = 1, batch: str | None = None) -> list[sqlite3.Row]:
+        """Lease up to `n` queued jobs (oldest first) to `worker`."""
+        now = time.time()
+        with self._transaction() as cur:
+            self._expire(cur, now)
+            where, args = "status = ?", [QUEUED]
+            if batch is not None:
+                where += " AND batch = ?"
+                args.append(batch)
+            cur.execute(
+                "UPDATE jobs SET status = ?, worker = ?, lease_until = ?, attempts = attempts + 1, started_at = ?"
+                f" WHERE job_id IN (SELECT job_id FROM jobs WHERE {where} ORDER BY job_id LIMIT ?)"
+                " RETURNING job_id, batch, pair_id, claim, truth, attempts",
+                (LEASED, worker, now + self.lease_s, now, *args, n),
+            )
+            return sorted(cur.fetchall(), key=lambda row: row["job_id"])
+
+    def renew(self, worker: str, job_ids: list[int]) -> int:
+        """Extend the leases `worker` still holds; returns how many it still holds."""
+        if not job_ids:
+            return 0
+        with self._transaction() as cur:
+            cur.execute(
+                f"UPDATE jobs SET lease_until = ? WHERE worker = ? AND status = ? AND job_id IN ({', '.join('?' * len(job_ids))})",
+                (time.time() + self.lease_s, worker, LEASED, *job_ids),
+            )
+            return cur.rowcount
+
+    def complete(self, worker: str, job_id: int, result: dict) -> bool:
+        """Record a result. False if the lease was lost (expired and requeued), so the result is dropped."""
+        with self._transaction() as cur:
+            cur.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = NULL, finished_at = ?, lease_until = NULL"
+                " WHERE job_id = ? AND worker = ? AND status = ?",
+                (DONE, json.dumps(result), time.time(), job_id, worker, LEASED),
+            )
+            return cur.rowcount == 1
+
+    def fail(self, worker: str, job_id: int, error: str) -> bool:
+        """Record a failed attempt: requeued, or failed for good after max_attempts."""
+        with self._transaction() as cur:
+            cur.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, error = ?, worker = NULL,"
+                " lease_until = NULL, finished_at = ? WHERE job_id = ? AND worker = ? AND status = ?",
+                (self.max_attempts, FAILED, QUEUED, error, time.time(), job_id, worker, LEASED),
+            )
+            return cur.rowcount == 1
+
+    def release(self, worker: str, job_ids: list[int]) -> None:
+        """Hand unfinished jobs back on shutdown (the attempt is not counted)."""
+        if not job_ids:
+            return
+        with self._transaction() as cur:
+            cur.execute(
+                "UPDATE jobs SET status = ?, worker = NULL, lease_until = NULL, attempts = attempts - 1"
+                f" WHERE worker = ? AND status = ? AND job_id IN ({', '.join('?' * len(job_ids))})",
+                (QUEUED, worker, LEASED, *job_ids),
+            )
+
+    def pending(self, batch: str | None = None) -> int:
+        """Jobs not yet finished (queued or leased)."""
+        where, args = "status IN (?, ?)", [QUEUED, LEASED]
+        if batch is not None:
+            where += " AND batch = ?"
+            args.append(batch)
+        with self._lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM jobs WHERE {where}", args).fetchone()[0]
+
+    # --- Status ---
+
+    def counts(self, batch: str | None = None) -> dict[str, int]:
+        where, args = ("WHERE batch = ?", [batch]) if batch else ("", [])
+        rows = self.query(f"SELECT status, COUNT(*) AS n FROM jobs {where} GROUP BY status", tuple(args))
+        return {QUEUED: 0, LEASED: 0, DONE: 0, FAILED: 0} | {row["status"]: row["n"] for row in rows}
+
+    def query(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+
+def open_queue(config: dict, path: str | Path | None = None) -> WorkQueue:
+    """Queue from config['jobs'] (path relative to the project root)."""
+    jobs_cfg = config.get("jobs", {}) or {}
+    path = Path(path or jobs_cfg.get("path", "eval/jobs.sqlite"))
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parent.parent.parent / path
+    return WorkQueue(path, lease_s=jobs_cfg.get("lease_s", 300), max_attempts=jobs_cfg.get("max_attempts", 3))
@@ -1,32 +1,95 @@
 """Entry point. Run the jury pipeline on configured pairs."""
 
+import argparse
+import tomllib
+from importlib import metadata
+from pathlib import Path
+
 from dotenv import load_dotenv
 
+import perf
+from coalesce import pair_key
 from config import load_config
 from data import load_pairs
-from workflow import run_pipeline, run_pipeline_interactive
+
+# The LLM stack (workflow -> langgraph, langchain_openai) is imported after argument handling,
+# so --version and --dry-run return without paying for it.
+
+
+def _version() -> str:
+    try:
+        return metadata.version("hacktrace-nova")
+    except metadata.PackageNotFoundError:  # running from a checkout
+        with open(Path(__file__).resolve().parent.parent / "pyproject.toml", "rb") as f:
+            return tomllib.load(f)["project"]["version"]
+
+
+def _print_matches(pair: dict) -> None:
+    """Corpus statements retrieved for a claim-only pair (data.truth_col: null)."""
+    for match in pair.get("matches", []):
+        used = "*" if match["used"] else " "
+        print(f"  {used} match {match['source']}:{match['row']} (score {match['score']:.2f})")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Run the jury pipeline on the pairs selected in config.yaml")
+    parser.add_argument("--config", type=str, default=None, help="Path to config YAML. Default: config.yaml")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {_version()}")
+    parser.add_argument("--dry-run", action="store_true", help="List the selected pairs and exit (no model calls)")
+    perf.add_arguments(parser)
+    args = parser.parse_args()
+
     load_dotenv()
-    config = load_config()
+    config = load_config(args.config)
     pairs = load_pairs(config)
     interactive = config.get("interactive", True)
-    run_fn = run_pipeline_interactive if interactive else run_pipeline
 
     print(f"Loaded {len(pairs)} pairs: {[pair['id'] for pair in pairs]}")
+    if args.dry_run:
+        for pair in pairs:
+            print(f"\n  PAIR {pair['id']}")
+            print(f"- Claim: {pair['claim']}")
+            print(f"- Truth: {pair['truth']}")
+            _print_matches(pair)
+        return
+
+    from agents.llm import llm_calls
+    from workflow import run_pipeline, run_pipeline_interactive, make_run_budget
+
+    profiler = perf.start(args)
+    run_fn = run_pipeline_interactive if interactive else run_pipeline
+    run_budget = make_run_budget(config)
+    judged: dict[str, tuple[int, dict]] = {}  # pair_key -> (first pair id, result)
+
     for i, pair in enumerate(pairs):
         print(f"\n{'='*60}")
         print(f"  PAIR {i + 1} (ID: {pair['id']})")
         print("=" * 60)
         print(f"- Claim: {pair['claim']}")
         print(f"- Truth: {pair['truth']}")
+        _print_matches(pair)
         print("-" * 60)
-        result = run_fn(pair["claim"], pair["truth"], config)
-        if not interactive and (verdict := result.get("verdict")):
+        key = pair_key(pair["claim"], pair["truth"], config)
+        reused = key in judged
+        if reused:
+            print(f"  Duplicate of pair {judged[key][0]}: reusing its verdict")
+            result = judged[key][1]
+        else:
+            result = run_fn(pair["claim"], pair["truth"], config, run_budget=run_budget, pair_id=pair["id"])
+            judged[key] = (pair["id"], result)
+            if (near := result.get("reused_from")) and not interactive:
+                print(f"  Near-duplicate of pair {near['pair_id']} (similarity {near['similarity']:.2f}): reusing its verdict")
+        if (reused or not interactive) and (verdict := result.get("verdict")):
             print(f"* Verdict: {verdict.verdict} (confidence: {verdict.confidence:.2f})")
             print(f"* Summary: {verdict.summary}")
+            if verdict.degradations:
+                print(f"* Degraded (budget): {', '.join(verdict.degradations)}")
             print("-" * 60)
 
+    reused = len(pairs) - len(judged) + sum(1 for _, result in judged.values() if result.get("reused_from"))
+    if reused or llm_calls.shared:
+        print(f"\nDedup: {reused}/{len(pairs)} pairs reused, {llm_calls.shared}/{llm_calls.calls} LLM calls coalesced")
+    perf.finish(profiler, args)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
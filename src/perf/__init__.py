@@ -0,0 +1,141 @@
+"""
+Opt-in profiling and tracing of the pipeline (main.py / run_eval.py --profile, --trace).
+The hooks below are no-ops until `enable()` / `enable_trace()` install a collector, so
+instrumented code pays nothing by default.
+"""
+
+import argparse
+from contextlib import ExitStack, contextmanager, nullcontext
+
+from .profiler import Profiler, Timing
+from .trace import Tracer, install, uninstall
+
+_active: Profiler | None = None
+_tracer: Tracer | None = None
+_off = nullcontext()
+
+
+def enable(*, cprofile: bool = False) -> Profiler:
+    """Install a process-wide profiler and return it (for `report()` / `dump()`)."""
+    global _active
+    _active = Profiler(cprofile=cprofile)
+    return _active
+
+
+def disable() -> None:
+    global _active
+    _active = None
+
+
+def active() -> Profiler | None:
+    return _active
+
+
+def enable_trace() -> Tracer:
+    """Install a process-wide timeline tracer and return it (for `export()`)."""
+    global _tracer
+    _tracer = Tracer()
+    install(_tracer)
+    return _tracer
+
+
+def disable_trace() -> None:
+    global _tracer
+    uninstall()
+    _tracer = None
+
+
+@contextmanager
+def _both(profiled, traced):
+    with ExitStack() as stack:
+        stack.enter_context(profiled)
+        stack.enter_context(traced)
+        yield
+
+
+def _hook(profiled, traced):
+    if _active is None and _tracer is None:
+        return _off
+    if _tracer is None:
+        return profiled()
+    if _active is None:
+        return traced()
+    return _both(profiled(), traced())
+
+
+def pair(pair_id):
+    """Context for judging one pair (trace only: a process track per pair)."""
+    return _tracer.pair(pair_id) if _tracer is not None else _off
+
+
+def node(name: str):
+    """Context for running graph node `name`."""
+    return _hook(lambda: _active.node(name), lambda: _tracer.span(name, "node"))
+
+
+def task(label: str = "task"):
+    """Context for pool-thread work done on behalf of the current node."""
+    return _hook(lambda: _active.task(), lambda: _tracer.span(label, "task"))
+
+
+def llm_call(label: str):
+    """Context around one LLM request made by client `label`."""
+    return _hook(lambda: _active.llm_call(label), lambda: _tracer.llm_call(label))
+
+
+def span(name: str, cat: str, **args):
+    """Any other timed work worth seeing on the timeline (e.g. TTS synthesis, playback)."""
+    return _tracer.span(name, cat, **args) if _tracer is not None else _off
+
+
+# --- CLI (main.py, eval/run_eval.py) ---
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--profile", action="store_true", help="Report local CPU vs awaiting the provider, per node and LLM call")
+    parser.add_argument("--profile-out", metavar="DIR", default=None, help="Also cProfile each node's CPU and write <node>.pstats files to DIR")
+    parser.add_argument("--profile-top", metavar="N", type=int, default=15, help="Rows in the hot-path report (default 15)")
+    parser.add_argument("--trace", metavar="FILE", default=None, help="Write a Chrome/Perfetto trace-event timeline (JSON) to FILE")
+
+
+def start(args: argparse.Namespace) -> Profiler | None:
+    """Enable profiling and tracing if the command line asked for them."""
+    if args.trace:
+        enable_trace()
+    if not (args.profile or args.profile_out):
+        return None
+    return enable(cprofile=bool(args.profile_out))
+
+
+def finish(profiler: Profiler | None, args: argparse.Namespace) -> None:
+    """Print the report, write .pstats files and the trace, for whatever was enabled."""
+    if profiler is not None:
+        profiler.report(top=args.profile_top)
+        if args.profile_out:
+            paths = profiler.dump(args.profile_out)
+            print(f"\n  cProfile stats: {', '.join(str(p) for p in paths)}")
+        disable()
+    if _tracer is not None:
+        path = _tracer.export(args.trace)
+        print(f"\n  Trace: {path} (open in ui.perfetto.dev or chrome://tracing)")
+        disable_trace()
+
+
+__all__ = [
+    "Profiler",
+    "Timing",
+    "Tracer",
+    "enable",
+    "disable",
+    "active",
+    "enable_trace",
+    "disable_trace",
+    "pair",
+    "node",
+    "task",
+    "llm_call",
+    "span",
+    "add_arguments",
+    "start",
+    "finish",
+]
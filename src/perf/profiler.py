@@ -0,0 +1,161 @@
+"""Profiler: wall time per graph node and per LLM call, split into local CPU and awaiting the provider."""
+
+import contextvars
+import cProfile
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+# Node whose work the current code is doing. Set by `node()`; pool tasks inherit it (their
+# executors copy the context), so background vote agents are charged to the node that started them.
+_current_node: contextvars.ContextVar[str] = contextvars.ContextVar("perf_node", default="(outside graph)")
+
+
+@dataclass
+class Timing:
+    count: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0  # thread CPU time: this process's own work
+    wait: float = 0.0  # wall - cpu of LLM calls: time spent awaiting the provider
+    llm_calls: int = 0
+
+    def add(self, wall: float = 0.0, cpu: float = 0.0, *, count: int = 0) -> None:
+        self.count += count
+        self.wall += wall
+        self.cpu += cpu
+
+
+class Profiler:
+    """
+    Collects, per graph node: wall time, CPU time of every thread working for the node (node
+    thread plus its vote/pool tasks), and time LLM calls spent awaiting the provider; per LLM
+    call site (node, client): calls, wall, CPU and wait. CPU is thread time, so a thread blocked
+    on the network counts as waiting, not CPU.
+
+    With `cprofile`, each node's CPU part is also profiled (cProfile on thread CPU time, one
+    profile per thread per scope), for the hot-function report and `.pstats` files.
+    """
+
+    def __init__(self, *, cprofile: bool = False) -> None:
+        self.cprofile = cprofile
+        self.nodes: dict[str, Timing] = {}
+        self.calls: dict[tuple[str, str], Timing] = {}
+        self.profiles: dict[str, list[cProfile.Profile]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()  # per-thread: a cProfile is already running here
+        self.started_wall = time.perf_counter()
+        self.started_cpu = time.process_time()
+
+    @contextmanager
+    def _measure(self, node: str) -> Iterator[None]:
+        """Charge this thread's CPU (and cProfile samples) inside the block to `node`."""
+        profile = None
+        if self.cprofile and not getattr(self._local, "profiling", False):
+            profile = cProfile.Profile(time.thread_time)
+            self._local.profiling = True
+            profile.enable()
+        cpu0 = time.thread_time()
+        try:
+            yield
+        finally:
+            cpu = time.thread_time() - cpu0
+            if profile is not None:
+                profile.disable()
+                self._local.profiling = False
+            with self._lock:
+                self.nodes.setdefault(node, Timing()).add(cpu=cpu)
+                if profile is not None:
+                    self.profiles.setdefault(node, []).append(profile)
+
+    @contextmanager
+    def node(self, name: str) -> Iterator[None]:
+        token = _current_node.set(name)
+        wall0 = time.perf_counter()
+        try:
+            with self._measure(name):
+                yield
+        finally:
+            wall = time.perf_counter() - wall0
+            _current_node.reset(token)
+            with self._lock:
+                self.nodes.setdefault(name, Timing()).add(wall, count=1)
+
+    @contextmanager
+    def task(self) -> Iterator[None]:
+        """Work on a pool thread for the node that started it."""
+        with self._measure(_current_node.get()):
+            yield
+
+    @contextmanager
+    def llm_call(self, label: str) -> Iterator[None]:
+        node = _current_node.get()
+        wall0, cpu0 = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall0, time.thread_time() - cpu0
+            with self._lock:
+                call = self.calls.setdefault((node, label), Timing())
+                call.add(wall, cpu, count=1)
+                call.wait += max(0.0, wall - cpu)
+                stats = self.nodes.setdefault(node, Timing())
+                stats.llm_calls += 1
+                stats.wait += max(0.0, wall - cpu)
+
+    # --- Output ---
+
+    def node_stats(self, node: str | None = None) -> pstats.Stats | None:
+        """Merged cProfile stats for one node (or all nodes), None without cprofile data."""
+        profiles = [p for n, ps in self.profiles.items() if node in (None, n) for p in ps]
+        if not profiles:
+            return None
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+
+    def dump(self, out_dir: str | Path) -> list[Path]:
+        """Write one `<node>.pstats` file per node (view with `python -m pstats` or snakeviz)."""
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for node in self.profiles:
+            path = out_dir / f"{node.strip('()').replace(' ', '_')}.pstats"
+            self.node_stats(node).dump_stats(path)
+            paths.append(path)
+        return paths
+
+    def report(self, top: int = 15, print_fn=print) -> None:
+        """Print the CPU vs provider-wait summary, per-node table and top-N hot paths."""
+        wall = time.perf_counter() - self.started_wall
+        cpu = time.process_time() - self.started_cpu
+        n_calls = sum(t.count for t in self.calls.values())
+        wait = sum(t.wait for t in self.calls.values())
+        print_fn("\n" + "=" * 78)
+        print_fn("PROFILE")
+        print_fn("=" * 78)
+        print_fn(f"  Run wall {wall:.2f}s | process CPU {cpu:.2f}s ({cpu / wall:.0%} of wall)" if wall else "  (empty run)")
+        print_fn(f"  Awaiting provider {wait:.2f}s summed over {n_calls} LLM calls (parallel calls overlap)")
+
+        print_fn(f"\n  {'node':22s} {'runs':>5s} {'wall s':>8s} {'CPU s':>8s} {'LLM calls':>10s} {'provider wait s':>16s}")
+        for name, t in sorted(self.nodes.items(), key=lambda kv: -kv[1].wall):
+            print_fn(f"  {name:22s} {t.count:5d} {t.wall:8.2f} {t.cpu:8.3f} {t.llm_calls:10d} {t.wait:16.2f}")
+
+        print_fn(f"\n  Hot paths: LLM call sites by total wall (top {top})")
+        print_fn(f"  {'node / client':44s} {'calls':>5s} {'wall s':>8s} {'mean s':>7s} {'CPU s':>7s} {'wait s':>8s}")
+        for (node, label), t in sorted(self.calls.items(), key=lambda kv: -kv[1].wall)[:top]:
+            print_fn(f"  {node + ' / ' + label:44.44s} {t.count:5d} {t.wall:8.2f} {t.wall / t.count:7.2f} {t.cpu:7.3f} {t.wait:8.2f}")
+
+        rows = []
+        for node in self.profiles:
+            for (file, line, func), (_, ncalls, tottime, cumtime, _) in self.node_stats(node).stats.items():
+                rows.append((tottime, cumtime, ncalls, node, f"{Path(file).name}:{line}({func})"))
+        if rows:
+            print_fn(f"\n  Hot functions: local CPU by self time, cProfile (top {top})")
+            print_fn(f"  {'node':16s} {'self s':>8s} {'cum s':>8s} {'calls':>8s}  function")
+            for tottime, cumtime, ncalls, node, where in sorted(rows, reverse=True)[:top]:
+                print_fn(f"  {node:16.16s} {tottime:8.3f} {cumtime:8.3f} {ncalls:8d}  {where}")
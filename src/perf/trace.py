@@ -0,0 +1,182 @@
+"""Timeline tracer: spans exported as Chrome / Perfetto trace-event JSON."""
+
+import contextvars
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+# Pair whose work the current code is doing; pool tasks inherit it with the context
+_current_pair: contextvars.ContextVar[str | None] = contextvars.ContextVar("perf_pair", default=None)
+
+# The openai client logs each retry on this logger before sleeping
+_OPENAI_LOGGER = "openai._base_client"
+
+
+class Tracer:
+    """
+    Records complete ("X") events: one per pair, graph node, vote task, LLM call and TTS
+    utterance. Each pair is a process track (pid) and each thread a track within it (tid), so
+    nested spans stack on their thread and concurrent work sits side by side. LLM spans carry
+    the client, token counts and retries; open the file in ui.perfetto.dev or chrome://tracing.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[dict] = []
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+        self._pids: dict[str, int] = {"run": 0}
+        self._tids: dict[tuple[int, int], str] = {}  # (pid, thread ident) -> thread name
+        self._local = threading.local()  # stack of open LLM spans' args on this thread
+
+    def _ids(self) -> tuple[int, int]:
+        pair = _current_pair.get()
+        thread = threading.current_thread()
+        with self._lock:
+            pid = self._pids.setdefault(pair or "run", len(self._pids))
+            self._tids.setdefault((pid, thread.ident), thread.name)
+        return pid, thread.ident
+
+    @contextmanager
+    def span(self, name: str, cat: str, **args: Any) -> Iterator[dict]:
+        """Time the block as one event; the yielded args dict may be filled in before it closes."""
+        pid, tid = self._ids()
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            end = time.perf_counter()
+            event = {
+                "name": name, "cat": cat, "ph": "X", "pid": pid, "tid": tid,
+                "ts": round((start - self._t0) * 1e6, 1), "dur": round((end - start) * 1e6, 1),
+            }
+            if args:
+                event["args"] = args
+            with self._lock:
+                self.events.append(event)
+
+    @contextmanager
+    def pair(self, pair_id) -> Iterator[None]:
+        token = _current_pair.set(f"pair {pair_id if pair_id is not None else 'adhoc'}")
+        try:
+            with self.span(_current_pair.get(), "pair"):
+                yield
+        finally:
+            _current_pair.reset(token)
+
+    @contextmanager
+    def llm_call(self, label: str) -> Iterator[None]:
+        stack = self._local.__dict__.setdefault("llm", [])
+        with self.span(f"llm {label}", "llm", client=label) as args:
+            stack.append(args)
+            try:
+                yield
+            finally:
+                stack.pop()
+
+    def _open_llm(self) -> dict | None:
+        stack = getattr(self._local, "llm", None)
+        return stack[-1] if stack else None
+
+    def on_usage(self, model: str | None, usage: dict, *, start: float) -> None:
+        """Token usage of a model run (from the callback handler) on this thread."""
+        args = self._open_llm()
+        if args is None:  # a call made outside agents.llm.invoke (e.g. the eval baseline)
+            pid, tid = self._ids()
+            args = {"client": model}
+            with self._lock:
+                self.events.append({
+                    "name": f"llm {model}", "cat": "llm", "ph": "X", "pid": pid, "tid": tid, "args": args,
+                    "ts": round((start - self._t0) * 1e6, 1), "dur": round((time.perf_counter() - start) * 1e6, 1),
+                })
+        if model:
+            args["model"] = model
+        for key in ("input_tokens", "output_tokens", "total_tokens"):
+            args[key] = args.get(key, 0) + (usage.get(key) or 0)
+
+    def on_retry(self, wait_s: float) -> None:
+        """The openai client is about to sleep and retry the request in flight on this thread."""
+        args = self._open_llm()
+        if args is not None:
+            args["retries"] = args.get("retries", 0) + 1
+            args["retry_wait_s"] = round(args.get("retry_wait_s", 0.0) + wait_s, 3)
+
+    def export(self, path: str | Path) -> Path:
+        """Write the trace-event JSON (with process / thread names) and return its path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            meta = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}} for name, pid in self._pids.items()]
+            meta += [{"name": "process_sort_index", "ph": "M", "pid": pid, "args": {"sort_index": pid}} for pid in self._pids.values()]
+            meta += [
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                for (pid, tid), name in self._tids.items()
+            ]
+            events = sorted(self.events, key=lambda e: e["ts"])
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": meta + events, "displayTimeUnit": "ms"}, f)
+        return path
+
+
+class _RetryLog(logging.Handler):
+    """Turns the openai client's "Retrying request in X seconds" log records into span attributes."""
+
+    def __init__(self, tracer: Tracer) -> None:
+        super().__init__(logging.INFO)
+        self.tracer = tracer
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.msg.startswith("Retrying request in") and record.args:
+            self.tracer.on_retry(float(record.args[0]))
+
+
+_handler_var: contextvars.ContextVar | None = None
+
+
+def install(tracer: Tracer) -> None:
+    """Hook a tracer into LangChain (token usage of every model run) and the openai client (retries)."""
+    global _handler_var
+    from langchain_core.callbacks import BaseCallbackHandler
+    from langchain_core.tracers.context import register_configure_hook
+
+    class _UsageCallback(BaseCallbackHandler):
+        def __init__(self) -> None:
+            self.starts: dict = {}
+
+        def on_llm_start(self, serialized, prompts, *, run_id, **kwargs) -> None:
+            self.starts[run_id] = time.perf_counter()
+
+        def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs) -> None:
+            self.starts[run_id] = time.perf_counter()
+
+        def on_llm_end(self, response, *, run_id, **kwargs) -> None:
+            start = self.starts.pop(run_id, time.perf_counter())
+            for generations in response.generations:
+                for generation in generations:
+                    message = getattr(generation, "message", None)
+                    usage = getattr(message, "usage_metadata", None)
+                    if usage:
+                        model = (getattr(message, "response_metadata", None) or {}).get("model_name")
+                        tracer.on_usage(model, usage, start=start)
+                        return
+            tracer.on_usage((response.llm_output or {}).get("model_name"), {}, start=start)
+
+    if _handler_var is None:
+        _handler_var = contextvars.ContextVar("perf_trace_callback", default=None)
+        register_configure_hook(_handler_var, inheritable=True)
+    _handler_var.set(_UsageCallback())
+    logger = logging.getLogger(_OPENAI_LOGGER)
+    if logger.getEffectiveLevel() > logging.INFO:
+        logger.setLevel(logging.INFO)
+    logger.addHandler(_RetryLog(tracer))
+
+
+def uninstall() -> None:
+    if _handler_var is not None:
+        _handler_var.set(None)
+    logger = logging.getLogger(_OPENAI_LOGGER)
+    for handler in [h for h in logger.handlers if isinstance(h, _RetryLog)]:
+        logger.removeHandler(handler)
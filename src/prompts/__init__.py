@@ -1,18 +1,48 @@
-"""Shared prompt loading utilities."""
+"""Shared prompt loading utilities, backed by one preloaded registry (see registry.py)."""
 
+import threading
 from pathlib import Path
 
+from .registry import FIELDS, PromptError, PromptRegistry, Template
+
+_registry: PromptRegistry | None = None
+_registry_lock = threading.Lock()
+
 
 def _root() -> Path:
     return Path(__file__).resolve().parent
 
 
+def registry() -> PromptRegistry:
+    """The process-wide registry, loaded (and validated) on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = PromptRegistry(_root())
+    return _registry
+
+
+def configure(*, reload_s: float | None = None) -> PromptRegistry:
+    """Turn on mtime-based hot reload (checked at most every `reload_s` seconds), or off with None/0."""
+    reg = registry()
+    reg.reload_s = reload_s or None
+    return reg
+
+
+def template(name: str) -> Template:
+    """Preloaded template by path relative to prompts dir. E.g. 'parser.txt', 'jury/vote_template.txt'."""
+    return registry().get(name)
+
+
 def load(name: str, *, encoding: str = "utf-8") -> str:
     """Load a prompt file by path relative to prompts dir. E.g. 'parser.txt', 'jury/vote_template.txt'."""
-    path = _root() / name
-    if not path.exists():
-        raise FileNotFoundError(f"Prompt not found: {path}")
-    return path.read_text(encoding=encoding)
+    if encoding.lower().replace("-", "").replace("_", "") != "utf8":
+        path = _root() / name  # the registry holds UTF-8 text; other encodings are read as before
+        if not path.exists():
+            raise FileNotFoundError(f"Prompt not found: {path}")
+        return path.read_text(encoding=encoding)
+    return template(name).text
 
 
 def load_jury_template(name: str, *, encoding: str = "utf-8") -> str:
@@ -23,3 +53,29 @@ def load_jury_template(name: str, *, encoding: str = "utf-8") -> str:
 def load_role_instruction(agent_name: str, *, encoding: str = "utf-8") -> str:
     """Load role instruction for a jury agent. E.g. 'literal', 'context'."""
     return load(f"jury/{agent_name}.txt", encoding=encoding)
+
+
+def jury_template(name: str) -> Template:
+    """Preloaded jury template, for rendering. E.g. 'vote_template', 'debate_template'."""
+    return template(f"jury/{name}.txt")
+
+
+def prompts_version() -> str:
+    """Short content hash of every prompt, for fingerprints and cache keys."""
+    return registry().version
+
+
+__all__ = [
+    "FIELDS",
+    "PromptError",
+    "PromptRegistry",
+    "Template",
+    "configure",
+    "jury_template",
+    "load",
+    "load_jury_template",
+    "load_role_instruction",
+    "prompts_version",
+    "registry",
+    "template",
+]
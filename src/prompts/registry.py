@@ -0,0 +1,151 @@
+"""Prompt registry: every template read and checked once, pre-split for rendering, versioned by content hash."""
+
+import hashlib
+import string
+import threading
+import time
+import warnings
+from pathlib import Path
+
+# Placeholders each template's call site fills in; a template must use exactly these. Files not
+# listed (jury role instructions) are inserted verbatim and never formatted.
+FIELDS: dict[str, frozenset[str]] = {
+    "parser.txt": frozenset({"claim", "truth"}),
+    "parser_chunk.txt": frozenset({"part", "parts", "claim", "truth"}),
+    "parser_omissions.txt": frozenset({"claim", "truth"}),
+    "foreperson.txt": frozenset({"claim", "truth", "fact_frame", "transcript", "revote_outputs", "rubric_questions"}),
+    "debate_status_check.txt": frozenset({"transcript"}),
+    "jury/vote_template.txt": frozenset({"role_instruction", "claim", "truth", "fact_frame", "debate_section"}),
+    "jury/revote_template.txt": frozenset(
+        {"role_instruction", "claim", "truth", "fact_frame", "debate_section", "initial_verdict"}
+    ),
+    "jury/debate_template.txt": frozenset(
+        {"role_instruction", "claim", "truth", "fact_frame", "verdict", "reasoning", "debate_context", "round_instruction"}
+    ),
+}
+
+
+class PromptError(ValueError):
+    """A prompt file that is missing, malformed, or whose placeholders do not match its call site."""
+
+
+def _segments(name: str, text: str) -> tuple[tuple[str, str | None], ...]:
+    """(literal, placeholder or None) runs of a template; "{{" / "}}" are already unescaped."""
+    try:
+        parsed = list(string.Formatter().parse(text))
+    except ValueError as e:
+        raise PromptError(f"Prompt {name}: {e}") from None
+    out = []
+    for literal, field, spec, conversion in parsed:
+        if field is not None and (not field.isidentifier() or spec or conversion):
+            raise PromptError(f"Prompt {name}: placeholder {{{field}}} must be a plain name")
+        out.append((literal, field))
+    return tuple(out)
+
+
+class Template:
+    """One prompt file. `render` fills the placeholders of a `FIELDS` template (like str.format)."""
+
+    __slots__ = ("name", "text", "sha256", "mtime_ns", "fields", "_segments")
+
+    def __init__(self, name: str, text: str, mtime_ns: int = 0) -> None:
+        self.name = name
+        self.text = text
+        self.sha256 = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        self.mtime_ns = mtime_ns
+        expected = FIELDS.get(name)
+        if expected is None:
+            self._segments = ((text, None),)
+            self.fields = frozenset()
+            return
+        self._segments = _segments(name, text)
+        self.fields = frozenset(field for _, field in self._segments if field is not None)
+        if self.fields != expected:
+            missing, unknown = sorted(expected - self.fields), sorted(self.fields - expected)
+            raise PromptError(f"Prompt {name}: placeholders do not match its call site (missing {missing}, unknown {unknown})")
+
+    def render(self, **values) -> str:
+        """The template with each placeholder replaced by str(value); extra values are ignored."""
+        parts = []
+        for literal, field in self._segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return "".join(parts)
+
+
+class PromptRegistry:
+    """
+    Every *.txt prompt under `root`, read and validated once. With `reload_s`, lookups check file
+    mtimes at most that often and swap in changed files; an edit that fails validation is reported
+    and the previous version kept.
+    """
+
+    def __init__(self, root: str | Path, *, reload_s: float | None = None) -> None:
+        self.root = Path(root)
+        self.reload_s = reload_s
+        self._lock = threading.Lock()
+        self._templates = {name: self._read(name) for name in self._names()}
+        missing = sorted(set(FIELDS) - set(self._templates))
+        if missing:
+            raise PromptError(f"Prompts not found in {self.root}: {missing}")
+        self._checked = time.monotonic()
+        self._version = self._digest()
+
+    def _names(self) -> list[str]:
+        return sorted(p.relative_to(self.root).as_posix() for p in self.root.rglob("*.txt"))
+
+    def _read(self, name: str) -> Template:
+        path = self.root / name
+        return Template(name, path.read_text(encoding="utf-8"), path.stat().st_mtime_ns)
+
+    def _digest(self) -> str:
+        payload = "\n".join(f"{name}:{t.sha256}" for name, t in sorted(self._templates.items()))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _maybe_reload(self) -> None:
+        if not self.reload_s or time.monotonic() - self._checked < self.reload_s:
+            return
+        with self._lock:
+            if time.monotonic() - self._checked < self.reload_s:
+                return
+            self._checked = time.monotonic()
+            self.reload()
+
+    def reload(self) -> list[str]:
+        """Re-read prompt files whose mtime changed (and new ones); returns the names swapped in."""
+        templates = dict(self._templates)
+        changed = []
+        for name in self._names():
+            try:
+                if name in templates and (self.root / name).stat().st_mtime_ns == templates[name].mtime_ns:
+                    continue
+                template = self._read(name)
+            except (OSError, PromptError) as e:
+                warnings.warn(f"Prompt reload skipped {name}: {e}", RuntimeWarning, stacklevel=2)
+                continue
+            if name not in templates or template.sha256 != templates[name].sha256:
+                changed.append(name)
+            templates[name] = template
+        self._templates = templates  # one swap: readers see the old set or the new one
+        if changed:
+            self._version = self._digest()
+        return changed
+
+    def get(self, name: str) -> Template:
+        """The template at `name` (relative to the prompts dir, e.g. 'jury/vote_template.txt')."""
+        self._maybe_reload()
+        try:
+            return self._templates[name]
+        except KeyError:
+            raise FileNotFoundError(f"Prompt not found: {self.root / name}") from None
+
+    @property
+    def version(self) -> str:
+        """Short content hash of all prompts: changes whenever any prompt text does."""
+        self._maybe_reload()
+        return self._version
+
+    def hashes(self) -> dict[str, str]:
+        """sha256 of each prompt's text, by name."""
+        return {name: t.sha256 for name, t in sorted(self._templates.items())}
@@ -0,0 +1,48 @@
+from .bm25 import BM25, names, numbers, tokenize
+from .index import CorpusIndex, Hit, corpus_sources, index_terms
+from .corpus import match_truths, open_index
+from .neardup import (
+    Match,
+    MinHasher,
+    NearDuplicates,
+    band_keys,
+    content_words,
+    get_near_duplicates,
+    numeric_key,
+    pair_similarity,
+    reuse_key,
+    shingles,
+    similarity,
+    word_similarity,
+)
+from .passages import Selection, prune_truth, score_passages, select_passages, split_passages
+
+__all__ = [
+    "BM25",
+    "names",
+    "numbers",
+    "tokenize",
+    "CorpusIndex",
+    "Hit",
+    "corpus_sources",
+    "index_terms",
+    "match_truths",
+    "open_index",
+    "Match",
+    "MinHasher",
+    "NearDuplicates",
+    "band_keys",
+    "content_words",
+    "get_near_duplicates",
+    "numeric_key",
+    "pair_similarity",
+    "reuse_key",
+    "shingles",
+    "similarity",
+    "word_similarity",
+    "Selection",
+    "prune_truth",
+    "score_passages",
+    "select_passages",
+    "split_passages",
+]
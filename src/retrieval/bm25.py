@@ -0,0 +1,74 @@
+"""Local lexical scoring: tokens, numbers and names of a text, and a BM25 index over passages."""
+
+import math
+import re
+from collections import Counter
+
+from coalesce import normalize_text
+
+_STOPWORDS = frozenset(
+    "a an and are as at be been being but by can could did do does for from had has have he her his how i if in"
+    " into is it its may might more most no not of on or our she so such than that the their them then there these"
+    " they this those to was we were what when where which while who will with would you".split()
+)
+_WORD = re.compile(r"[a-z0-9]+(?:[.,][0-9]+)*")
+_NUMBER = re.compile(r"(?<![\w.])(\d[\d,]*(?:\.\d+)?)\s*(%|percent|thousand|million|billion|trillion)?", re.IGNORECASE)
+_SCALE = {"thousand": 1e3, "million": 1e6, "billion": 1e9, "trillion": 1e12}
+_NAME = re.compile(r"\b[A-Z][A-Za-z0-9&'-]*[A-Za-z0-9]|\b[A-Z]{2,}\b")
+
+
+def _stem(word: str) -> str:
+    # Plural folding only: "cases"/"case", "studies"/"study"
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase content words (stopwords dropped, plurals folded); numbers are kept as tokens."""
+    return [_stem(w) for w in _WORD.findall(normalize_text(text).lower()) if w not in _STOPWORDS]
+
+
+def numbers(text: str) -> set[str]:
+    """Numbers in `text`, normalised ("650,000" and "650 thousand" → "650000"; "12%" → "12%")."""
+    out = set()
+    for digits, unit in _NUMBER.findall(text):
+        try:
+            value = float(digits.replace(",", ""))
+        except ValueError:
+            continue
+        unit = unit.lower()
+        if unit in _SCALE:
+            value *= _SCALE[unit]
+        out.add(f"{value:.15g}" + ("%" if unit in ("%", "percent") else ""))
+    return out
+
+
+def names(text: str) -> set[str]:
+    """Capitalised words and acronyms (people, places, organisations), lowercased; common words excluded."""
+    return {n.lower() for n in _NAME.findall(text) if n.lower() not in _STOPWORDS}
+
+
+class BM25:
+    """Okapi BM25 over a fixed list of tokenised documents (here: the passages of one reference)."""
+
+    def __init__(self, docs: list[list[str]], *, k1: float = 1.5, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self.tf = [Counter(doc) for doc in docs]
+        self.lengths = [len(doc) for doc in docs]
+        self.avgdl = (sum(self.lengths) / len(docs)) if docs else 0.0
+        df = Counter(term for tf in self.tf for term in tf)
+        n = len(docs)
+        self.idf = {term: math.log(1 + (n - d + 0.5) / (d + 0.5)) for term, d in df.items()}
+
+    def scores(self, query: list[str]) -> list[float]:
+        """Score of every document for `query` (repeated query terms count once)."""
+        terms = [t for t in set(query) if t in self.idf]
+        out = []
+        for tf, length in zip(self.tf, self.lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / (self.avgdl or 1))
+            out.append(sum(self.idf[t] * tf[t] * (self.k1 + 1) / (tf[t] + norm) for t in terms if t in tf))
+        return out
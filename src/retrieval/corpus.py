@@ -0,0 +1,50 @@
+"""Claim-only mode: find the reference truth for each claim in the corpus index (config['corpus'])."""
+
+from pathlib import Path
+
+from .index import CorpusIndex, corpus_sources
+
+
+def open_index(config: dict, root: Path, *, print_fn=print) -> CorpusIndex:
+    """The corpus index at corpus.index (relative to `root`), synced with corpus.sources."""
+    cfg = config.get("corpus") or {}
+    index = CorpusIndex(root / cfg.get("index", "eval/corpus.sqlite"))
+    counts = index.sync(corpus_sources(config, root))
+    if counts["added"] or counts["updated"] or counts["removed"]:
+        print_fn(
+            f"Corpus index: {counts['added']} sources added, {counts['updated']} updated, {counts['removed']} removed;"
+            f" {counts['statements']} statements"
+        )
+    return index
+
+
+def match_truths(pairs: list[dict], config: dict, root: Path, *, print_fn=print) -> list[dict]:
+    """
+    Give each claim-only pair a truth from the corpus: the best match (corpus.context "best") or
+    the top_k matches joined (corpus.context "merged"). `matches` records every candidate with
+    its source, row and score. Claims that match nothing are dropped (and reported).
+    """
+    cfg = config.get("corpus") or {}
+    context = cfg.get("context", "best")
+    if context not in ("best", "merged"):
+        raise ValueError(f"Unknown corpus.context: {context!r} (best or merged)")
+    index = open_index(config, root, print_fn=print_fn)
+    try:
+        out = []
+        for pair in pairs:
+            hits = index.search(pair["claim"], cfg.get("top_k", 3))
+            if not hits:
+                print_fn(f"  [SKIP] Pair {pair['id']}: no corpus statement matches the claim")
+                continue
+            used = hits[:1] if context == "best" else hits
+            matches = []
+            for hit in hits:
+                source = Path(hit.source)
+                matches.append(hit.ref() | {
+                    "source": str(source.relative_to(root)) if source.is_relative_to(root) else hit.source,
+                    "used": hit in used,
+                })
+            out.append(pair | {"truth": "\n\n".join(hit.text for hit in used), "matches": matches})
+        return out
+    finally:
+        index.close()
@@ -0,0 +1,262 @@
+"""Persistent inverted index over a corpus of reference statements (claim-only corpus mode)."""
+
+import csv
+import glob
+import hashlib
+import sqlite3
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from coalesce import normalize_text
+
+from .bm25 import numbers, tokenize
+
+# One row of packed postings per (term, source), clustered by term (WITHOUT ROWID): a lookup reads
+# a contiguous run per query term and scores it vectorised; re-indexing a source rewrites only its
+# rows. The file is memory-mapped, so warm lookups do not go through read() at all.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    column TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS docs (
+    doc INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    row INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS docs_source ON docs(source);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    source TEXT NOT NULL,
+    postings BLOB NOT NULL,
+    PRIMARY KEY (term, source)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_source ON postings(source);
+"""
+
+_MMAP_BYTES = 1 << 30
+_POSTING = np.dtype("<i4")  # flat (doc, tf, length) triples
+# A claim under test may have changed its figures, so a shared number counts for less than a shared word
+_NUMBER_WEIGHT = 0.5
+
+
+def index_terms(text: str) -> list[str]:
+    """Terms a statement is indexed (and a claim looked up) under: its tokens plus "#" + each normalised number."""
+    return tokenize(text) + [f"#{n}" for n in numbers(text)]
+
+
+@dataclass
+class Hit:
+    """One retrieved reference statement."""
+
+    doc: int
+    score: float
+    text: str
+    source: str
+    row: int
+
+    def ref(self) -> dict:
+        """JSON-safe provenance, for traces."""
+        return {"source": self.source, "row": self.row, "score": round(self.score, 4)}
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CorpusIndex:
+    """
+    BM25 over every statement in the corpus sources, stored in one SQLite file. `sync` brings
+    the index up to date with the sources: a source whose size, mtime and then content hash are
+    unchanged is skipped, a changed one is re-indexed, a dropped one removed. Lookups only read
+    the postings of the claim's terms.
+    """
+
+    def __init__(self, path: str | Path, *, k1: float = 1.5, b: float = 0.75) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.k1 = k1
+        self.b = b
+        self.conn = sqlite3.connect(str(self.path), timeout=60, isolation_level=None, check_same_thread=False)
+        self.conn.execute(f"PRAGMA mmap_size = {_MMAP_BYTES}")
+        self._lock = threading.RLock()
+        with self._transaction() as cur:
+            for statement in filter(str.strip, _SCHEMA.split(";")):
+                cur.execute(statement)
+        self._load_stats()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                yield cur
+                cur.execute("COMMIT")
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+
+    def _load_stats(self) -> None:
+        with self._lock:
+            n, total = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM docs").fetchone()
+            self.max_doc = self.conn.execute("SELECT COALESCE(MAX(doc), 0) FROM docs").fetchone()[0]
+        self.n_docs = n
+        self.avgdl = total / n if n else 0.0
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # --- Building ---
+
+    def sync(self, sources: list[tuple[str | Path, str]]) -> dict[str, int]:
+        """
+        Index `sources` ([(csv path, column)]) incrementally. Returns counts of sources
+        added / updated / unchanged / removed and the total statements indexed.
+        """
+        counts = Counter(added=0, updated=0, unchanged=0, removed=0)
+        wanted = {str(Path(path).resolve()): column for path, column in sources}
+        with self._lock:
+            known = {row[0]: row[1:] for row in self.conn.execute("SELECT path, column, mtime_ns, size, sha256 FROM sources")}
+        for path, column in wanted.items():
+            stat = Path(path).stat()
+            old = known.get(path)
+            if old is not None and old[:3] == (column, stat.st_mtime_ns, stat.st_size):
+                counts["unchanged"] += 1
+                continue
+            sha = _sha256(Path(path))
+            if old is not None and old[0] == column and old[3] == sha:  # touched, same content
+                with self._transaction() as cur:
+                    cur.execute("UPDATE sources SET mtime_ns = ?, size = ? WHERE path = ?", (stat.st_mtime_ns, stat.st_size, path))
+                counts["unchanged"] += 1
+                continue
+            self._index_source(path, column, stat.st_mtime_ns, stat.st_size, sha)
+            counts["updated" if old is not None else "added"] += 1
+        for path in set(known) - set(wanted):
+            with self._transaction() as cur:
+                self._remove_source(cur, path)
+            counts["removed"] += 1
+        self._load_stats()
+        counts["statements"] = self.n_docs
+        return dict(counts)
+
+    def _remove_source(self, cur: sqlite3.Cursor, path: str) -> None:
+        cur.execute("DELETE FROM postings WHERE source = ?", (path,))
+        cur.execute("DELETE FROM docs WHERE source = ?", (path,))
+        cur.execute("DELETE FROM sources WHERE path = ?", (path,))
+
+    def _index_source(self, path: str, column: str, mtime_ns: int, size: int, sha: str) -> None:
+        with open(path, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        if rows and column not in rows[0]:
+            raise KeyError(f"Corpus source {path} has no column {column!r}")
+        with self._transaction() as cur:
+            self._remove_source(cur, path)
+            postings: dict[str, list[tuple[int, int, int]]] = {}
+            for row, record in enumerate(rows):
+                text = (record.get(column) or "").strip()
+                if not text:
+                    continue
+                terms = Counter(index_terms(text))
+                length = sum(terms.values())
+                cur.execute("INSERT INTO docs (source, row, text, length) VALUES (?, ?, ?, ?)", (path, row, text, length))
+                for term, tf in terms.items():
+                    postings.setdefault(term, []).append((cur.lastrowid, tf, length))
+            cur.executemany(
+                "INSERT INTO postings (term, source, postings) VALUES (?, ?, ?)",
+                [(term, path, np.array(entries, dtype=_POSTING).tobytes()) for term, entries in postings.items()],
+            )
+            cur.execute(
+                "INSERT INTO sources (path, column, mtime_ns, size, sha256) VALUES (?, ?, ?, ?, ?)",
+                (path, column, mtime_ns, size, sha),
+            )
+
+    # --- Lookup ---
+
+    def search(self, claim: str, k: int = 3) -> list[Hit]:
+        """
+        The `k` best statements for `claim` by BM25 over word and number terms, best first.
+        Statements with the same normalised text (the same truth in several sources) count once.
+        """
+        terms = sorted(set(index_terms(claim)))
+        if not self.n_docs or not terms:
+            return []
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT term, postings FROM postings WHERE term IN ({','.join('?' * len(terms))})", terms
+            ).fetchall()
+        if not rows:
+            return []
+        # All postings in one array; df (and so idf) per term from the sizes of its rows
+        sizes = np.fromiter((len(blob) // (3 * _POSTING.itemsize) for _, blob in rows), dtype=np.int64, count=len(rows))
+        row_terms = [term for term, _ in rows]
+        df: Counter = Counter()
+        for term, size in zip(row_terms, sizes.tolist()):
+            df[term] += size
+        row_df = np.fromiter((df[term] for term in row_terms), dtype=np.float64, count=len(rows))
+        row_weight = np.fromiter((_NUMBER_WEIGHT if t[0] == "#" else 1.0 for t in row_terms), dtype=np.float64, count=len(rows))
+        idf = np.repeat(row_weight * np.log(1 + (self.n_docs - row_df + 0.5) / (row_df + 0.5)), sizes)
+        p = np.frombuffer(b"".join(blob for _, blob in rows), dtype=_POSTING).reshape(-1, 3)
+        tf = p[:, 1].astype(np.float64)
+        norm = self.k1 * (1 - self.b) + (self.k1 * self.b / self.avgdl) * p[:, 2]
+        weights = idf * (self.k1 + 1) * tf / (tf + norm)
+        n = k * 4  # spare candidates for duplicate texts
+        if len(p) * 4 >= self.max_doc:
+            # Dense scores indexed by doc id: one pass, no sorting
+            scores = np.bincount(p[:, 0], weights=weights, minlength=self.max_doc + 1)
+            candidates = np.argpartition(-scores, n)[:n] if n < len(scores) else np.arange(len(scores))
+            doc_ids = np.arange(len(scores))
+        else:
+            # Few postings against a large corpus: sum per distinct doc instead
+            doc_ids, slots = np.unique(p[:, 0], return_inverse=True)
+            scores = np.bincount(slots, weights=weights)
+            candidates = np.argpartition(-scores, n)[:n] if n < len(scores) else np.arange(len(scores))
+        candidates = [int(i) for i in candidates if scores[i] > 0]
+        ranked = sorted(candidates, key=lambda i: (-scores[i], doc_ids[i]))
+        top = [int(doc_ids[i]) for i in ranked]
+        score_of = {int(doc_ids[i]): float(scores[i]) for i in ranked}
+        with self._lock:
+            found = {
+                doc: (source, row, text)
+                for doc, source, row, text in self.conn.execute(
+                    f"SELECT doc, source, row, text FROM docs WHERE doc IN ({','.join('?' * len(top))})",
+                    top,
+                )
+            }
+        hits, seen = [], set()
+        for doc in top:
+            source, row, text = found[doc]
+            key = normalize_text(text).lower()
+            if key in seen:
+                continue
+            seen.add(key)
+            hits.append(Hit(doc=doc, score=score_of[doc], text=text, source=source, row=row))
+            if len(hits) == k:
+                break
+        return hits
+
+
+def corpus_sources(config: dict, root: Path) -> list[tuple[Path, str]]:
+    """(csv path, column) for every file matched by config['corpus']['sources'] (globs relative to `root`)."""
+    out = []
+    for source in (config.get("corpus") or {}).get("sources") or [{"path": "data/*.csv", "column": "truth"}]:
+        paths = sorted(glob.glob(str(root / source["path"])))
+        if not paths:
+            raise FileNotFoundError(f"Corpus source matches no files: {root / source['path']}")
+        out.extend((Path(p), source.get("column", "truth")) for p in paths)
+    return out
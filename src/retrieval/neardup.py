@@ -0,0 +1,322 @@
+"""
+Near-duplicate pairs: MinHash signatures of claim and truth shingles, LSH buckets to find candidates,
+and a persistent store of the results judged so far.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import warnings
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from coalesce import normalize_text
+
+from .bm25 import numbers, tokenize
+
+_PRIME = (1 << 61) - 1
+STORE_VERSION = 3  # PRAGMA user_version of the store; an older file is set aside, not reused
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    entry INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    gate TEXT NOT NULL,
+    words TEXT NOT NULL,
+    pair_id TEXT,
+    claim TEXT NOT NULL,
+    truth TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    band INTEGER NOT NULL,
+    key INTEGER NOT NULL,
+    entry INTEGER NOT NULL,
+    PRIMARY KEY (band, key, entry)
+) WITHOUT ROWID;
+"""
+
+
+# Words that change what a number means ("more than 100" / "less than 100") or negate a claim:
+# two pairs only count as near-duplicates if they use the same kinds, like the same numbers.
+# Synonyms share a kind, so "about" / "approximately" or "over" / "more than" still match.
+_QUALIFIER_KINDS = {
+    "not": "not no never none nor without",
+    "more": "more over above higher larger greater exceeding",
+    "less": "less fewer under below lower smaller",
+    "about": "about approximately nearly almost around roughly",
+    "least": "least", "most": "most", "only": "only", "exactly": "exactly",
+    "before": "before", "after": "after", "first": "first", "last": "last",
+}
+_QUALIFIERS = {word: kind for kind, words in _QUALIFIER_KINDS.items() for word in words.split()}
+
+
+# Numbers written as words; digits are normalised by retrieval.numbers
+_WORD_NUMBERS = frozenset(
+    "zero one two three four five six seven eight nine ten eleven twelve thirteen fourteen fifteen sixteen"
+    " seventeen eighteen nineteen twenty thirty forty fifty sixty seventy eighty ninety hundred thousand million"
+    " billion trillion dozen dozens half quarter third twice thrice double triple single once first second"
+    " fourth fifth sixth seventh eighth ninth tenth hundreds thousands millions billions".split()
+)
+
+
+def shingles(text: str, k: int = 5) -> set[int]:
+    """
+    Hashed character k-grams of a text. Case, spacing and punctuation are dropped first, so
+    "Amharic ," and "Amharic," shingle the same.
+    """
+    text = re.sub(r"[^\w%$]+", "", normalize_text(text).lower()).encode("utf-8")
+    return {zlib.crc32(text[i:i + k]) for i in range(max(len(text) - k + 1, 1))}
+
+
+def _words(text: str) -> set[str]:
+    return set(re.findall(r"[a-z]+", normalize_text(text).lower()))
+
+
+def numeric_key(claim: str, truth: str) -> str:
+    """
+    The normalised numbers of claim and truth, written in digits or in words ("two weeks"), and
+    the kinds of qualifier in the claim (comparisons, approximations, negations).
+    """
+    return json.dumps([
+        sorted(numbers(claim)),
+        sorted(numbers(truth)),
+        sorted(_words(claim) & _WORD_NUMBERS),
+        sorted(_words(truth) & _WORD_NUMBERS),
+        sorted({_QUALIFIERS[w] for w in _words(claim) if w in _QUALIFIERS}),
+    ])
+
+
+def reuse_key(claim: str, truth: str) -> str:
+    """What two pairs must share exactly to count as near-duplicates: the numeric key."""
+    return numeric_key(claim, truth)
+
+
+def content_words(claim: str) -> frozenset[str]:
+    """The claim's content words (stopwords, plurals, case and punctuation aside), numbers left out."""
+    return frozenset(w for w in tokenize(claim) if not any(c.isdigit() for c in w))
+
+
+def word_similarity(a: frozenset[str], b: frozenset[str]) -> float:
+    """Jaccard similarity of two claims' content words (1.0 when both have none)."""
+    return len(a & b) / len(a | b) if a | b else 1.0
+
+
+class MinHasher:
+    """`num_perm` MinHash functions (a·x + b mod 2^61-1), fixed by `seed` so signatures persist."""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1) -> None:
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, 1 << 31, num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, 1 << 31, num_perm, dtype=np.uint64)
+
+    def signature(self, hashes: set[int]) -> np.ndarray:
+        x = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+        return ((np.outer(x, self.a) + self.b) % _PRIME).min(axis=0)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    return float(np.mean(a == b))
+
+
+def pair_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Similarity of two pair signatures (claim half, truth half): the lower of the claim and truth similarities."""
+    n = len(a) // 2
+    return min(similarity(a[:n], b[:n]), similarity(a[n:], b[n:]))
+
+
+def band_keys(signature: np.ndarray, bands: int) -> list[int]:
+    """One signed 64-bit LSH bucket key per band of the signature."""
+    rows = len(signature) // bands
+    return [
+        int.from_bytes(
+            hashlib.blake2b(signature[i * rows:(i + 1) * rows].tobytes(), digest_size=8).digest(), "big", signed=True
+        )
+        for i in range(bands)
+    ]
+
+
+@dataclass
+class Match:
+    """A stored pair similar enough to reuse, and its result."""
+
+    entry: int
+    pair_id: str | None
+    claim: str
+    similarity: float
+    result: dict
+
+    def ref(self) -> dict:
+        """JSON-safe provenance, for traces."""
+        return {"entry": self.entry, "pair_id": self.pair_id, "claim": self.claim, "similarity": round(self.similarity, 3)}
+
+
+class NearDuplicates:
+    """
+    Judged pairs by MinHash signature, in one SQLite file. Signatures are split into `bands`
+    LSH bands: pairs sharing any band are candidates, and a candidate matches when the estimated
+    similarity of both its claim and its truth reaches `threshold`, it has the same reuse key
+    (numbers, qualifier kinds) and config fingerprint, and the Jaccard similarity of the two
+    claims' content words reaches `word_threshold`.
+
+    The word check bounds how much of the claim may change, not which words: a one-word swap
+    that changes the verdict ("pandemic" / "flu") passes it as easily as a paraphrase ("sold" /
+    "sells") in a claim long enough to stay above the threshold.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        threshold: float = 0.85,
+        word_threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_chars: int = 5,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self.word_threshold = word_threshold
+        self.bands = bands
+        self.shingle_chars = shingle_chars
+        self.hasher = MinHasher(num_perm)
+        self._set_aside_old_store()
+        self.conn = sqlite3.connect(str(self.path), timeout=60, isolation_level=None, check_same_thread=False)
+        self._lock = threading.RLock()
+        with self._transaction() as cur:
+            for statement in filter(str.strip, _SCHEMA.split(";")):
+                cur.execute(statement)
+            cur.execute(f"PRAGMA user_version = {STORE_VERSION}")
+
+    def _set_aside_old_store(self) -> None:
+        """Rename a store written with another gate to <path>.v<version> (kept, with a warning)."""
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return
+        conn = sqlite3.connect(str(self.path))
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            tables = conn.execute("SELECT count(*) FROM sqlite_master WHERE name = 'entries'").fetchone()[0]
+        finally:
+            conn.close()
+        if version == STORE_VERSION or not tables:
+            return
+        kept = self.path.with_name(f"{self.path.name}.v{version}")
+        self.path.replace(kept)
+        warnings.warn(
+            f"Near-duplicate store {self.path} was written by an older version (gate v{version}, now"
+            f" v{STORE_VERSION}); starting a new one. The old store is kept as {kept}.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                yield cur
+                cur.execute("COMMIT")
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+
+    def signature(self, claim: str, truth: str) -> np.ndarray:
+        """The claim's signature followed by the truth's."""
+        return np.concatenate([
+            self.hasher.signature(shingles(claim, self.shingle_chars)),
+            self.hasher.signature(shingles(truth, self.shingle_chars)),
+        ])
+
+    def band_keys(self, signature: np.ndarray) -> list[int]:
+        """Bucket keys of the claim half: a candidate needs a similar claim, not only the same truth."""
+        return band_keys(signature[: len(signature) // 2], self.bands)
+
+    def lookup(self, claim: str, truth: str, fingerprint: str) -> Match | None:
+        """The most similar stored pair that can be reused for this one, or None."""
+        signature = self.signature(claim, truth)
+        keys = self.band_keys(signature)
+        clause = " OR ".join(["(b.band = ? AND b.key = ?)"] * len(keys))
+        args = [v for band, key in enumerate(keys) for v in (band, key)]
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT DISTINCT e.entry, e.pair_id, e.claim, e.words, e.signature, e.result FROM buckets b"
+                f" JOIN entries e ON e.entry = b.entry WHERE ({clause}) AND e.fingerprint = ? AND e.gate = ?",
+                [*args, fingerprint, reuse_key(claim, truth)],
+            ).fetchall()
+        words = content_words(claim)
+        best = None
+        for entry, pair_id, stored_claim, stored_words, blob, result in rows:
+            if word_similarity(words, frozenset(json.loads(stored_words))) < self.word_threshold:
+                continue
+            score = pair_similarity(signature, np.frombuffer(blob, dtype=np.uint64))
+            if score >= self.threshold and (best is None or score > best.similarity):
+                best = Match(entry=entry, pair_id=pair_id, claim=stored_claim, similarity=score, result=json.loads(result))
+        return best
+
+    def add(self, claim: str, truth: str, fingerprint: str, result: dict, *, pair_id=None) -> int:
+        """Store a judged pair and its JSON-safe `result`; returns the entry id."""
+        signature = self.signature(claim, truth)
+        with self._transaction() as cur:
+            cur.execute(
+                "INSERT INTO entries (fingerprint, gate, words, pair_id, claim, truth, signature, result, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    fingerprint, reuse_key(claim, truth), json.dumps(sorted(content_words(claim))),
+                    None if pair_id is None else str(pair_id), claim, truth,
+                    signature.tobytes(), json.dumps(result), time.time(),
+                ),
+            )
+            entry = cur.lastrowid
+            cur.executemany(
+                "INSERT OR IGNORE INTO buckets (band, key, entry) VALUES (?, ?, ?)",
+                [(band, key, entry) for band, key in enumerate(self.band_keys(signature))],
+            )
+        return entry
+
+
+@lru_cache(maxsize=4)
+def _open(
+    path: str, threshold: float, word_threshold: float, num_perm: int, bands: int, shingle_chars: int
+) -> NearDuplicates:
+    return NearDuplicates(
+        path,
+        threshold=threshold,
+        word_threshold=word_threshold,
+        num_perm=num_perm,
+        bands=bands,
+        shingle_chars=shingle_chars,
+    )
+
+
+def get_near_duplicates(config: dict) -> NearDuplicates | None:
+    """Shared store for config['coalesce']['near_duplicates'] (path relative to project root), or None if disabled."""
+    cfg = (config.get("coalesce") or {}).get("near_duplicates") or {}
+    if not cfg.get("enabled", False):
+        return None
+    path = Path(cfg.get("path", "eval/near_duplicates.sqlite"))
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parent.parent.parent / path
+    return _open(
+        str(path),
+        cfg.get("threshold", 0.85),
+        cfg.get("word_threshold", 0.8),
+        cfg.get("num_perm", 128),
+        cfg.get("bands", 32),
+        cfg.get("shingle_chars", 5),
+    )
@@ -0,0 +1,155 @@
+"""Pick the passages of a long reference that matter for a claim (config['passages'])."""
+
+import re
+from dataclasses import dataclass, field
+
+from .bm25 import BM25, names, numbers, tokenize
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])([\"')\]”’]*)\s+(?=[\"'(\[“‘]?[A-Z0-9])|\n\s*\n")
+_PARAGRAPH_END = re.compile(r"\n\s*\n")
+# "U.S. Army", "Dr. Smith", "e.g. the": a full stop that does not end the sentence
+_ABBREVIATION = re.compile(r"(?:\b(?:[A-Za-z]\.){2,}|\b(?:Mr|Mrs|Ms|Dr|Prof|St|Jr|Sr|Inc|Ltd|Co|Corp|vs|etc|No|Fig|Gen|Gov|Sen|Rep)\.)$")
+GAP = " [...] "
+
+DEFAULT_WEIGHTS = {"bm25": 1.0, "numbers": 0.5, "names": 0.3}
+
+
+@dataclass
+class Selection:
+    """Context built from the chosen passages, and their character spans in the full reference."""
+
+    text: str
+    spans: list[dict] = field(default_factory=list)  # [{"start", "end", "score"}], in reading order
+
+
+def split_passages(text: str, unit: str = "sentence") -> list[tuple[int, int]]:
+    """(start, end) character offsets of the sentences (or blank-line paragraphs) of `text`."""
+    if unit not in ("sentence", "paragraph"):
+        raise ValueError(f"Unknown passages.unit: {unit!r} (sentence or paragraph)")
+    pattern = _SENTENCE_END if unit == "sentence" else _PARAGRAPH_END
+    spans, start = [], 0
+    for m in pattern.finditer(text):
+        end = m.start()
+        if unit == "sentence" and m.group(1) is not None:  # after . ! ? (and closing quotes)
+            if _ABBREVIATION.search(text, max(end - 16, 0), end):
+                continue
+            end = m.end(1)
+        spans.append((start, end))
+        start = m.end()
+    spans.append((start, len(text)))
+    # Trim surrounding whitespace and drop empty pieces
+    out = []
+    for s, e in spans:
+        piece = text[s:e]
+        s += len(piece) - len(piece.lstrip())
+        e -= len(piece) - len(piece.rstrip())
+        if e > s:
+            out.append((s, e))
+    return out
+
+
+def score_passages(claim: str, texts: list[str], weights: dict | None = None) -> list[float]:
+    """
+    Relevance of each passage to the claim: BM25 (scaled to the best passage) plus the share
+    of the claim's numbers and of its names that the passage repeats. A mutated claim often
+    changes a number, so a passage sharing the claim's names but not its figures still ranks.
+    """
+    weights = DEFAULT_WEIGHTS | (weights or {})
+    bm25 = BM25([tokenize(t) for t in texts]).scores(tokenize(claim))
+    top = max(bm25, default=0.0) or 1.0
+    claim_numbers, claim_names = numbers(claim), names(claim)
+    out = []
+    for text, lexical in zip(texts, bm25):
+        score = weights["bm25"] * lexical / top
+        if claim_numbers:
+            score += weights["numbers"] * len(claim_numbers & numbers(text)) / len(claim_numbers)
+        if claim_names:
+            score += weights["names"] * len(claim_names & names(text)) / len(claim_names)
+        out.append(score)
+    return out
+
+
+def select_passages(
+    claim: str,
+    truth: str,
+    *,
+    unit: str = "sentence",
+    top_k: int = 4,
+    window: int = 1,
+    max_chars: int = 2000,
+    weights: dict | None = None,
+) -> Selection:
+    """
+    The `top_k` best passages for the claim, each with `window` neighbours on either side,
+    merged where they touch and joined in reading order with GAP where text was left out.
+    Passages are taken best first until `max_chars` is reached, so the context stays the same
+    size however long the reference is. The best one is always kept: without its neighbours if
+    they do not fit, and cut to `max_chars` (at a word boundary) if it is longer on its own.
+    """
+    bounds = split_passages(truth, unit)
+    if not bounds:
+        return Selection(text=truth)
+    scores = score_passages(claim, [truth[s:e] for s, e in bounds], weights)
+    ranked = sorted(range(len(bounds)), key=lambda i: (-scores[i], i))
+    chosen: dict[int, float] = {}  # passage index -> score of the hit it was kept for
+    cut: dict[int, int] = {}  # passage index -> end offset, for a best passage longer than max_chars
+    seen: set[str] = set()  # hit texts already kept (a passage repeated in the reference counts once)
+    size = 0
+    for hit in ranked:
+        if len(seen) == top_k:
+            break
+        passage = truth[bounds[hit][0]:bounds[hit][1]]
+        if passage in seen:
+            continue
+        lo, hi = max(hit - window, 0), min(hit + window, len(bounds) - 1)
+        new = [i for i in range(lo, hi + 1) if i not in chosen]
+        extra = sum(bounds[i][1] - bounds[i][0] + len(GAP) for i in new)
+        if chosen and size + extra > max_chars:
+            continue  # too big: does not count towards top_k, a smaller hit may still fit
+        if not chosen and extra > max_chars:  # the best hit: drop its neighbours, then cut it
+            start, end = bounds[hit]
+            new, extra = [hit], min(end - start, max_chars)
+            if end - start > max_chars:
+                space = truth.rfind(" ", start, start + max_chars + 1)
+                cut[hit] = space if space > start else start + max_chars
+                extra = max_chars  # full: nothing else fits
+        seen.add(passage)
+        for i in new:
+            chosen[i] = scores[hit]
+        size += extra
+    runs: list[list[int]] = []
+    for i in sorted(chosen):
+        if runs and runs[-1][-1] == i - 1:
+            runs[-1].append(i)
+        else:
+            runs.append([i])
+    spans = [
+        {"start": bounds[r[0]][0], "end": cut.get(r[-1], bounds[r[-1]][1]), "score": round(max(chosen[i] for i in r), 4)}
+        for r in runs
+    ]
+    pieces = [truth[s["start"]:s["end"]] for s in spans]
+    text = GAP.join(pieces)
+    if spans[0]["start"] > 0:
+        text = GAP.lstrip() + text
+    if spans[-1]["end"] < len(truth.rstrip()):
+        text = text + GAP.rstrip()
+    return Selection(text=text, spans=spans)
+
+
+def prune_truth(claim: str, truth: str, config: dict) -> Selection | None:
+    """
+    Selection of a long truth per config['passages'], or None when the whole truth should be
+    used (pruning disabled, or the truth no longer than `min_chars`).
+    """
+    cfg = config.get("passages") or {}
+    if not cfg.get("enabled", False) or len(truth) <= cfg.get("min_chars", 2000):
+        return None
+    return select_passages(
+        claim,
+        truth,
+        unit=cfg.get("unit", "sentence"),
+        top_k=cfg.get("top_k", 4),
+        window=cfg.get("window", 1),
+        max_chars=cfg.get("max_chars", 2000),
+        weights=cfg.get("weights"),
+    )
@@ -1,5 +1,5 @@
 from .fact_frame import Fact, FactFrame
-from .jury_output import Evidence, JuryOutput
+from .jury_output import Evidence, JuryOutput, RevoteOutput, SampledJuryOutput
 from .verdict import AxisResult, Verdict
 from .debate_status import DebateStatus
 
@@ -8,6 +8,8 @@ __all__ = [
     "FactFrame",
     "Evidence",
     "JuryOutput",
+    "RevoteOutput",
+    "SampledJuryOutput",
     "AxisResult",
     "Verdict",
     "DebateStatus",
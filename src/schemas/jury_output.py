@@ -1,12 +1,10 @@
 from pydantic import BaseModel, Field
 
-from .fact_frame import Fact
-
 
 class Evidence(BaseModel):
-    """One piece of evidence supporting the agent's verdict."""
-    fact: Fact = Field(
-        description="The fact that is evidence for the verdict"
+    """One piece of evidence supporting the agent's verdict: a FactFrame fact, by index."""
+    fact_index: int = Field(
+        description="Index [i] of the fact in EXTRACTED FACTS"
     )
     issue: str = Field(
         description="Brief description of the mismatch or concern"
@@ -30,3 +28,29 @@ class JuryOutput(BaseModel):
     reasoning: str = Field(
         description="Free-form explanation of the verdict",
     )
+
+
+class RevoteOutput(BaseModel):
+    """Output from each jury agent in the revote (Round 2): the evidence trail is in the initial vote."""
+    verdict: str = Field(
+        description="Faithful or Mutated",
+    )
+    confidence: float = Field(
+        ge=0.0,
+        le=1.0,
+        description="Confidence in the verdict, 0.0 to 1.0",
+    )
+    reasoning: str = Field(
+        description="What the debate changed or confirmed in your view, in one or two sentences",
+    )
+
+
+class SampledJuryOutput(JuryOutput):
+    """
+    Majority of an agent's self-consistency samples (agents[].samples). Verdict, evidence and
+    reasoning come from the most confident majority sample; confidence is the agreement times
+    the majority samples' mean confidence.
+    Built locally, never requested from a model.
+    """
+    agreement: float = Field(description="Share of the k samples asked for that agree with the majority verdict")
+    samples: list[JuryOutput | RevoteOutput] = Field(description="Every sample drawn, in order")
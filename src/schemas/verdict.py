@@ -1,6 +1,7 @@
 from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
 
 
 VerdictLabel = Literal["Faithful", "Mutated"]
@@ -45,3 +46,8 @@ class Verdict(BaseModel):
         default=None,
         description="Note if significant dissent from jury (2+ agents on minority verdict)",
     )
+    # Filled in by the pipeline, not the model (hidden from the structured-output schema)
+    degradations: SkipJsonSchema[list[str]] = Field(
+        default_factory=list,
+        description="Budget degradation steps applied while reaching this verdict",
+    )
@@ -0,0 +1,34 @@
+"""HTTP judging service. Keeps the compiled graph and model clients warm between requests."""
+
+import argparse
+
+from dotenv import load_dotenv
+
+from config import load_config
+from service import create_app
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", type=str, default=None, help="Path to config YAML. Default: config.yaml")
+    parser.add_argument("--host", type=str, default=None, help="Bind address. Default: service.host")
+    parser.add_argument("--port", type=int, default=None, help="Port. Default: service.port")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    config["interactive"] = False
+    service_cfg = config.get("service", {}) or {}
+
+    import uvicorn
+
+    uvicorn.run(
+        create_app(config),
+        host=args.host or service_cfg.get("host", "127.0.0.1"),
+        port=args.port or service_cfg.get("port", 8000),
+        log_level="info",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from .app import JuryService, create_app, pair_result
+from .metrics import Metrics
+
+__all__ = ["JuryService", "create_app", "pair_result", "Metrics"]
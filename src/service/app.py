@@ -0,0 +1,318 @@
+"""
+ASGI judging service: POST /judge, streaming POST /judge/batch (NDJSON), GET /metrics.
+
+The compiled graph and model clients are built once at startup and shared by all requests.
+Pipelines run on a bounded worker pool; when in-flight plus queued pairs reach capacity,
+new requests are rejected with 503 and Retry-After instead of piling up.
+"""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+
+from agents.llm import chat_model, llm_calls
+from coalesce import SingleFlight, pair_key
+from prompts import configure as configure_prompts
+from workflow import get_graph, run_pipeline
+from workflow.checkpoint import get_checkpointer
+
+from .metrics import Metrics
+
+
+def _votes(outputs) -> dict[str, str]:
+    return {name: out.verdict for name, out in (outputs or {}).items()}
+
+
+def pair_result(pair_id, state: dict, latency_s: float) -> dict:
+    """JSON-safe summary of a finished pipeline state."""
+    verdict = state.get("verdict")
+    result = {
+        "id": pair_id,
+        "verdict": verdict.model_dump() if verdict else None,
+        "initial_votes": _votes(state.get("initial_vote_outputs")),
+        "revote_votes": _votes(state.get("revote_outputs")),
+        "debate_rounds": state.get("debate_round_idx", 0),
+        "degradations": state.get("degradations") or [],
+        "latency_s": round(latency_s, 3),
+    }
+    if state.get("truth_spans"):
+        result["truth_spans"] = state["truth_spans"]  # passages of a long truth the prompts saw
+    if state.get("reused_from"):
+        result["reused_from"] = state["reused_from"]  # near-duplicate pair whose verdict was returned
+    return result
+
+
+class JuryService:
+    """Runs pairs on a bounded pool of warm workers, with admission control."""
+
+    def __init__(
+        self, config: dict, *, max_in_flight: int = 8, max_queue: int = 32, max_batch: int | None = None
+    ) -> None:
+        self.config = config
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        # A batch's pairs are admitted together, so a larger batch could never be admitted
+        self.max_batch = self.capacity if max_batch is None else max_batch
+        if self.max_batch > self.capacity:
+            raise ValueError(
+                f"service.max_batch ({self.max_batch}) exceeds max_in_flight + max_queue ({self.capacity}):"
+                " such a batch could never be admitted"
+            )
+        self.metrics = Metrics()
+        self.pairs = SingleFlight()
+        self.executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="jury")
+        self._slots: asyncio.Semaphore | None = None
+
+    def warm(self) -> None:
+        """Load the prompts, compile the graph and create the pooled clients before the first request."""
+        configure_prompts(reload_s=(self.config.get("service") or {}).get("prompt_reload_s"))
+        get_graph(get_checkpointer(self.config))  # the graph run_pipeline compiles for this config
+        for component in self.config.get("components", {}):
+            chat_model(component, self.config)
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def capacity(self) -> int:
+        """Pairs that may be running or waiting at once; more than that in one batch never fits."""
+        return self.max_in_flight + self.max_queue
+
+    def has_capacity(self, pairs: int = 1) -> bool:
+        return self.metrics.in_flight + self.metrics.queued + pairs <= self.capacity
+
+    def admit(self, pairs: int = 1) -> bool:
+        """
+        Count a request's `pairs` as queued if they fit, before any of them starts; False (nothing
+        counted) when they do not. Pass admitted=True to judge / judge_batch for admitted pairs.
+        """
+        if not self.has_capacity(pairs):
+            return False
+        self.metrics.add("queued", pairs)
+        return True
+
+    def _pair_config(self, pair: dict) -> dict:
+        """Config for one request; deadline_s / max_tokens / max_usd in the body override budget.pair."""
+        overrides = {k: pair[k] for k in ("deadline_s", "max_tokens", "max_usd") if pair.get(k) is not None}
+        if not overrides:
+            return self.config
+        budget = self.config.get("budget", {}) or {}
+        return self.config | {"budget": budget | {"pair": (budget.get("pair") or {}) | overrides}}
+
+    def _run(self, pair: dict, config: dict) -> dict:
+        t0 = time.perf_counter()
+        try:
+            state = run_pipeline(pair["claim"], pair["truth"], config, pair_id=pair.get("id"))
+        except Exception:
+            self.metrics.observe_pair(None, time.perf_counter() - t0)
+            raise
+        latency = time.perf_counter() - t0
+        verdict = state.get("verdict")
+        self.metrics.observe_pair(verdict.verdict if verdict else None, latency)
+        return pair_result(pair.get("id"), state, latency)
+
+    def pair_key(self, pair: dict) -> str:
+        return pair_key(pair["claim"], pair["truth"], self._pair_config(pair))
+
+    async def judge(self, pair: dict, *, admitted: bool = False) -> dict:
+        """Judge one pair. Concurrent requests for the same pair (and config) share one run."""
+        key = self.pair_key(pair)
+        future, leader = self.pairs.claim(key)
+        if not leader:
+            if admitted:
+                self.metrics.add("queued", -1)  # shares the leader's run: never waits for a worker
+            result = await asyncio.wrap_future(future)
+            return result | {"id": pair.get("id"), "coalesced": True}
+        try:
+            result = await self._judge(pair, admitted=admitted)
+        except BaseException as e:
+            self.pairs.resolve(key, future, error=e)
+            raise
+        self.pairs.resolve(key, future, result)
+        return result
+
+    async def _judge(self, pair: dict, *, admitted: bool = False) -> dict:
+        """Wait for a worker slot, then run the pipeline off the event loop."""
+        if self._slots is None:
+            self.warm()
+        if not admitted:
+            self.metrics.add("queued", 1)
+        waiting = True
+        try:
+            async with self._slots:
+                self.metrics.add("queued", -1)
+                waiting = False
+                self.metrics.add("in_flight", 1)
+                try:
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(self.executor, self._run, pair, self._pair_config(pair))
+                finally:
+                    self.metrics.add("in_flight", -1)
+        finally:
+            if waiting:
+                self.metrics.add("queued", -1)
+
+    async def judge_batch(self, pairs: list[dict], *, admitted: bool = False):
+        """
+        Yield results as they complete, keeping at most max_in_flight pairs of this batch pending.
+        Repeats of a pair within the batch reuse the first occurrence's result. With `admitted`,
+        the batch's pairs were counted as queued by `admit` and each is released as it starts.
+        """
+        pending: set[asyncio.Task] = set()
+        first: dict[str, asyncio.Task] = {}
+        started = 0
+
+        async def _one(pair: dict) -> dict:
+            try:
+                return await self.judge(pair, admitted=admitted)
+            except Exception as e:
+                return {"id": pair.get("id"), "error": str(e)}
+
+        async def _repeat(original: asyncio.Task, pair: dict) -> dict:
+            if admitted:
+                self.metrics.add("queued", -1)
+            return (await original) | {"id": pair.get("id"), "coalesced": True}
+
+        try:
+            for pair in pairs:
+                key = self.pair_key(pair)
+                started += 1
+                if key in first:
+                    self.pairs.note_shared()
+                    pending.add(asyncio.create_task(_repeat(first[key], pair)))
+                    continue
+                first[key] = asyncio.create_task(_one(pair))
+                pending.add(first[key])
+                if len(pending) < self.max_in_flight:
+                    continue
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            if admitted and started < len(pairs):
+                self.metrics.add("queued", started - len(pairs))  # stopped early: release the rest
+
+
+def _validate_pair(pair) -> dict:
+    if not isinstance(pair, dict) or not isinstance(pair.get("claim"), str) or not isinstance(pair.get("truth"), str):
+        raise ValueError("Each pair needs string 'claim' and 'truth' fields")
+    return pair
+
+
+async def _read_json(receive) -> object:
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            break
+    return json.loads(body or b"null")
+
+
+async def _send(send, status: int, payload, *, content_type: str = "application/json", headers=()) -> None:
+    data = payload.encode() if isinstance(payload, str) else json.dumps(payload).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", content_type.encode()), *headers],
+    })
+    await send({"type": "http.response.body", "body": data})
+
+
+def create_app(config: dict):
+    """Build the ASGI application for a loaded config."""
+    service_cfg = config.get("service", {}) or {}
+    service = JuryService(
+        config,
+        max_in_flight=service_cfg.get("max_in_flight", 8),
+        max_queue=service_cfg.get("max_queue", 32),
+        max_batch=service_cfg.get("max_batch"),
+    )
+    busy = [(b"retry-after", b"1")]
+
+    async def app(scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    service.warm()
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    service.close()
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        if scope["type"] != "http":
+            return
+        route = (scope["method"], scope["path"].rstrip("/"))
+
+        if route == ("GET", "/metrics"):
+            dedup = {
+                "jury_pair_coalesced_total": service.pairs.shared,
+                "jury_pair_dedup_ratio": round(service.pairs.dedup_ratio, 4),
+                "jury_llm_call_coalesced_total": llm_calls.shared,
+                "jury_llm_call_dedup_ratio": round(llm_calls.dedup_ratio, 4),
+            }
+            await _send(send, 200, service.metrics.render(dedup), content_type="text/plain; version=0.0.4")
+            return
+        if route == ("GET", "/healthz"):
+            await _send(send, 200, {"status": "ok"})
+            return
+        if route not in (("POST", "/judge"), ("POST", "/judge/batch")):
+            await _send(send, 404, {"error": "Not found"})
+            return
+
+        endpoint = route[1]
+        service.metrics.inc("requests", endpoint)
+        try:
+            body = await _read_json(receive)
+            if endpoint == "/judge":
+                pairs = [_validate_pair(body)]
+            else:
+                pairs = [_validate_pair(p) for p in (body or {}).get("pairs", [])]
+                if len(pairs) > service.max_batch:
+                    raise ValueError(f"Batch too large: {len(pairs)} > {service.max_batch}")
+        except (ValueError, AttributeError) as e:
+            await _send(send, 400, {"error": str(e)})
+            return
+
+        # Every pair of the request counts against max_queue, not just the request.
+        if not service.admit(len(pairs)):
+            service.metrics.inc("rejected", endpoint)
+            await _send(send, 503, {"error": "Service at capacity, retry later"}, headers=busy)
+            return
+
+        if endpoint == "/judge":
+            try:
+                result = await service.judge(pairs[0], admitted=True)
+            except Exception as e:
+                await _send(send, 500, {"id": pairs[0].get("id"), "error": str(e)})
+                return
+            await _send(send, 200, result)
+            return
+
+        try:
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/x-ndjson")],
+            })
+        except BaseException:
+            service.metrics.add("queued", -len(pairs))
+            raise
+        # Closed here even if the client goes away, so its unstarted pairs stop counting as queued.
+        async with aclosing(service.judge_batch(pairs, admitted=True)) as results:
+            async for result in results:
+                line = json.dumps(result) + "\n"
+                await send({"type": "http.response.body", "body": line.encode(), "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    app.service = service
+    return app
@@ -0,0 +1,60 @@
+"""In-process counters for the judging service, rendered in Prometheus text format."""
+
+import threading
+from collections import Counter
+
+
+class Metrics:
+    """Thread-safe counters and gauges. Updated from the event loop and worker threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests: Counter[str] = Counter()  # by endpoint
+        self.rejected: Counter[str] = Counter()  # by endpoint, on backpressure
+        self.verdicts: Counter[str] = Counter()  # by verdict label
+        self.errors = 0
+        self.in_flight = 0
+        self.queued = 0
+        self.latency_sum_s = 0.0
+        self.latency_count = 0
+
+    def inc(self, counter: str, key: str) -> None:
+        with self._lock:
+            getattr(self, counter)[key] += 1
+
+    def add(self, gauge: str, delta: int) -> None:
+        with self._lock:
+            setattr(self, gauge, getattr(self, gauge) + delta)
+
+    def observe_pair(self, verdict: str | None, latency_s: float) -> None:
+        with self._lock:
+            if verdict is None:
+                self.errors += 1
+            else:
+                self.verdicts[verdict] += 1
+            self.latency_sum_s += latency_s
+            self.latency_count += 1
+
+    def render(self, extra: dict[str, float] | None = None) -> str:
+        """Prometheus exposition text. `extra` adds untyped gauges (e.g. from other components)."""
+        with self._lock:
+            lines = ["# TYPE jury_requests_total counter"]
+            lines += [f'jury_requests_total{{endpoint="{k}"}} {v}' for k, v in sorted(self.requests.items())]
+            lines.append("# TYPE jury_rejected_total counter")
+            lines += [f'jury_rejected_total{{endpoint="{k}"}} {v}' for k, v in sorted(self.rejected.items())]
+            lines.append("# TYPE jury_verdicts_total counter")
+            lines += [f'jury_verdicts_total{{verdict="{k}"}} {v}' for k, v in sorted(self.verdicts.items())]
+            lines += [
+                "# TYPE jury_pair_errors_total counter",
+                f"jury_pair_errors_total {self.errors}",
+                "# TYPE jury_in_flight gauge",
+                f"jury_in_flight {self.in_flight}",
+                "# TYPE jury_queued gauge",
+                f"jury_queued {self.queued}",
+                "# TYPE jury_pair_latency_seconds summary",
+                f"jury_pair_latency_seconds_sum {self.latency_sum_s:.6f}",
+                f"jury_pair_latency_seconds_count {self.latency_count}",
+            ]
+        for name, value in (extra or {}).items():
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
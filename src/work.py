@@ -0,0 +1,106 @@
+"""
+Queue-backed judging for large corpora: submit pairs to a shared work queue (one SQLite file),
+run any number of workers on one or more hosts, and watch progress.
+
+  uv run python src/work.py submit [--pairs 0,5,9 | data.pair_ids from config]
+  uv run python src/work.py worker --concurrency 8     # on each host; exits when the queue is drained
+  uv run python src/work.py status
+  uv run python src/work.py export BATCH --out results.jsonl
+"""
+
+import argparse
+import json
+import sys
+
+from dotenv import load_dotenv
+
+from config import load_config
+from jobs import open_queue, print_status
+
+
+def _submit(args, config: dict) -> None:
+    from data import load_pairs
+
+    if args.pairs:
+        config["data"] = config.get("data", {}) | {"pair_ids": [int(x) for x in args.pairs.split(",")]}
+    pairs = load_pairs(config)
+    queue = open_queue(config, args.queue)
+    batch = queue.submit(pairs, config, args.batch)
+    print(f"Submitted {len(pairs)} pairs as {batch} to {queue.path}")
+
+
+def _worker(args, config: dict) -> None:
+    from jobs.worker import Worker
+
+    jobs_cfg = config.get("jobs", {}) or {}
+    queue = open_queue(config, args.queue)
+    worker = Worker(
+        queue,
+        concurrency=args.concurrency or jobs_cfg.get("concurrency", 4),
+        batch=args.batch,
+        poll_s=jobs_cfg.get("poll_s", 2.0),
+    )
+    print(f"Worker {worker.id}: {worker.concurrency} pairs at a time from {queue.path}")
+    try:
+        worker.run(forever=args.forever)
+    except KeyboardInterrupt:
+        print("Interrupted: finishing pairs in flight")
+    print(f"Worker {worker.id}: {worker.done} done, {worker.failed} failed attempts")
+
+
+def _export(args, config: dict) -> None:
+    queue = open_queue(config, args.queue)
+    rows = queue.query(
+        "SELECT pair_id, status, attempts, result, error FROM jobs WHERE batch = ? ORDER BY job_id", (args.batch,)
+    )
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        for row in rows:
+            record = json.loads(row["result"]) if row["result"] else {"id": row["pair_id"], "error": row["error"]}
+            out.write(json.dumps(record | {"status": row["status"], "attempts": row["attempts"]}) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+            print(f"Wrote {len(rows)} results to {args.out}")
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Judge pairs through a shared work queue")
+    parser.add_argument("--config", type=str, default=None, help="Path to config YAML. Default: config.yaml")
+    parser.add_argument("--queue", type=str, default=None, help="Queue file. Default: jobs.path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    submit = commands.add_parser("submit", help="Queue the pairs selected by data.* as a new batch")
+    submit.add_argument("--pairs", type=str, default=None, help="Comma-separated pair IDs (overrides data.pair_ids)")
+    submit.add_argument("--batch", type=str, default=None, help="Batch name. Default: batch-<timestamp>")
+
+    worker = commands.add_parser("worker", help="Claim and judge queued pairs")
+    worker.add_argument("--concurrency", type=int, default=None, help="Pairs at a time. Default: jobs.concurrency")
+    worker.add_argument("--batch", type=str, default=None, help="Only take pairs from this batch")
+    worker.add_argument("--forever", action="store_true", help="Keep polling for new batches once the queue is drained")
+
+    status = commands.add_parser("status", help="Progress, throughput and workers")
+    status.add_argument("--batch", type=str, default=None, help="Only this batch")
+    status.add_argument("--window", type=float, default=60.0, help="Seconds for the recent throughput (default 60)")
+
+    export = commands.add_parser("export", help="Write a batch's results as JSON lines")
+    export.add_argument("batch", type=str)
+    export.add_argument("--out", type=str, default=None, help="Output file. Default: stdout")
+
+    args = parser.parse_args()
+    config = load_config(args.config)
+
+    if args.command == "submit":
+        _submit(args, config)
+    elif args.command == "worker":
+        _worker(args, config)
+    elif args.command == "status":
+        queue = open_queue(config, args.queue)
+        print_status(queue, args.batch, window_s=args.window)
+    elif args.command == "export":
+        _export(args, config)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,21 @@
-from .vote import run_vote, is_split
-from .graph import build_graph, run_pipeline, run_pipeline_interactive
+from .vote import Vote, start_vote, run_vote, is_split
+from .graph import build_graph, get_graph, run_pipeline
+from .interactive import run_pipeline_interactive
+from .budget import Budget, make_run_budget, make_pair_budget
+from .sweep import Sweep, expand_grid
 
-__all__ = ["run_vote", "is_split", "build_graph", "run_pipeline", "run_pipeline_interactive"]
+__all__ = [
+    "Vote",
+    "start_vote",
+    "run_vote",
+    "is_split",
+    "build_graph",
+    "get_graph",
+    "run_pipeline",
+    "run_pipeline_interactive",
+    "Budget",
+    "make_run_budget",
+    "make_pair_budget",
+    "Sweep",
+    "expand_grid",
+]
@@ -0,0 +1,138 @@
+"""Per-pair and per-run budgets (deadline, tokens, USD) with graceful degradation."""
+
+import threading
+import time
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+# Degradation steps, cheapest quality loss first
+DEGRADATION_STEPS = ("cut_debate", "skip_revote", "shrink_jury", "cheap_foreperson")
+
+DEFAULT_POLICY = [
+    {"step": "cut_debate", "at": 0.5},
+    {"step": "skip_revote", "at": 0.6},
+    {"step": "shrink_jury", "at": 0.7, "size": 2},
+    {"step": "cheap_foreperson", "at": 0.8, "model": "gpt-4.1-nano"},
+]
+
+
+def _response_tokens(response) -> int:
+    """Total tokens of one LLM response (usage metadata on the message, else llm_output)."""
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                return usage.get("total_tokens", 0)
+    return ((response.llm_output or {}).get("token_usage") or {}).get("total_tokens", 0)
+
+
+class Budget(BaseCallbackHandler):
+    """
+    Wall-clock deadline, token and USD limits for one pair or one run.
+    Registered as a LangChain callback so every LLM call is counted; a pair budget
+    forwards its usage to the run budget it belongs to. Costs are only priced when
+    `max_usd` is set (langchain_community's price table is slow to import).
+    """
+
+    def __init__(
+        self,
+        deadline_s: float | None = None,
+        max_tokens: int | None = None,
+        max_usd: float | None = None,
+        *,
+        policy: list[dict] | None = None,
+        parent: "Budget | None" = None,
+    ) -> None:
+        super().__init__()
+        self.total_tokens = 0
+        self._lock = threading.Lock()
+        self._pricing = None
+        if max_usd:
+            from langchain_community.callbacks.openai_info import OpenAICallbackHandler
+
+            self._pricing = OpenAICallbackHandler()
+        self.deadline_s = deadline_s
+        self.max_tokens = max_tokens
+        self.max_usd = max_usd
+        self.policy = policy if policy is not None else DEFAULT_POLICY
+        self.parent = parent
+        self.started = time.perf_counter()
+        self.applied: list[str] = []
+
+    def on_llm_end(self, response, **kwargs) -> None:
+        tokens = _response_tokens(response)
+        with self._lock:
+            self.total_tokens += tokens
+        if self._pricing is not None:
+            self._pricing.on_llm_end(response, **kwargs)
+        if self.parent is not None:
+            self.parent.on_llm_end(response, **kwargs)
+
+    @property
+    def total_cost(self) -> float:
+        """USD spent so far (0.0 unless `max_usd` is set)."""
+        return self._pricing.total_cost if self._pricing is not None else 0.0
+
+    @property
+    def elapsed_s(self) -> float:
+        return time.perf_counter() - self.started
+
+    def used(self) -> float:
+        """Fraction of the tightest limit already consumed, including the parent run budget."""
+        fractions = [0.0]
+        if self.deadline_s:
+            fractions.append(self.elapsed_s / self.deadline_s)
+        if self.max_tokens:
+            fractions.append(self.total_tokens / self.max_tokens)
+        if self.max_usd:
+            fractions.append(self.total_cost / self.max_usd)
+        if self.parent is not None:
+            fractions.append(self.parent.used())
+        return max(fractions)
+
+    def check(self) -> list[str]:
+        """Apply policy steps in order up to the current usage. Steps are never undone."""
+        used = self.used()
+        for rule in self.policy[len(self.applied):]:
+            if used < rule.get("at", 1.0):
+                break
+            self.applied.append(rule["step"])
+        return list(self.applied)
+
+    def active(self, step: str) -> dict | None:
+        """Policy rule for `step` if that degradation is in force, else None."""
+        if step not in self.applied:
+            return None
+        return next(rule for rule in self.policy if rule["step"] == step)
+
+
+def _limits(cfg: dict | None) -> dict:
+    cfg = cfg or {}
+    return {k: cfg.get(k) for k in ("deadline_s", "max_tokens", "max_usd")}
+
+
+def _validate_policy(policy: list[dict]) -> list[dict]:
+    for rule in policy:
+        if rule.get("step") not in DEGRADATION_STEPS:
+            raise ValueError(f"Unknown degradation step: {rule.get('step')!r} (expected one of {DEGRADATION_STEPS})")
+    return policy
+
+
+def make_run_budget(config: dict) -> Budget | None:
+    """Run-wide budget from config['budget']['run'], or None if no limit is set."""
+    budget_cfg = config.get("budget", {}) or {}
+    limits = _limits(budget_cfg.get("run"))
+    if not any(limits.values()):
+        return None
+    return Budget(**limits, policy=_validate_policy(budget_cfg.get("degrade", DEFAULT_POLICY)))
+
+
+def make_pair_budget(config: dict, run_budget: Budget | None = None) -> Budget | None:
+    """Budget for one pair from config['budget']['pair'], chained to the run budget. None if unbounded."""
+    budget_cfg = config.get("budget", {}) or {}
+    limits = _limits(budget_cfg.get("pair"))
+    if not any(limits.values()) and run_budget is None:
+        return None
+    policy = _validate_policy(budget_cfg.get("degrade", DEFAULT_POLICY))
+    return Budget(**limits, policy=policy, parent=run_budget)
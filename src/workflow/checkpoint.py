@@ -0,0 +1,222 @@
+"""Durable per-pair checkpoints in a local SQLite file, so a failed pair resumes mid-pipeline."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from .state import STATE_VERSION
+
+# Pipeline schemas that may appear in checkpointed state (msgpack deserialisation is allow-listed)
+_STATE_TYPES = [
+    ("schemas.fact_frame", "Fact"),
+    ("schemas.fact_frame", "FactFrame"),
+    ("schemas.jury_output", "Evidence"),
+    ("schemas.jury_output", "JuryOutput"),
+    ("schemas.jury_output", "RevoteOutput"),
+    ("schemas.jury_output", "SampledJuryOutput"),
+    ("schemas.verdict", "AxisResult"),
+    ("schemas.verdict", "Verdict"),
+]
+
+_SCHEMA = """
+PRAGMA journal_mode=WAL;
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT,
+    checkpoint BLOB,
+    metadata TEXT,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT,
+    value BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+
+class SqliteCheckpointer(BaseCheckpointSaver):
+    """Minimal synchronous LangGraph checkpoint saver over one SQLite file (thread-safe)."""
+
+    def __init__(self, path: str | Path) -> None:
+        super().__init__(serde=JsonPlusSerializer(allowed_msgpack_modules=_STATE_TYPES))
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def _cursor(self) -> Iterator[sqlite3.Cursor]:
+        with self.lock:
+            cur = self.conn.cursor()
+            try:
+                yield cur
+                self.conn.commit()
+            finally:
+                cur.close()
+
+    def _tuple(self, cur: sqlite3.Cursor, row: tuple) -> CheckpointTuple:
+        thread_id, checkpoint_ns, checkpoint_id, parent_id, type_, checkpoint, metadata = row
+        cur.execute(
+            "SELECT task_id, channel, type, value FROM writes"
+            " WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        )
+        writes = [(task_id, channel, self.serde.loads_typed((t, v))) for task_id, channel, t, v in cur.fetchall()]
+        ids = {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns}
+        return CheckpointTuple(
+            {"configurable": ids | {"checkpoint_id": checkpoint_id}},
+            self.serde.loads_typed((type_, checkpoint)),
+            json.loads(metadata) if metadata else {},
+            {"configurable": ids | {"checkpoint_id": parent_id}} if parent_id else None,
+            writes,
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        configurable = config["configurable"]
+        args = [str(configurable["thread_id"]), configurable.get("checkpoint_ns", "")]
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata"
+            " FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+        )
+        if checkpoint_id := get_checkpoint_id(config):
+            query += " AND checkpoint_id = ?"
+            args.append(checkpoint_id)
+        query += " ORDER BY checkpoint_id DESC LIMIT 1"
+        with self._cursor() as cur:
+            cur.execute(query, args)
+            row = cur.fetchone()
+            return self._tuple(cur, row) if row else None
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata"
+            " FROM checkpoints WHERE 1 = 1"
+        )
+        args: list = []
+        if config is not None:
+            query += " AND thread_id = ?"
+            args.append(str(config["configurable"]["thread_id"]))
+            if (ns := config["configurable"].get("checkpoint_ns")) is not None:
+                query += " AND checkpoint_ns = ?"
+                args.append(ns)
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            query += " AND checkpoint_id < ?"
+            args.append(before_id)
+        query += " ORDER BY checkpoint_id DESC"
+        with self._cursor() as cur:
+            cur.execute(query, args)
+            rows = cur.fetchall()
+            tuples = [self._tuple(cur, row) for row in rows]
+        matched = 0
+        for t in tuples:
+            if filter and any(t.metadata.get(k) != v for k, v in filter.items()):
+                continue
+            yield t
+            matched += 1
+            if limit is not None and matched >= limit:
+                return
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        configurable = config["configurable"]
+        thread_id = str(configurable["thread_id"])
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        type_, blob = self.serde.dumps_typed(checkpoint)
+        meta = json.dumps(get_checkpoint_metadata(config, metadata), ensure_ascii=False, default=str)
+        with self._cursor() as cur:
+            cur.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (thread_id, checkpoint_ns, checkpoint["id"], configurable.get("checkpoint_id"), type_, blob, meta),
+            )
+        return {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": checkpoint["id"]}}
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        configurable = config["configurable"]
+        verb = "REPLACE" if all(channel in WRITES_IDX_MAP for channel, _ in writes) else "IGNORE"
+        rows = [
+            (
+                str(configurable["thread_id"]),
+                configurable.get("checkpoint_ns", ""),
+                str(configurable["checkpoint_id"]),
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                *self.serde.dumps_typed(value),
+            )
+            for idx, (channel, value) in enumerate(writes)
+        ]
+        with self._cursor() as cur:
+            cur.executemany(f"INSERT OR {verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._cursor() as cur:
+            cur.execute("DELETE FROM checkpoints WHERE thread_id = ?", (str(thread_id),))
+            cur.execute("DELETE FROM writes WHERE thread_id = ?", (str(thread_id),))
+
+
+@lru_cache(maxsize=None)
+def _open(path: str) -> SqliteCheckpointer:
+    return SqliteCheckpointer(path)
+
+
+def get_checkpointer(config: dict) -> SqliteCheckpointer | None:
+    """Shared saver for config['checkpoint']['path'] (relative to project root), or None if disabled."""
+    cp_cfg = config.get("checkpoint", {}) or {}
+    if not cp_cfg.get("enabled", False):
+        return None
+    path = Path(cp_cfg.get("path", "eval/checkpoints.sqlite"))
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parent.parent.parent / path
+    return _open(str(path))
+
+
+def thread_id(pair_id, claim: str, truth: str, fingerprint: str) -> str:
+    """Checkpoint thread for a pair: its ID, the config fingerprint, state version and a short hash of the text."""
+    text_hash = hashlib.sha256(f"{claim}\x1f{truth}".encode("utf-8")).hexdigest()[:8]
+    return f"pair-{pair_id}-{fingerprint}-v{STATE_VERSION}-{text_hash}"
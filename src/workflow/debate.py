@@ -1,98 +1,104 @@
 """Debate: when verdict is split, agents argue until max rounds, unanimity, or no new arguments."""
 
-from langchain_openai import ChatOpenAI
+from collections.abc import Mapping
+from typing import Callable
 
 from schemas import FactFrame, JuryOutput, DebateStatus
-from prompts import load_jury_template, load_role_instruction, load
+from prompts import Template, jury_template, load_role_instruction, template
+from agents.llm import chat_model, structured_model, invoke, length_instruction
 
 
 def run_debate_round(
-    initial_vote_outputs: list[tuple[str, JuryOutput]],
+    initial_vote_outputs: Mapping[str, JuryOutput],
     claim: str,
     truth: str,
     fact_frame: FactFrame,
     config: dict,
     transcript: list[dict],
     round_idx: int,
+    emit: Callable[[dict], None] | None = None,
+    verdicts: dict[str, str] | None = None,
 ) -> dict:
     """
     Run one debate round: Mutated speaks, then Faithful speaks.
+    `emit` receives {"event": "turn", speaker, side} before each turn and
+    {"event": "turn_end", speaker, side, content} after it (for live display).
+    With `verdicts`, sides are picked from them and `initial_vote_outputs` may be an in-flight
+    Vote: each agent's reasoning is only awaited when a prompt needs it.
     Returns update dict: {transcript, debate_status, debate_round_idx}.
     """
-    mutated = [(n, o) for n, o in initial_vote_outputs if o.verdict.strip().lower() == "mutated"]
-    faithful = [(n, o) for n, o in initial_vote_outputs if o.verdict.strip().lower() == "faithful"]
+    emit = emit or (lambda event: None)
+    if verdicts is None:
+        verdicts = {n: o.verdict for n, o in initial_vote_outputs.items()}
+    mutated = [n for n, v in verdicts.items() if v.strip().lower() == "mutated"]
+    faithful = [n for n, v in verdicts.items() if v.strip().lower() == "faithful"]
 
     if not mutated or not faithful:
         max_rounds = config.get("debate", {}).get("max_rounds", 2)
         return {"transcript": [], "debate_status": None, "debate_round_idx": max_rounds}
 
-    debate_config = config.get("debate", {})
-    max_rounds = debate_config.get("max_rounds", 2)
-    components = config.get("components", {})
-    jury_cfg = components.get("agents", {})
-    status_cfg = components.get("debate_status", {})
-    jury_model_name = jury_cfg.get("model", "gpt-4.1-mini")
-    status_model_name = status_cfg.get("model", "gpt-4.1-mini")
-    jury_temp = jury_cfg.get("temperature", 0.2)
-    status_temp = status_cfg.get("temperature", 0.2)
-    jury_llm = ChatOpenAI(model=jury_model_name, temperature=jury_temp)
-    debate_template = load_jury_template("debate_template")
+    jury_llm = chat_model("agents", config)
+    debate_template = jury_template("debate_template")
     fact_frame_str = fact_frame.model_dump_json(indent=2)
-    mutated_args = "\n".join(f"{n}: {o.reasoning}" for n, o in mutated)
-    faithful_args = "\n".join(f"{n}: {o.reasoning}" for n, o in faithful)
+
+    def side_args(names: list[str]) -> str:
+        return "\n".join(f"{n}: {initial_vote_outputs[n].reasoning}" for n in names)
 
     transcript = list(transcript)  # copy
 
     # Mutated side speaks
-    speaker, output = mutated[round_idx % len(mutated)]
+    speaker = mutated[round_idx % len(mutated)]
     role_instruction = load_role_instruction(speaker)
     if round_idx == 0:
-        debate_context = f"Faithful side's initial reasoning:\n{faithful_args}"
+        debate_context = f"Faithful side's initial reasoning:\n{side_args(faithful)}"
         round_instruction = ""
     else:
         debate_context = _format_transcript(transcript)
         round_instruction = "Focus on the most recent exchange."
-    prompt = debate_template.format(
+    prompt = debate_template.render(
         role_instruction=role_instruction.strip(),
         claim=claim,
         truth=truth,
         fact_frame=fact_frame_str,
         verdict="Mutated",
-        reasoning=output.reasoning,
+        reasoning=initial_vote_outputs[speaker].reasoning,
         debate_context=debate_context,
         round_instruction=round_instruction,
-    )
-    response = jury_llm.invoke(prompt)
+    ) + length_instruction("agents", config)
+    emit({"event": "turn", "speaker": speaker, "side": verdicts[speaker]})
+    response = invoke(jury_llm, prompt, config)
     content = response.content if hasattr(response, "content") else str(response)
-    transcript.append({"speaker": speaker, "content": content, "side": output.verdict})
+    transcript.append({"speaker": speaker, "content": content, "side": verdicts[speaker]})
+    emit({"event": "turn_end", **transcript[-1]})
 
     # Faithful side speaks
-    speaker, output = faithful[round_idx % len(faithful)]
+    speaker = faithful[round_idx % len(faithful)]
     role_instruction = load_role_instruction(speaker)
     if round_idx == 0:
-        debate_context = f"Mutated side's argument:\n{transcript[0]['content']}\n\nMutated reasoning:\n{mutated_args}"
+        debate_context = f"Mutated side's argument:\n{transcript[0]['content']}\n\nMutated reasoning:\n{side_args(mutated)}"
         round_instruction = ""
     else:
         debate_context = _format_transcript(transcript)
         round_instruction = "Focus on the most recent exchange."
-    prompt = debate_template.format(
+    prompt = debate_template.render(
         role_instruction=role_instruction.strip(),
         claim=claim,
         truth=truth,
         fact_frame=fact_frame_str,
         verdict="Faithful",
-        reasoning=output.reasoning,
+        reasoning=initial_vote_outputs[speaker].reasoning,
         debate_context=debate_context,
         round_instruction=round_instruction,
-    )
-    response = jury_llm.invoke(prompt)
+    ) + length_instruction("agents", config)
+    emit({"event": "turn", "speaker": speaker, "side": verdicts[speaker]})
+    response = invoke(jury_llm, prompt, config)
     content = response.content if hasattr(response, "content") else str(response)
-    transcript.append({"speaker": speaker, "content": content, "side": output.verdict})
+    transcript.append({"speaker": speaker, "content": content, "side": verdicts[speaker]})
+    emit({"event": "turn_end", **transcript[-1]})
 
     # Check concession or no new arguments
-    status_llm = ChatOpenAI(model=status_model_name, temperature=status_temp)
-    status_template = load("debate_status_check.txt")
-    status = _check_debate_status(transcript, status_template, status_llm)
+    status_template = template("debate_status_check.txt")
+    status = _check_debate_status(transcript, status_template, structured_model("debate_status", config, DebateStatus), config)
 
     return {
         "transcript": transcript,
@@ -108,16 +114,16 @@ def _format_transcript(transcript: list[dict]) -> str:
 
 def _check_debate_status(
     transcript: list[dict],
-    prompt_template: str,
-    llm: ChatOpenAI,
+    prompt_template: Template,
+    checker,
+    config: dict,
 ) -> str | None:
-    """Check if debate should stop: conceded or no new arguments."""
+    """Check if debate should stop: conceded or no new arguments. `checker` returns DebateStatus."""
     if len(transcript) < 2: 
         return None
     formatted = _format_transcript(transcript)
-    prompt = prompt_template.format(transcript=formatted)
-    checker = llm.with_structured_output(DebateStatus)
-    status = checker.invoke(prompt)
+    prompt = prompt_template.render(transcript=formatted)
+    status = invoke(checker, prompt, config)
     if status.conceded:
         return "Conceded"
     elif status.no_new_arguments:
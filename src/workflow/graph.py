@@ -1,265 +1,373 @@
-"""LangGraph pipeline: parse → initial_vote → [debate?] → revote → foreperson."""
+"""LangGraph pipeline: passages → parse → initial_vote → [debate?] → revote → foreperson."""
 
+from functools import lru_cache, wraps
+
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.constants import START, END
+from langgraph.runtime import Runtime
 
-from .state import JuryState
-from .vote import run_vote, is_split
+from .state import JuryState, JuryContext, make_input
+from .vote import Vote, start_vote, is_split
 from .debate import run_debate_round
+from .budget import Budget, make_pair_budget
+from .checkpoint import get_checkpointer, thread_id
+import perf
 from agents import parse, run_foreperson
+from retrieval import get_near_duplicates, prune_truth
+from schemas import Verdict
+from config import config_fingerprint
 
 
-def _as_state(state: JuryState | dict) -> JuryState:
-    """Normalize state to JuryState (LangGraph may pass a dict internally)."""
-    if isinstance(state, JuryState):
-        return state
-    return JuryState.model_validate(state)
+def _budget(runtime: Runtime[JuryContext] | None) -> Budget | None:
+    return runtime.context.budget if runtime is not None and runtime.context is not None else None
+
+
+def _budgeted(node):
+    """Check the pair budget before a node runs and record the degradations in force."""
+
+    @wraps(node)
+    def _run(state: JuryState, runtime: Runtime[JuryContext]) -> dict:
+        budget = _budget(runtime)
+        if budget is None:
+            return node(state, runtime)
+        budget.check()
+        update = node(state, runtime)
+        return {**update, "degradations": list(budget.applied)}
+
+    return _run
+
+
+def _profiled(name: str, node):
+    """Run the node in a perf scope (a no-op unless profiling is enabled)."""
+
+    @wraps(node)
+    def _run(state: JuryState, runtime: Runtime[JuryContext]) -> dict:
+        with perf.node(name):
+            return node(state, runtime)
+
+    return _run
+
+
+def _config(runtime: Runtime[JuryContext]) -> dict:
+    """App config for this run (runtime context, kept out of state and checkpoints)."""
+    return runtime.context.config
+
+
+def _degraded(runtime: Runtime[JuryContext], step: str) -> dict | None:
+    """Policy rule for `step` if the budget has forced that degradation, else None."""
+    budget = _budget(runtime)
+    return budget.active(step) if budget is not None else None
+
 
+def _jury_config(config: dict, runtime: Runtime[JuryContext]) -> dict:
+    """Config for a vote, with the jury cut down to `size` agents under the shrink_jury degradation."""
+    rule = _degraded(runtime, "shrink_jury")
+    if rule is None:
+        return config
+    return config | {"agents": config.get("agents", [])[: rule.get("size", 2)]}
 
-def _parse_node(state: JuryState) -> dict:
-    s = _as_state(state)
-    fact_frame = parse(s.claim, s.truth, s.config)
+
+def _truth(state: JuryState) -> str:
+    """Reference the prompts see: the selected passages of a long truth, else the whole truth."""
+    return state.get("truth_context") or state["truth"]
+
+
+def _passages_node(state: JuryState, runtime: Runtime[JuryContext]) -> dict:
+    """Cut a long truth down to the passages relevant to the claim (config['passages'])."""
+    selection = prune_truth(state["claim"], state["truth"], _config(runtime))
+    if selection is None:
+        return {}
+    return {"truth_context": selection.text, "truth_spans": selection.spans}
+
+
+def _parse_node(state: JuryState, runtime: Runtime[JuryContext]) -> dict:
+    fact_frame = parse(state["claim"], _truth(state), _config(runtime))
     return {"fact_frame": fact_frame}
 
 
-def _initial_vote_node(state: JuryState) -> dict:
-    s = _as_state(state)
-    outputs = run_vote(s.claim, s.truth, s.fact_frame, s.config)
-    return {"initial_vote_outputs": outputs}
+def _vote_events(stage: str):
+    """on_vote callback that publishes each finished vote on the graph's custom stream."""
+    writer = get_stream_writer()
+    return lambda name, output: writer({"event": "vote", "stage": stage, "agent": name, "output": output})
+
+
+def _start_initial_vote(state: JuryState, runtime: Runtime[JuryContext]) -> Vote:
+    config = _jury_config(_config(runtime), runtime)
+    vote = start_vote(state["claim"], _truth(state), state["fact_frame"], config, on_vote=_vote_events("initial_vote"))
+    runtime.context.initial_vote = vote
+    return vote
 
 
-def _route_after_initial_vote(state: JuryState) -> str:
-    s = _as_state(state)
-    return "split" if is_split(s.initial_vote_outputs or []) else "unanimous"
+def _initial_vote_node(state: JuryState, runtime: Runtime[JuryContext]) -> dict:
+    """
+    Start the jury and return as soon as every verdict has streamed in, so routing (and a
+    speculative debate or the revote) starts while the agents are still writing their reasoning.
+    """
+    return {"initial_verdicts": _start_initial_vote(state, runtime).verdicts()}
 
 
-def _route_after_debate(state: JuryState) -> str:
+def _initial_outputs(state: JuryState, runtime: Runtime[JuryContext]):
+    """
+    Initial vote outputs: from state once resolved, else the in-flight vote (indexing waits per agent).
+    A run resumed from a checkpoint between the two has no in-flight vote and votes again.
+    """
+    if "initial_vote_outputs" in state:
+        return state["initial_vote_outputs"]
+    return runtime.context.initial_vote or _start_initial_vote(state, runtime)
+
+
+def _initial_verdicts(state: JuryState, runtime: Runtime[JuryContext]) -> dict[str, str]:
+    """
+    Initial verdicts matching `_initial_outputs`: those in state once the outputs are resolved,
+    else the in-flight vote's (a resumed run's new vote may not agree with the checkpointed ones).
+    """
+    if "initial_vote_outputs" in state:
+        return state.get("initial_verdicts") or {}
+    return _initial_outputs(state, runtime).verdicts()
+
+
+def _resolve_initial(state: JuryState, runtime: Runtime[JuryContext]) -> dict:
+    """Update recording the full initial outputs (and their verdicts), if this stage is the first to need them."""
+    if "initial_vote_outputs" in state:
+        return {}
+    vote = _initial_outputs(state, runtime)
+    return {"initial_vote_outputs": vote.result(), "initial_verdicts": vote.verdicts()}
+
+
+def _after_vote(runtime: Runtime[JuryContext]) -> str:
+    """Next stage once voting/debate is over: revote, or straight to foreperson if the revote is cut."""
+    return "foreperson" if _degraded(runtime, "skip_revote") else "revote"
+
+
+def _route_after_initial_vote(state: JuryState, runtime: Runtime[JuryContext]) -> str:
+    budget = _budget(runtime)
+    if budget is not None:
+        budget.check()
+    if is_split(state.get("initial_verdicts") or {}) and not _degraded(runtime, "cut_debate"):
+        return "split"
+    return _after_vote(runtime)
+
+
+def _route_after_debate(state: JuryState, runtime: Runtime[JuryContext]) -> str:
     """Decide whether to continue debate or go to revote."""
-    s = _as_state(state)
-    max_rounds = s.config.get("debate", {}).get("max_rounds", 2)
-    status = (s.debate_status or "").strip().lower()
+    budget = _budget(runtime)
+    if budget is not None:
+        budget.check()
+    max_rounds = _config(runtime).get("debate", {}).get("max_rounds", 2)
+    status = (state.get("debate_status") or "").strip().lower()
     if "conceded" in status or "no new arguments" in status:
-        return "revote"
-    if s.debate_round_idx >= max_rounds:
-        return "revote"
+        return _after_vote(runtime)
+    if state.get("debate_round_idx", 0) >= max_rounds or _degraded(runtime, "cut_debate"):
+        return _after_vote(runtime)
     return "debate"
 
 
-def _debate_node(state: JuryState) -> dict:
-    s = _as_state(state)
-    return run_debate_round(
-        s.initial_vote_outputs or [],
-        s.claim,
-        s.truth,
-        s.fact_frame,
-        s.config,
-        transcript=s.transcript or [],
-        round_idx=s.debate_round_idx,
+def _debate_node(state: JuryState, runtime: Runtime[JuryContext]) -> dict:
+    # A resumed run that voted again debates (or, no longer split, skips to the revote) on the new verdicts
+    update = run_debate_round(
+        _initial_outputs(state, runtime),
+        state["claim"],
+        _truth(state),
+        state["fact_frame"],
+        _config(runtime),
+        transcript=state.get("transcript") or [],
+        round_idx=state.get("debate_round_idx", 0),
+        emit=get_stream_writer(),
+        verdicts=_initial_verdicts(state, runtime),
+    )
+    return update | _resolve_initial(state, runtime)
+
+
+def _revote_node(state: JuryState, runtime: Runtime[JuryContext]) -> dict:
+    transcript = state.get("transcript") or []
+    config = _jury_config(_config(runtime), runtime)
+    if not transcript:
+        # No debate, nothing new to weigh: the initial outputs stand as the revote
+        update = _resolve_initial(state, runtime)
+        initial = update.get("initial_vote_outputs") or state["initial_vote_outputs"]
+        names = [cfg["name"] for cfg in config.get("agents", [])]
+        return {
+            **update,
+            "revote_outputs": {name: initial[name] for name in names if name in initial},
+            "skipped_debate": True,
+            "transcript": transcript,
+        }
+    # The revote does not read the initial outputs, so it starts while they may still be streaming
+    vote = start_vote(
+        state["claim"], _truth(state), state["fact_frame"], config,
+        transcript=transcript, on_vote=_vote_events("revote"),
+        stage="revote", initial_verdicts=_initial_verdicts(state, runtime),
     )
-
-
-def _revote_node(state: JuryState) -> dict:
-    s = _as_state(state)
-    transcript = s.transcript or []
-    outputs = run_vote(s.claim, s.truth, s.fact_frame, s.config, transcript=transcript)
     return {
-        "revote_outputs": outputs,
-        "skipped_debate": len(transcript) == 0,
-        "transcript": transcript,  # ensure set when skipped
+        **_resolve_initial(state, runtime),
+        "revote_outputs": vote.result(),
+        "skipped_debate": False,
+        "transcript": transcript,
     }
 
 
-def _foreperson_node(state: JuryState) -> dict:
-    s = _as_state(state)
-    config = s.config
+def _foreperson_node(state: JuryState, runtime: Runtime[JuryContext]) -> dict:
+    config = _config(runtime)
     rubric = config.get("foreperson", {}).get("rubric", [])
     rubric_lines = [
         f"- {r['axis']}: {r['question']}" for r in rubric
     ]
     rubric_questions = "\n".join(rubric_lines)
 
+    # Without a revote (skip_revote degradation) the foreperson reads the initial vote
+    update = {}
+    final_outputs = state.get("revote_outputs")
+    if final_outputs is None:
+        update = _resolve_initial(state, runtime)
+        final_outputs = update.get("initial_vote_outputs") or state.get("initial_vote_outputs") or {}
     revote_str = "\n".join(
         f"{name}: {out.verdict} (confidence {out.confidence:.2f})\n  {out.reasoning}"
-        for name, out in (s.revote_outputs or [])
+        for name, out in final_outputs.items()
     )
     transcript_str = "\n".join(
         f"{t.get('speaker', 'Agent')}: {t.get('content', '')}"
-        for t in (s.transcript or [])
+        for t in (state.get("transcript") or [])
     ) or "(No debate)"
 
+    if rule := _degraded(runtime, "cheap_foreperson"):
+        components = config.get("components", {})
+        foreperson_cfg = components.get("foreperson", {}) | {"model": rule.get("model", "gpt-4.1-nano")}
+        config = config | {"components": components | {"foreperson": foreperson_cfg}}
+
     verdict = run_foreperson(
-        claim=s.claim,
-        truth=s.truth,
-        fact_frame_str=s.fact_frame.model_dump_json(indent=2),
+        claim=state["claim"],
+        truth=_truth(state),
+        fact_frame_str=state["fact_frame"].model_dump_json(indent=2),
         transcript_str=transcript_str,
         revote_outputs_str=revote_str,
         rubric_questions=rubric_questions,
         config=config,
     )
-    return {"verdict": verdict}
+    budget = _budget(runtime)
+    if budget is not None:
+        # Copy: a coalesced foreperson call may hand the same Verdict to another pair
+        verdict = verdict.model_copy(update={"degradations": list(budget.applied)})
+    return update | {"verdict": verdict}
 
 
-def build_graph() -> CompiledStateGraph:
-    """Build and compile the jury pipeline graph."""
-    graph = StateGraph(JuryState)
+def build_graph(checkpointer=None) -> CompiledStateGraph:
+    """Build and compile the jury pipeline graph. A checkpointer saves state after every node."""
+    graph = StateGraph(JuryState, context_schema=JuryContext)
 
     # Add nodes
-    graph.add_node("parse", _parse_node)
-    graph.add_node("initial_vote", _initial_vote_node)
-    graph.add_node("debate", _debate_node)
-    graph.add_node("revote", _revote_node)
-    graph.add_node("foreperson", _foreperson_node)
+    graph.add_node("passages", _profiled("passages", _budgeted(_passages_node)))
+    graph.add_node("parse", _profiled("parse", _budgeted(_parse_node)))
+    graph.add_node("initial_vote", _profiled("initial_vote", _budgeted(_initial_vote_node)))
+    graph.add_node("debate", _profiled("debate", _budgeted(_debate_node)))
+    graph.add_node("revote", _profiled("revote", _budgeted(_revote_node)))
+    graph.add_node("foreperson", _profiled("foreperson", _budgeted(_foreperson_node)))
 
     # Add edges
-    graph.add_edge(START, "parse")
+    graph.add_edge(START, "passages")
+    graph.add_edge("passages", "parse")
     graph.add_edge("parse", "initial_vote")
     graph.add_conditional_edges(
         "initial_vote",
         _route_after_initial_vote,
-        {"split": "debate", "unanimous": "revote"},
+        {"split": "debate", "revote": "revote", "foreperson": "foreperson"},
     )
     graph.add_conditional_edges(
         "debate",
         _route_after_debate,
-        {"revote": "revote", "debate": "debate"},
+        {"revote": "revote", "debate": "debate", "foreperson": "foreperson"},
     )
     graph.add_edge("revote", "foreperson")
     graph.add_edge("foreperson", END)
 
-    return graph.compile()
+    return graph.compile(checkpointer=checkpointer)
 
 
-def run_pipeline(claim: str, truth: str, config: dict) -> dict:
-    """Run the full jury pipeline on a (claim, truth) pair. Returns final state (dict)."""
-    compiled = build_graph()
-    return compiled.invoke({"claim": claim, "truth": truth, "config": config})
+@lru_cache(maxsize=4)
+def get_graph(checkpointer=None) -> CompiledStateGraph:
+    """Compiled pipeline graph, built once per process (and checkpointer) and reused across pairs."""
+    return build_graph(checkpointer)
 
 
-def run_pipeline_interactive(
-    claim: str, truth: str, config: dict, *, print_fn=None, speak_intro: bool = True
-) -> dict:
+def _reuse_near_duplicate(claim: str, truth: str, config: dict) -> dict | None:
     """
-    Run the pipeline with interactive CLI output: shows parse, votes, debate, verdict.
-    Uses streaming to print each step as it completes.
-    When ElevenLabs is enabled, speaks each phase aloud.
+    Final state carrying the stored verdict of a near-duplicate pair (coalesce.near_duplicates),
+    flagged by `reused_from`; None if there is none or the store is off.
     """
-    if print_fn is None:
-        print_fn = print
-
-    # Optional TTS: present claim and truth before pipeline
-    if speak_intro:
-        _speak_intro(claim, truth, config)
-
-    compiled = build_graph()
-    initial = {"claim": claim, "truth": truth, "config": config}
-    state = dict(initial)
+    store = get_near_duplicates(config)
+    if store is None:
+        return None
+    match = store.lookup(claim, truth, config_fingerprint(config))
+    if match is None:
+        return None
+    return {
+        "claim": claim,
+        "truth": truth,
+        "verdict": Verdict.model_validate(match.result["verdict"]),
+        "initial_verdicts": match.result.get("initial_verdicts") or {},
+        "debate_round_idx": match.result.get("debate_round_idx", 0),
+        "reused_from": match.ref(),
+    }
 
-    for chunk in compiled.stream(initial, stream_mode="updates"):
-        for node_name, update in chunk.items():
-            prev_state = dict(state)
-            state.update(update)
-            _print_step(node_name, update, state, prev_state, print_fn, config)
 
-    return state
+def remember(claim: str, truth: str, config: dict, state: dict, pair_id=None) -> None:
+    """Store a finished pair's verdict for near-duplicate reuse (not reused or budget-degraded ones)."""
+    store = get_near_duplicates(config)
+    verdict = state.get("verdict")
+    if store is None or verdict is None or state.get("reused_from") or verdict.degradations:
+        return
+    result = {
+        "verdict": verdict.model_dump(),
+        "initial_verdicts": state.get("initial_verdicts") or {},
+        "debate_round_idx": state.get("debate_round_idx", 0),
+    }
+    store.add(claim, truth, config_fingerprint(config), result, pair_id=pair_id)
 
 
-def _speak_intro(claim: str, truth: str, config: dict) -> None:
-    """Speak claim and truth (narrator) when TTS enabled."""
-    try:
-        from audio import is_available, speak
-    except ImportError:
-        return
-    if not is_available(config):
-        return
-    intro = f"The claim is: {claim} The truth states: {truth}"
-    speak(intro, config, role="narrator")
-
-
-def _print_step(node_name: str, update: dict, state: dict, prev_state: dict, print_fn, config: dict):
-    """Format and print one pipeline step. Optionally speak via ElevenLabs."""
-    try:
-        from audio import is_available, speak
-        tts_on = is_available(config)
-    except ImportError:
-        tts_on = False
-
-    if node_name == "parse":
-        fact_frame = update.get("fact_frame")
-        if fact_frame and hasattr(fact_frame, "facts"):
-            print_fn("\n  📋 FACT FRAME (parsed from claim vs truth):")
-            print_fn(f"    {len(fact_frame.facts)} facts extracted:")
-            for i, fact in enumerate(fact_frame.facts, 1):
-                cs = (fact.claim_says or "")
-                ts = (fact.truth_says or "")
-                note = f" [{fact.note}]" if fact.note else ""
-                print_fn(f"    {i}. {fact.category}: claim=\"{cs}\" truth=\"{ts}\"{note}")
-            if tts_on:
-                facts_text = " ".join(
-                    f"Fact {i}: {f.category}. Claim says {f.claim_says or 'nothing'}. Truth says {f.truth_says or 'nothing'}. {f.note or ''}"
-                    for i, f in enumerate(fact_frame.facts, 1)
-                )
-                speak(f"Here are the extracted facts. {facts_text}", config, role="narrator")
-
-    elif node_name == "initial_vote":
-        outputs = update.get("initial_vote_outputs", [])
-        print_fn("\n  🗳️  INITIAL VOTE:")
-        for name, out in outputs:
-            icon = "✅" if out.verdict.strip().lower() == "faithful" else "❌"
-            print_fn(f"    {icon} {name}: {out.verdict} (confidence {out.confidence:.2f})")
-            print_fn(f"       └ {out.reasoning}")
-            if tts_on:
-                role_name = name.replace("_", " ").title()
-                speak(f"The {role_name} votes {out.verdict}. Their reasoning: {out.reasoning}", config, role=name)
-
-    elif node_name == "debate":
-        transcript = update.get("transcript", [])
-        prev_transcript = prev_state.get("transcript") or []
-        if len(prev_transcript) == 0 and transcript:
-            print_fn("\n  💬 DEBATE:")
-        for t in transcript[len(prev_transcript):]:
-            speaker = t.get("speaker", "Agent")
-            content = (t.get("content", "") or "").strip()
-            print_fn(f"    {speaker}: {content}")
-            if tts_on and content:
-                speak(f"{speaker} says: {content}", config, role=speaker)
-        status = update.get("debate_status")
-        if state.get('debate_round_idx', 0) == config.get("debate", {}).get("max_rounds", 2):
-            status = "Max debate rounds reached."
-        if status is not None:
-            print_fn(f"    Debate status: {status}")
-
-    elif node_name == "revote":
-        outputs = update.get("revote_outputs", [])
-        skipped = update.get("skipped_debate")
-        if skipped:
-            print_fn("\n  🗳️  REVOTE (debate skipped - unanimous):")
-        else:
-            print_fn("\n  🗳️  REVOTE (after debate):")
-        for name, out in outputs:
-            icon = "✅" if out.verdict.strip().lower() == "faithful" else "❌"
-            print_fn(f"    {icon} {name}: {out.verdict} (confidence {out.confidence:.2f})")
-            print_fn(f"       └ {out.reasoning}")
-            if tts_on:
-                role_name = name.replace("_", " ").title()
-                speak(f"The {role_name} votes {out.verdict}. Their reasoning: {out.reasoning}", config, role=name)
-
-    elif node_name == "foreperson":
-        verdict = update.get("verdict")
-        if verdict:
-            print_fn("\n  ⚖️  VERDICT:")
-            print_fn(f"    → {verdict.verdict} (confidence {verdict.confidence:.2f})")
-            for ar in verdict.axis_results:
-                mark = "✓" if ar.passed else "✗"
-                print_fn(f"    {mark} {ar.axis}: {'Yes' if ar.passed else 'No'}" + (f" — {ar.note}" if ar.note else ""))
-            print_fn(f"\n  Summary: {verdict.summary}")
-            if verdict.minimal_edit:
-                print_fn(f"  Minimal edit: {verdict.minimal_edit}")
-            if verdict.dissent_note:
-                print_fn(f"  Dissent: {verdict.dissent_note}")
-            if tts_on:
-                rubric_parts = " ".join(f"{ar.axis}: {'Yes' if ar.passed else 'No'}" for ar in verdict.axis_results)
-                foreperson_text = f"Applying the rubric. {rubric_parts}. The verdict is {verdict.verdict}. Summary: {verdict.summary}"
-                if verdict.minimal_edit:
-                    foreperson_text += f" Minimal edit suggestion: {verdict.minimal_edit}"
-                speak(foreperson_text, config, role="foreperson")
\ No newline at end of file
+def _prepare(claim: str, truth: str, config: dict, run_budget: Budget | None, pair_id) -> tuple:
+    """
+    Graph, input, invoke kwargs and (if already finished) final state for one pair.
+    With checkpointing on, an interrupted run of the same pair resumes from its last
+    completed node (input None) and a finished one returns its saved final state.
+    With coalesce.near_duplicates on, a pair close enough to one judged before returns
+    that pair's verdict as its final state.
+    """
+    budget = make_pair_budget(config, run_budget)
+    checkpointer = get_checkpointer(config)
+    compiled = get_graph(checkpointer)
+    run_config: dict = {"callbacks": [budget]} if budget is not None else {}
+    kwargs: dict = {"context": JuryContext(config=config, budget=budget)}
+    inputs: JuryState | None = make_input(claim, truth)
+    finished = None
+    if checkpointer is not None:
+        tid = thread_id(pair_id if pair_id is not None else "adhoc", claim, truth, config_fingerprint(config))
+        run_config["configurable"] = {"thread_id": tid}
+        kwargs["durability"] = "sync"
+        snapshot = compiled.get_state(run_config)
+        if snapshot.values:
+            inputs = None
+            if not snapshot.next:
+                finished = dict(snapshot.values)
+    if finished is None and inputs is not None:
+        finished = _reuse_near_duplicate(claim, truth, config)
+    kwargs["config"] = run_config
+    return compiled, inputs, kwargs, finished
+
+
+def run_pipeline(
+    claim: str, truth: str, config: dict, *, run_budget: Budget | None = None, pair_id=None
+) -> dict:
+    """
+    Run the full jury pipeline on a (claim, truth) pair. Returns final state (dict).
+    Budgets come from config['budget']['pair'] and the optional shared run budget.
+    `pair_id` names the checkpoint thread when config['checkpoint'] is enabled.
+    A verdict reused from a near-duplicate pair comes with `reused_from` and no votes.
+    """
+    with perf.pair(pair_id):
+        compiled, inputs, kwargs, finished = _prepare(claim, truth, config, run_budget, pair_id)
+        if finished is not None:
+            return finished
+        state = compiled.invoke(inputs, **kwargs)
+        remember(claim, truth, config, state, pair_id)
+        return state
@@ -0,0 +1,313 @@
+"""Interactive CLI run: prints (and optionally speaks) each stage live, streaming tokens as they generate."""
+
+import warnings
+
+from langchain_core.utils.json import parse_partial_json
+
+import perf
+
+from .budget import Budget
+from .graph import _prepare, remember
+from .state import JuryState
+
+# Streaming a structured-output call makes langchain-openai serialise the parsed model into a
+# field typed None; the result is correct, only the warning is noise on an interactive terminal.
+warnings.filterwarnings("ignore", message="Pydantic serializer warnings", category=UserWarning)
+
+# Verdict fields in schema (and generation) order; a field is complete once the next one starts
+_VERDICT_FIELDS = ("verdict", "confidence", "axis_results", "summary", "minimal_edit", "dissent_note")
+
+
+def run_pipeline_interactive(
+    claim: str,
+    truth: str,
+    config: dict,
+    *,
+    print_fn=None,
+    speak_intro: bool = True,
+    run_budget: Budget | None = None,
+    pair_id=None,
+) -> dict:
+    """
+    Run the pipeline with interactive CLI output: shows parse, votes, debate, verdict.
+    Vote rows appear as each agent finishes; debate turns and the verdict stream token by token.
+    `print_fn` must accept print's `end` and `flush` keywords.
+    When ElevenLabs is enabled, speaks each phase aloud: speech is synthesized and played in the
+    background while the pipeline keeps running, and the call returns once playback has finished.
+    """
+    if print_fn is None:
+        print_fn = print
+
+    with perf.pair(pair_id):
+        audio = _audio_pipeline(config)
+        try:
+            # Optional TTS: present claim and truth while the pipeline starts
+            if speak_intro and audio is not None:
+                from audio.script import intro_line
+                audio.say(intro_line(claim, truth), role="narrator")
+            return _run_interactive(claim, truth, config, print_fn, audio, run_budget, pair_id)
+        finally:
+            if audio is not None:
+                audio.close()
+
+
+def _run_interactive(claim: str, truth: str, config: dict, print_fn, audio, run_budget, pair_id) -> dict:
+    compiled, inputs, kwargs, finished = _prepare(claim, truth, config, run_budget, pair_id)
+    if finished is not None:
+        reused = finished.get("reused_from")
+        if reused:
+            of = f"pair {reused['pair_id']}" if reused["pair_id"] is not None else repr(reused["claim"][:60])
+            print_fn(f"\n  (near-duplicate of {of}, similarity {reused['similarity']:.2f}: verdict reused)")
+        else:
+            print_fn("\n  (restored from checkpoint)")
+        _Renderer(finished, print_fn, config, audio).on_update("foreperson", {"verdict": finished.get("verdict")})
+        return finished
+    state: JuryState = dict(inputs) if inputs is not None else {}
+    if inputs is None:
+        print_fn("\n  (resuming from checkpoint)")
+        state = dict(compiled.get_state(kwargs["config"]).values)
+
+    renderer = _Renderer(state, print_fn, config, audio)
+    for mode, data in compiled.stream(inputs, stream_mode=["updates", "custom", "messages"], **kwargs):
+        if mode == "messages":
+            chunk, metadata = data
+            renderer.on_token(metadata.get("langgraph_node"), chunk.content if isinstance(chunk.content, str) else "")
+        elif mode == "custom":
+            renderer.on_event(data)
+        else:
+            for node_name, update in data.items():
+                renderer.on_update(node_name, update or {})  # None: the node changed nothing (e.g. a short truth)
+    renderer.finish()
+    remember(claim, truth, config, state, pair_id)
+    return state
+
+
+def _audio_pipeline(config: dict):
+    """Background speech when TTS is enabled, else None."""
+    if not (config.get("elevenlabs") or {}).get("enabled", False):
+        return None  # audio is not imported at all
+    try:
+        from audio import AudioPipeline, is_available
+    except ImportError:
+        return None
+    return AudioPipeline(config) if is_available(config) else None
+
+
+class _Renderer:
+    """
+    Incremental console view of one pipeline run. Node updates are merged into `state` in place;
+    streamed tokens and vote/turn events are printed as they arrive, and each node's final update
+    only prints what the stream did not already show.
+    """
+
+    def __init__(self, state: JuryState, print_fn, config: dict, audio=None) -> None:
+        self.state = state
+        self.print_fn = print_fn
+        self.config = config
+        self.audio = audio  # AudioPipeline: say() queues speech and returns at once
+        if audio is not None:
+            from audio import script
+            self.script = script  # spoken lines, shared with offline rendering (same text, same cached audio)
+        self.votes_shown: dict[str, set[str]] = {"initial_vote": set(), "revote": set()}
+        self.deferred: list[tuple[str, str, object]] = []  # vote rows waiting for a clean spot
+        self.held: list[tuple] = []  # debate output (fn, args, kwargs) waiting for the initial vote rows
+        self.turns_shown = len(state.get("transcript") or [])
+        self.turn_open = False
+        self.turn_streamed = False
+        self.verdict_json = ""
+        self.verdict_shown: dict[str, object] = {}  # field -> value printed so far
+
+    # --- Stream inputs ---
+
+    def on_event(self, event: dict) -> None:
+        kind = event.get("event")
+        if kind == "vote":
+            self._vote_row(event["stage"], event["agent"], event["output"])
+        elif kind == "turn":
+            if self.turns_shown == 0:
+                self._debate("\n  💬 DEBATE:")
+            self._debate(f"    {event['speaker']}: ", end="", flush=True)
+            self.turn_open, self.turn_streamed = True, False
+        elif kind == "turn_end":
+            content = (event.get("content") or "").strip()
+            if not self.turn_streamed:  # e.g. answer shared with an identical in-flight call
+                self._debate(content, end="")
+            self._debate("")
+            self.turn_open = False
+            self.turns_shown += 1
+            self._flush_votes()
+            if self.audio and content:
+                self._debate(self.script.turn_line(event["speaker"], content), role=event["speaker"], fn=self.audio.say)
+
+    def on_token(self, node_name: str | None, text: str) -> None:
+        if not text:
+            return
+        if node_name == "debate" and self.turn_open:
+            if not self.turn_streamed:
+                text = text.lstrip()
+            self._debate(text, end="", flush=True)
+            self.turn_streamed = self.turn_streamed or bool(text)
+        elif node_name == "foreperson":
+            self.verdict_json += text
+            partial = parse_partial_json(self.verdict_json)
+            if isinstance(partial, dict):
+                self._verdict_fields(partial, final=False)
+
+    def on_update(self, node_name: str, update: dict) -> None:
+        self.state.update(update)
+        if node_name == "passages":
+            self._passages(update.get("truth_spans"))
+        elif node_name == "parse":
+            self._fact_frame(update.get("fact_frame"))
+        # Vote outputs may land in a later stage's update (the initial vote routes on verdicts alone)
+        for stage, key in (("initial_vote", "initial_vote_outputs"), ("revote", "revote_outputs")):
+            for name, out in (update.get(key) or {}).items():
+                self._vote_row(stage, name, out)
+        if node_name == "debate":
+            # Turns not already streamed (e.g. resumed run) are printed whole
+            for t in update.get("transcript", [])[self.turns_shown:]:
+                self.on_event({"event": "turn", **t})
+                self.on_event({"event": "turn_end", **t})
+            status = update.get("debate_status")
+            if self.state.get("debate_round_idx", 0) == self.config.get("debate", {}).get("max_rounds", 2):
+                status = "Max debate rounds reached."
+            if status is not None:
+                self._debate(f"    Debate status: {status}")
+        elif node_name == "foreperson":
+            verdict = update.get("verdict")
+            if verdict:
+                self._verdict_fields(verdict.model_dump(), final=True)
+                if verdict.degradations:
+                    self.print_fn(f"  Degraded (budget): {', '.join(verdict.degradations)}")
+                if self.audio:
+                    self.audio.say(self.script.verdict_line(verdict), role="foreperson")
+
+    # --- Sections ---
+
+    def _passages(self, spans) -> None:
+        if not spans:
+            return
+        kept = len(self.state.get("truth_context") or "")
+        self.print_fn(f"\n  📄 TRUTH: {len(spans)} relevant passages kept ({kept:,} of {len(self.state['truth']):,} chars)")
+
+    def _fact_frame(self, fact_frame) -> None:
+        if not fact_frame or not hasattr(fact_frame, "facts"):
+            return
+        self.print_fn("\n  📋 FACT FRAME (parsed from claim vs truth):")
+        self.print_fn(f"    {len(fact_frame.facts)} facts extracted:")
+        for i, fact in enumerate(fact_frame.facts, 1):
+            cs = (fact.claim_says or "")
+            ts = (fact.truth_says or "")
+            note = f" [{fact.note}]" if fact.note else ""
+            self.print_fn(f"    {i}. {fact.category}: claim=\"{cs}\" truth=\"{ts}\"{note}")
+        if self.audio:
+            self.audio.say(self.script.facts_line(fact_frame.facts), role="narrator")
+
+    def _initial_pending(self) -> bool:
+        return len(self.votes_shown["initial_vote"]) < len(self.state.get("initial_verdicts") or {})
+
+    def _debate(self, *args, fn=None, **kwargs) -> None:
+        """
+        Print (or `fn`) one piece of debate output. While initial vote rows are still to come (their
+        reasoning can arrive after the debate has started), it is held and released in order after them.
+        """
+        if self.held or self._initial_pending():
+            self.held.append((fn or self.print_fn, args, kwargs))
+            return
+        (fn or self.print_fn)(*args, **kwargs)
+
+    def _release_debate(self) -> None:
+        held, self.held = self.held, []
+        for fn, args, kwargs in held:
+            fn(*args, **kwargs)
+
+    def finish(self) -> None:
+        """Print whatever is still held back (e.g. vote rows that never arrived on a resumed run)."""
+        self._release_debate()
+        deferred, self.deferred = self.deferred, []
+        self.turn_open = False
+        for stage, name, out in deferred:
+            self._vote_row(stage, name, out, force=True)
+
+    def _vote_row(self, stage: str, name: str, out, *, force: bool = False) -> None:
+        """
+        Print one vote row. Rows arriving mid-turn, and revote rows before the initial vote is
+        complete, wait; initial rows always come before the (held) debate output.
+        """
+        shown = self.votes_shown[stage]
+        if name in shown:
+            return
+        mid_turn = self.turn_open and not self.held  # a turn is on screen, not held back
+        waits = mid_turn if stage == "initial_vote" else mid_turn or self.held or self._initial_pending()
+        if waits and not force:
+            self.deferred.append((stage, name, out))
+            return
+        if not shown:
+            if stage == "initial_vote":
+                self.print_fn("\n  🗳️  INITIAL VOTE:")
+            elif not self.state.get("transcript"):
+                self.print_fn("\n  🗳️  REVOTE (debate skipped - unanimous):")
+            else:
+                self.print_fn("\n  🗳️  REVOTE (after debate):")
+        shown.add(name)
+        icon = "✅" if out.verdict.strip().lower() == "faithful" else "❌"
+        self.print_fn(f"    {icon} {name}: {out.verdict} (confidence {out.confidence:.2f})")
+        self.print_fn(f"       └ {out.reasoning}")
+        if self.audio:
+            self.audio.say(self.script.vote_line(name, out), role=name)
+        if stage == "initial_vote" and not self._initial_pending():
+            self._release_debate()
+        self._flush_votes()
+
+    def _flush_votes(self) -> None:
+        deferred, self.deferred = self.deferred, []
+        for row in deferred:
+            self._vote_row(*row)
+
+    def _verdict_fields(self, verdict: dict, *, final: bool) -> None:
+        """
+        Print verdict fields in order as they become complete; the summary streams as it grows.
+        With `final`, `verdict` is the parsed result and whatever is left is printed.
+        """
+        shown = self.verdict_shown
+        if not shown:
+            self.finish()  # nothing printed before the verdict is still held back after it
+            self.print_fn("\n  ⚖️  VERDICT:")
+            shown["_header"] = True
+        present = [f for f in _VERDICT_FIELDS if f in verdict]
+        for i, field in enumerate(present):
+            complete = final or i + 1 < len(present)
+            value = verdict[field]
+            if field == "summary" and isinstance(value, str):
+                self._summary(value, complete)
+                continue
+            if not complete or field in shown:
+                continue
+            shown[field] = value
+            if field == "confidence":
+                self.print_fn(f"    → {verdict.get('verdict')} (confidence {float(value):.2f})")
+            elif field == "axis_results":
+                for ar in value or []:
+                    mark = "✓" if ar.get("passed") else "✗"
+                    note = f" — {ar['note']}" if ar.get("note") else ""
+                    self.print_fn(f"    {mark} {ar.get('axis')}: {'Yes' if ar.get('passed') else 'No'}{note}")
+            elif field == "minimal_edit" and value:
+                self.print_fn(f"  Minimal edit: {value}")
+            elif field == "dissent_note" and value:
+                self.print_fn(f"  Dissent: {value}")
+
+    def _summary(self, text: str, complete: bool) -> None:
+        shown = self.verdict_shown
+        if shown.get("summary_done"):
+            return
+        printed = shown.get("summary", "")
+        if "summary" not in shown:
+            self.print_fn("\n  Summary: ", end="")
+        if text.startswith(printed):
+            self.print_fn(text[len(printed):], end="", flush=True)
+        else:  # partial parse revised the text (rare): reprint it
+            self.print_fn(f"\n  Summary: {text}", end="", flush=True)
+        shown["summary"] = text
+        if complete:
+            self.print_fn("")
+            shown["summary_done"] = True
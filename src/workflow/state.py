@@ -1,44 +1,66 @@
 """Shared state for the jury LangGraph."""
 
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import TypedDict
 
-from pydantic import BaseModel, Field
+from schemas import FactFrame, JuryOutput, RevoteOutput, Verdict
 
-from schemas import FactFrame, JuryOutput, Verdict
+from .budget import Budget
+from .vote import Vote
 
+# Bump when the state layout changes, so old checkpoints are not resumed into the new graph
+STATE_VERSION = 5
 
-class JuryState(BaseModel):
-    """State passed through the jury pipeline."""
+
+class JuryState(TypedDict, total=False):
+    """
+    State passed through the jury pipeline. A plain dict: inputs are validated once in
+    `make_input`, stage outputs are already-validated schema objects, and nodes read and
+    write keys directly (no per-node model validation or copying).
+    """
 
     # Input
-    claim: str = Field(description="The claim to be judged.")
-    truth: str = Field(description="The reference truth.")
-    config: dict = Field(default_factory=dict, description="App configuration.")
+    claim: str  # The claim to be judged
+    truth: str  # The reference truth
+
+    # Passages (long truths only)
+    truth_context: str  # Passages of the truth relevant to the claim; the prompts read this instead of truth
+    truth_spans: list[dict]  # [{"start", "end", "score"}]: where truth_context comes from in truth
 
     # Parse
-    fact_frame: Optional[FactFrame] = Field(default=None, description="Extracted facts from claim vs truth.")
+    fact_frame: FactFrame  # Extracted facts from claim vs truth
 
     # Round 0: Initial vote
-    initial_vote_outputs: Optional[list[tuple[str, JuryOutput]]] = Field(
-        default=None, description="(agent_name, output) from initial independent vote."
-    )
+    initial_verdicts: dict[str, str]  # agent_name -> verdict, known before the reasoning has streamed in
+    initial_vote_outputs: dict[str, JuryOutput]  # agent_name -> output, in config order (set by the next stage)
 
     # Round 1: Debate (when verdict split)
-    transcript: Optional[list[dict]] = Field(
-        default=None, description="Debate transcript: [{\"speaker\": str, \"content\": str}, ...]."
-    )
-    skipped_debate: Optional[bool] = Field(
-        default=None, description="True if debate was skipped (unanimous initial vote)."
-    )
-    debate_status: Optional[str] = Field(
-        default=None, description="After each round: 'Conceded', 'No new arguments', or 'No decision. Debate continues...'."
-    )
-    debate_round_idx: int = Field(default=0, description="Current debate round index.")
+    transcript: list[dict]  # [{"speaker": str, "content": str, "side": str}, ...]
+    skipped_debate: bool  # True if debate was skipped (unanimous initial vote)
+    debate_status: str | None  # 'Conceded', 'No new arguments', or 'No decision. Debate continues...'
+    debate_round_idx: int  # Debate rounds completed
 
     # Round 2: Revote
-    revote_outputs: Optional[list[tuple[str, JuryOutput]]] = Field(
-        default=None, description="(agent_name, output) after revote."
-    )
+    revote_outputs: dict[str, RevoteOutput]  # agent_name -> output after revote (verdict, confidence, short reasoning)
+
+    # Budget
+    degradations: list[str]  # Degradation steps applied because a budget ran low, in order
 
     # Final
-    verdict: Optional[Verdict] = Field(default=None, description="Foreperson's final verdict.")
+    verdict: Verdict  # Foreperson's final verdict
+
+
+def make_input(claim: str, truth: str) -> JuryState:
+    """Validated pipeline input (the only boundary where state is checked)."""
+    if not isinstance(claim, str) or not isinstance(truth, str):
+        raise TypeError("claim and truth must be strings")
+    return {"claim": claim, "truth": truth}
+
+
+@dataclass
+class JuryContext:
+    """Per-run objects handed to nodes via LangGraph's runtime context (not part of state, never checkpointed)."""
+
+    config: dict = field(default_factory=dict)
+    budget: Budget | None = None
+    initial_vote: Vote | None = None  # Still streaming when routing starts; resolved by the next stage
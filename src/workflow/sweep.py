@@ -0,0 +1,174 @@
+"""
+Config sweeps: judge a pair under several config variants, running each distinct upstream prefix
+of the pipeline once. Variants that differ only in, say, the foreperson share the parse, initial
+vote, debate and revote runs and fork from that checkpoint.
+"""
+
+import copy
+import hashlib
+import itertools
+import json
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager
+
+import perf
+from config import config_fingerprint
+
+from .checkpoint import SqliteCheckpointer
+from .graph import build_graph
+from .state import JuryContext, make_input
+
+# Pipeline stages in order, the config sections each one reads, and where its segment of the
+# graph stops. A variant's run of a stage is keyed by its sections plus every earlier stage's key,
+# so variants with equal keys share it. Sections no stage lists key the first stage (anything
+# unknown re-runs the whole pipeline).
+STAGES: list[tuple[str, tuple[str, ...], dict]] = [
+    ("parse", ("passages", "parse", "components.parser"), {"interrupt_after": ["parse"]}),  # passage selection + parse
+    ("initial_vote", ("agents", "components.agents"), {"interrupt_after": ["initial_vote"]}),
+    ("debate", ("debate", "components.debate_status"), {"interrupt_before": ["foreperson"]}),  # debate rounds + revote
+    ("foreperson", ("foreperson", "components.foreperson"), {}),
+]
+
+
+def _get(config: dict, path: str) -> Any:
+    for part in path.split("."):
+        if not isinstance(config, dict) or part not in config:
+            return None
+        config = config[part]
+    return config
+
+
+def set_path(config: dict, path: str, value: Any) -> dict:
+    """Copy of `config` with the dotted `path` set to `value` (intermediate sections created)."""
+    config = copy.deepcopy(config)
+    node = config
+    *parents, last = path.split(".")
+    for part in parents:
+        node = node.setdefault(part, {})
+    node[last] = value
+    return config
+
+
+def _without(config: dict, paths: list[str]) -> dict:
+    config = copy.deepcopy(config)
+    for path in paths:
+        *parents, last = path.split(".")
+        node = config
+        for part in parents:
+            node = node.get(part) if isinstance(node, dict) else None
+        if isinstance(node, dict):
+            node.pop(last, None)
+    return config
+
+
+def stage_keys(config: dict) -> list[str]:
+    """One key per stage: equal keys mean equal inputs, so that stage's run can be shared."""
+    listed = [path for _, paths, _ in STAGES for path in paths]
+    keys, prefix = [], config_fingerprint(_without(config, listed))
+    for _, paths, _ in STAGES:
+        payload = json.dumps([prefix] + [_get(config, p) for p in paths], sort_keys=True, default=str)
+        prefix = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+        keys.append(prefix)
+    return keys
+
+
+def _label(value: Any) -> str:
+    if isinstance(value, list) and all(isinstance(v, dict) and "name" in v for v in value):
+        return "+".join(v["name"] for v in value)
+    if isinstance(value, list):
+        return ",".join(str(v) for v in value)
+    return str(value)
+
+
+def expand_grid(base: dict, grid: dict[str, list] | None = None, variants: dict[str, dict] | None = None) -> dict[str, dict]:
+    """
+    Variant name -> full config. `grid` maps dotted config paths to values (every combination
+    is a variant, named "path=value ..."); `variants` adds named variants as {path: value} overrides.
+    """
+    out: dict[str, dict] = {}
+    grid = grid or {}
+    for values in itertools.product(*grid.values()):
+        config, name = base, []
+        for path, value in zip(grid, values):
+            config = set_path(config, path, value)
+            name.append(f"{path.rsplit('.', 1)[-1]}={_label(value)}")
+        out[" ".join(name) or "base"] = config
+    for name, overrides in (variants or {}).items():
+        config = base
+        for path, value in overrides.items():
+            config = set_path(config, path, value)
+        out[name] = config
+    return out
+
+
+@dataclass
+class StageRun:
+    """One run of a stage, shared by `variants`. Usage is read from `meter` once the pair is done."""
+
+    stage: str
+    variants: list[str]
+    seconds: float
+    meter: Any = None
+    tokens: int = 0
+    cost_usd: float = 0.0
+
+
+@dataclass
+class SweepResult:
+    """One pair under every variant: final states and the stage runs that produced them."""
+
+    states: dict[str, dict] = field(default_factory=dict)
+    runs: list[StageRun] = field(default_factory=list)
+
+    def path(self, variant: str) -> list[StageRun]:
+        """The stage runs variant `variant` went through (what it would cost on its own)."""
+        return [run for run in self.runs if variant in run.variants]
+
+
+class Sweep:
+    """
+    Runs pairs under a set of variants. Stage segments are invoked on an in-memory checkpointer;
+    each group of variants sharing a stage key forks from its parent segment's checkpoint, with its
+    own config in the runtime context. Pair budgets are not applied (variants would share them).
+    `meter()` is entered around every segment, e.g. get_openai_callback for tokens and cost.
+    """
+
+    def __init__(self, variants: dict[str, dict], *, meter: Callable[[], ContextManager] | None = None) -> None:
+        self.variants = variants
+        self.meter = meter or (lambda: nullcontext())
+        self.keys = {name: stage_keys(config) for name, config in variants.items()}
+        self.graph = build_graph(SqliteCheckpointer(":memory:"))
+        self._threads = itertools.count()
+
+    def run_pair(self, claim: str, truth: str, *, pair_id=None) -> SweepResult:
+        result = SweepResult()
+        thread = {"configurable": {"thread_id": f"sweep-{pair_id}-{next(self._threads)}"}}
+        with perf.pair(pair_id):
+            self._run_stage(0, list(self.variants), thread, make_input(claim, truth), None, result)
+        for run in result.runs:
+            run.tokens = getattr(run.meter, "total_tokens", 0)
+            run.cost_usd = getattr(run.meter, "total_cost", 0.0)
+            run.meter = None
+        return result
+
+    def _run_stage(self, level: int, names: list[str], parent: dict, inputs, vote, result: SweepResult) -> None:
+        if level == len(STAGES):
+            values = dict(self.graph.get_state(parent).values)
+            for name in names:
+                result.states[name] = values
+            return
+        stage, _, stop = STAGES[level]
+        groups: dict[str, list[str]] = {}
+        for name in names:
+            groups.setdefault(self.keys[name][level], []).append(name)
+        for group in groups.values():
+            context = JuryContext(config=self.variants[group[0]], initial_vote=vote)
+            t0 = time.perf_counter()
+            with self.meter() as meter:
+                self.graph.invoke(inputs, parent, context=context, durability="sync", **stop)
+            result.runs.append(StageRun(stage, group, time.perf_counter() - t0, meter))
+            # Children fork from the checkpoint this segment stopped at
+            snapshot = self.graph.get_state({"configurable": {"thread_id": parent["configurable"]["thread_id"]}})
+            self._run_stage(level + 1, group, snapshot.config, None, context.initial_vote, result)
@@ -1,26 +1,104 @@
 """Initial vote and revote: jury agents run in parallel, no cross-talk."""
 
-from langchain_core.runnables import RunnableLambda, RunnableParallel
+import threading
+from collections.abc import Mapping
+from concurrent.futures import Future, wait
+from typing import Callable, Iterator
 
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+
+import perf
 from schemas import FactFrame, JuryOutput
 
 from agents import run_jury
 
+# One pool for every vote in the process: starting threads per vote dominated per-pair CPU.
+# Tasks run in a copy of the caller's context, so LangChain callbacks (budgets, cost) still apply.
+_pool = ContextThreadPoolExecutor(max_workers=64, thread_name_prefix="jury-vote")
 
-def _make_agent_runnable(agent_name: str) -> RunnableLambda:
-    """Wrap run_jury as a LangChain Runnable for a specific agent."""
 
-    def _invoke(inputs: dict) -> JuryOutput:
-        return run_jury(
-            agent_name,
-            inputs["claim"],
-            inputs["truth"],
-            inputs["fact_frame"],
-            inputs["config"],
-            transcript=inputs.get("transcript"),
-        )
+class Vote(Mapping):
+    """
+    A jury vote in flight: agent name -> JuryOutput, in config order.
+    Each agent's output is streamed, so `verdicts()` returns as soon as every `verdict`
+    field has arrived; indexing waits only for that agent's full output.
+    """
+
+    def __init__(self, names: list[str]) -> None:
+        self.names = names
+        self.futures: dict[str, Future] = {}
+        self._verdicts: dict[str, str] = {}
+        self._changed = threading.Condition()
+
+    def __getitem__(self, name: str) -> JuryOutput:
+        return self.futures[name].result()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _on_field(self, name: str) -> Callable:
+        def on_field(key: str, value) -> None:
+            if key == "verdict" and isinstance(value, str):
+                self._set_verdict(name, value)
+
+        return on_field
+
+    def _set_verdict(self, name: str, verdict: str | None) -> None:
+        with self._changed:
+            if verdict is not None:
+                self._verdicts.setdefault(name, verdict)
+            self._changed.notify_all()
+
+    def verdicts(self) -> dict[str, str]:
+        """{agent_name: verdict} once every agent has committed to one (raises if an agent failed)."""
+        with self._changed:
+            self._changed.wait_for(lambda: all(n in self._verdicts or self.futures[n].done() for n in self.names))
+        return {n: self._verdicts.get(n) or self[n].verdict for n in self.names}
+
+    def result(self) -> dict[str, JuryOutput]:
+        """All outputs, waiting for every agent to finish (even after one failed, so none is left running)."""
+        wait(self.futures.values())
+        return {name: self[name] for name in self.names}
 
-    return RunnableLambda(_invoke)
+
+def start_vote(
+    claim: str,
+    truth: str,
+    fact_frame: FactFrame,
+    config: dict,
+    transcript: list[dict] | None = None,
+    on_vote: Callable[[str, JuryOutput], None] | None = None,
+    *,
+    stage: str = "vote",
+    initial_verdicts: dict[str, str] | None = None,
+) -> Vote:
+    """
+    Start all jury agents in parallel and return immediately. Pass transcript for revote.
+    `stage="revote"` asks each agent for the lean revote output, given its `initial_verdicts` entry.
+    `on_vote(agent_name, output)` is called as each agent finishes.
+    """
+    vote = Vote([cfg["name"] for cfg in config.get("agents", [])])
+
+    def _run(name: str) -> JuryOutput:
+        with perf.task(f"vote {name}"):
+            output = run_jury(
+                name, claim, truth, fact_frame, config, transcript=transcript or [], on_field=vote._on_field(name),
+                stage=stage, initial_verdict=(initial_verdicts or {}).get(name),
+            )
+            if on_vote is not None:
+                on_vote(name, output)  # inside the task, so it runs in the caller's (graph node's) context
+        return output
+
+    for name in vote.names:
+        future = _pool.submit(_run, name)
+        future.add_done_callback(
+            lambda f, name=name: vote._set_verdict(name, None if f.exception() else f.result().verdict)
+        )
+        vote.futures[name] = future
+    return vote
 
 
 def run_vote(
@@ -29,34 +107,26 @@ def run_vote(
     fact_frame: FactFrame,
     config: dict,
     transcript: list[dict] | None = None,
-) -> list[tuple[str, JuryOutput]]:
+    on_vote: Callable[[str, JuryOutput], None] | None = None,
+    *,
+    stage: str = "vote",
+    initial_verdicts: dict[str, str] | None = None,
+) -> dict[str, JuryOutput]:
     """
-    Run all jury agents in parallel. Pass transcript for revote (after debate).
+    Run all jury agents in parallel and wait for them. Pass transcript for revote (after debate).
+    `on_vote(agent_name, output)` is called as each agent finishes, in completion order.
 
     Returns:
-        List of (agent_name, output) in config order.
+        {agent_name: output} in config order.
     """
-    agent_cfgs = config.get("agents", [])
-    if not agent_cfgs:
-        return []
-
-    branches = {cfg["name"]: _make_agent_runnable(cfg["name"]) for cfg in agent_cfgs}
-    parallel = RunnableParallel(**branches)
-
-    inputs = {
-        "claim": claim,
-        "truth": truth,
-        "fact_frame": fact_frame,
-        "config": config,
-        "transcript": transcript or [],
-    }
-    result = parallel.invoke(inputs)
-    return [(cfg["name"], result[cfg["name"]]) for cfg in agent_cfgs]
-
-
-def is_split(outputs: list[tuple[str, JuryOutput]]) -> bool:
-    """True if agents disagree (some Faithful, some Mutated)."""
-    if not outputs:
+    return start_vote(
+        claim, truth, fact_frame, config, transcript, on_vote, stage=stage, initial_verdicts=initial_verdicts
+    ).result()
+
+
+def is_split(votes: Mapping[str, JuryOutput | str]) -> bool:
+    """True if agents disagree (some Faithful, some Mutated). Takes outputs or bare verdicts."""
+    if not votes:
         return False
-    verdicts = [output.verdict.strip().lower() for _, output in outputs]
+    verdicts = [(v if isinstance(v, str) else v.verdict).strip().lower() for v in votes.values()]
     return not all(verdict == verdicts[0] for verdict in verdicts)
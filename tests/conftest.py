@@ -0,0 +1,35 @@
+"""Shared fixtures: the offline OpenAI stub (eval/stub_openai.py) and a config that runs against it."""
+
+import os
+
+import pytest
+
+import stub_openai
+from config import load_config
+
+
+@pytest.fixture(scope="session")
+def stub():
+    """Stub server on a free port; model clients created during the session point at it."""
+    server = stub_openai.serve(0, background=True)
+    saved = {k: os.environ.get(k) for k in ("OPENAI_BASE_URL", "OPENAI_API_KEY")}
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    os.environ["OPENAI_API_KEY"] = "stub"
+    yield server
+    server.shutdown()
+    for key, value in saved.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+
+@pytest.fixture
+def config(stub) -> dict:
+    """Project config with nothing written to disk and no terminal output."""
+    config = load_config()
+    config["interactive"] = False
+    config["checkpoint"] = {"enabled": False}
+    config["coalesce"] = (config.get("coalesce") or {}) | {"near_duplicates": {"enabled": False}}
+    config["elevenlabs"] = (config.get("elevenlabs") or {}) | {"enabled": False}
+    return config
@@ -0,0 +1,70 @@
+"""AudioPipeline with the offline FakeBackend: playback order, non-blocking say(), failure isolation."""
+
+import threading
+import time
+
+from audio import AudioPipeline, FakeBackend, split_sentences
+
+CONFIG = {"elevenlabs": {"chunk_chars": 40, "max_ahead": 2, "synthesis_workers": 3, "cache": {"enabled": False}}}
+
+
+class FlakyBackend(FakeBackend):
+    """Fails to synthesize any chunk containing "boom"."""
+
+    def synthesize(self, text: str, *args, **kwargs):
+        if "boom" in text:
+            raise RuntimeError("synthesis failed")
+        yield from super().synthesize(text, *args, **kwargs)
+
+
+def test_played_follows_the_order_said_across_sentence_chunks():
+    # A long first sentence synthesizes slower than the short ones queued after it
+    utterances = [
+        "The claim reports a figure that the truth never states, and it drops the time frame entirely. Short one. Two.",
+        "Then a second speaker. With more. Sentences here.",
+    ]
+    backend = FakeBackend(synth_chars_per_s=500, play_chars_per_s=5000)
+    with AudioPipeline(CONFIG, backend=backend) as audio:
+        for text in utterances:
+            audio.say(text)
+    expected = [chunk for text in utterances for chunk in split_sentences(text, 40)]
+    assert len(expected) > len(utterances)
+    assert backend.played == expected
+
+
+def test_say_returns_before_playback_finishes():
+    backend = FakeBackend(play_chars_per_s=100)  # about a second of "speech"
+    audio = AudioPipeline(CONFIG, backend=backend)
+    t0 = time.perf_counter()
+    audio.say("This sentence takes about one second to play back. And another one after it.")
+    assert time.perf_counter() - t0 < 0.2
+    assert backend.played == []
+    audio.close()
+    assert len(backend.played) == 2
+
+
+def test_failing_chunk_is_counted_and_playback_continues():
+    backend = FlakyBackend(play_chars_per_s=5000)
+    with AudioPipeline(CONFIG, backend=backend) as audio:
+        audio.say("First sentence plays. Then boom fails. Last sentence still plays.")
+        audio.say("A later utterance plays too.")
+    assert audio.failed == 1
+    assert backend.played == ["First sentence plays.", "Last sentence still plays.", "A later utterance plays too."]
+
+
+def test_say_from_several_threads_keeps_each_utterance_together():
+    backend = FakeBackend(synth_chars_per_s=20000, play_chars_per_s=50000)
+    audio = AudioPipeline(CONFIG | {"elevenlabs": CONFIG["elevenlabs"] | {"max_ahead": 1}}, backend=backend)
+    texts = [f"Speaker {i} opens. Speaker {i} argues. Speaker {i} closes." for i in range(8)]
+    threads = [threading.Thread(target=audio.say, args=(text,)) for text in texts]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    closer = threading.Thread(target=audio.close)
+    closer.start()
+    closer.join(timeout=10)
+    assert not closer.is_alive()
+    size = len(split_sentences(texts[0], 40))
+    runs = [" ".join(backend.played[i:i + size]) for i in range(0, len(backend.played), size)]
+    assert sorted(runs) == sorted(texts)
@@ -0,0 +1,60 @@
+"""Resuming a checkpointed run between the initial vote and its full outputs."""
+
+import pytest
+
+from workflow import graph, is_split
+from workflow.graph import _prepare
+
+CLAIM = "Forbes valued the club at over $400 million in 2019."
+TRUTH = "In 2019, Forbes estimated the club was worth approximately $500 million."
+# The stub's verdicts depend only on the prompt: on this pair literal and context say Mutated, steelman Faithful
+
+
+class _StaleVote:
+    """Stands in for the first run's vote: only its verdicts reach the checkpoint before the interrupt."""
+
+    def __init__(self, verdicts: dict[str, str]) -> None:
+        self._verdicts = verdicts
+
+    def verdicts(self) -> dict[str, str]:
+        return self._verdicts
+
+
+def _resume_after_stale_vote(config: dict, stale: dict[str, str], monkeypatch) -> dict:
+    """Stop after initial_vote with `stale` verdicts checkpointed, then resume (which votes again)."""
+    compiled, inputs, kwargs, _ = _prepare(CLAIM, TRUTH, config, None, "resume")
+    with monkeypatch.context() as m:
+        m.setattr(graph, "_start_initial_vote", lambda state, runtime: _StaleVote(stale))
+        compiled.invoke(inputs, interrupt_after=["initial_vote"], **kwargs)
+    assert compiled.get_state(kwargs["config"]).next == ("debate",)
+    compiled, inputs, kwargs, finished = _prepare(CLAIM, TRUTH, config, None, "resume")
+    assert inputs is None and finished is None
+    return compiled.invoke(inputs, **kwargs)
+
+
+@pytest.fixture
+def checkpointed(config, tmp_path) -> dict:
+    return config | {"checkpoint": {"enabled": True, "path": str(tmp_path / "checkpoints.sqlite")}}
+
+
+def _jury(config: dict, *names: str) -> dict:
+    return config | {"agents": [a for a in config["agents"] if a["name"] in names]}
+
+
+def test_resumed_debate_takes_sides_from_the_new_vote(checkpointed, monkeypatch):
+    config = _jury(checkpointed, "literal", "steelman")
+    state = _resume_after_stale_vote(config, {"literal": "Faithful", "steelman": "Mutated"}, monkeypatch)
+    verdicts = {name: out.verdict for name, out in state["initial_vote_outputs"].items()}
+    assert verdicts == {"literal": "Mutated", "steelman": "Faithful"}
+    assert state["initial_verdicts"] == verdicts
+    assert state["transcript"] and all(t["side"] == verdicts[t["speaker"]] for t in state["transcript"])
+
+
+def test_resumed_vote_no_longer_split_skips_the_debate(checkpointed, monkeypatch):
+    config = _jury(checkpointed, "literal", "context")
+    state = _resume_after_stale_vote(config, {"literal": "Mutated", "context": "Faithful"}, monkeypatch)
+    verdicts = {name: out.verdict for name, out in state["initial_vote_outputs"].items()}
+    assert not is_split(verdicts)
+    assert state["initial_verdicts"] == verdicts
+    assert state["transcript"] == [] and state["skipped_debate"]
+    assert set(state["revote_outputs"]) == set(verdicts)
@@ -0,0 +1,57 @@
+"""Console renderer ordering: every initial vote row is shown before the debate, however late it arrives."""
+
+from schemas import RevoteOutput
+from workflow.interactive import _Renderer
+
+
+def _vote(verdict: str, reasoning: str) -> RevoteOutput:
+    return RevoteOutput(verdict=verdict, confidence=0.8, reasoning=reasoning)
+
+
+def _renderer() -> tuple[_Renderer, list[str]]:
+    lines = [""]
+
+    def print_fn(*args, end="\n", flush=False):
+        lines[-1] += " ".join(map(str, args))
+        if end == "\n":
+            lines.append("")
+        else:
+            lines[-1] += end
+
+    state = {"claim": "c", "truth": "t", "initial_verdicts": {"literal": "Mutated", "context": "Faithful"}}
+    return _Renderer(state, print_fn, {"debate": {"max_rounds": 2}}), lines
+
+
+def _order(lines: list[str], *needles: str) -> list[int]:
+    return [next(i for i, line in enumerate(lines) if needle in line) for needle in needles]
+
+
+def test_late_initial_row_after_a_debate_turn():
+    renderer, lines = _renderer()
+    renderer.on_event({"event": "vote", "stage": "initial_vote", "agent": "literal", "output": _vote("Mutated", "figures differ")})
+    renderer.on_event({"event": "turn", "speaker": "literal"})
+    renderer.on_token("debate", "The figure was changed.")
+    renderer.on_event({"event": "turn_end", "speaker": "literal", "content": "The figure was changed."})
+    renderer.on_event({"event": "turn", "speaker": "context"})
+    renderer.on_token("debate", "Context ")
+    assert "DEBATE" not in "".join(lines)  # held until context's initial row is in
+
+    renderer.on_event({"event": "vote", "stage": "initial_vote", "agent": "context", "output": _vote("Faithful", "same meaning")})
+    renderer.on_event({"event": "vote", "stage": "revote", "agent": "literal", "output": _vote("Mutated", "still differs")})
+    renderer.on_token("debate", "agrees.")
+    renderer.on_event({"event": "turn_end", "speaker": "context", "content": "Context agrees."})
+
+    initial, context_row, debate, turn, revote = _order(
+        lines, "INITIAL VOTE", "context: Faithful", "DEBATE", "context: Context agrees.", "REVOTE"
+    )
+    assert initial < context_row < debate < turn < revote
+    assert lines[turn].strip() == "context: Context agrees."
+
+
+def test_debate_prints_at_once_when_initial_rows_are_in():
+    renderer, lines = _renderer()
+    for name, verdict in (("literal", "Mutated"), ("context", "Faithful")):
+        renderer.on_event({"event": "vote", "stage": "initial_vote", "agent": name, "output": _vote(verdict, "r")})
+    renderer.on_event({"event": "turn", "speaker": "literal"})
+    renderer.on_token("debate", "Streaming")
+    assert lines[-1] == "    literal: Streaming"
@@ -0,0 +1,61 @@
+"""Self-consistency voting: agreement over the k samples asked for, and the config checks on samples."""
+
+import pytest
+
+from agents import jury
+from config import validate_config
+from schemas import JuryOutput
+
+
+def _out(verdict: str, confidence: float = 0.8) -> JuryOutput:
+    return JuryOutput(verdict=verdict, confidence=confidence, reasoning="r")
+
+
+@pytest.fixture
+def draws(monkeypatch) -> list[int]:
+    """Fake sampler: every sample says Mutated; records how many samples each request asked for."""
+    asked = []
+
+    def invoke_samples(_jury, _prompt, _config, n, *, offset=0):
+        asked.append(n)
+        return [_out("Mutated") for _ in range(n)]
+
+    monkeypatch.setattr(jury, "invoke_samples", invoke_samples)
+    return asked
+
+
+def test_unanimous_early_stop_is_not_full_agreement(draws):
+    output = jury.self_consistent(None, "prompt", {}, 5)
+    assert draws == [3]
+    assert output.agreement == pytest.approx(3 / 5)
+    assert output.confidence == pytest.approx(3 / 5 * 0.8)  # the samples' own confidence is kept
+
+
+def test_without_early_stop_all_k_are_drawn(draws):
+    output = jury.self_consistent(None, "prompt", {}, 5, early_stop=False)
+    assert draws == [5]
+    assert output.agreement == 1.0
+    assert output.confidence == pytest.approx(0.8)
+
+
+def test_majority_over_drawn_samples():
+    output = jury.majority([_out("Mutated", 0.9), _out("Faithful", 0.6), _out("mutated", 0.7)])
+    assert output.verdict == "Mutated"
+    assert output.agreement == pytest.approx(2 / 3)
+    assert output.confidence == pytest.approx(2 / 3 * 0.8)
+    assert len(output.samples) == 3
+
+
+@pytest.mark.parametrize(
+    ("samples", "temperature", "error"),
+    [(2, 0.7, "odd integer"), (0, 0.7, "odd integer"), ("3", 0.7, "odd integer"), (3, 0, "temperature > 0")],
+)
+def test_config_rejects_bad_samples(samples, temperature, error):
+    config = {"agents": [{"name": "literal", "samples": samples}], "components": {"agents": {"temperature": temperature}}}
+    with pytest.raises(ValueError, match=error):
+        validate_config(config)
+
+
+def test_config_accepts_odd_samples_and_single_votes_at_temperature_zero():
+    validate_config({"agents": [{"name": "literal", "samples": 3}], "components": {"agents": {"temperature": 0.7}}})
+    validate_config({"agents": [{"name": "literal"}], "components": {"agents": {"temperature": 0}}})
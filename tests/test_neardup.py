@@ -0,0 +1,59 @@
+"""Near-duplicate store: which variants of a judged pair may reuse its verdict, and old stores."""
+
+import sqlite3
+import warnings
+
+import pytest
+
+from retrieval import NearDuplicates
+
+TRUTH = "In 2019, the company sold approximately 4.2 million cars across Europe and North America, its best year."
+CLAIM = "In 2019 the company sold about 4.2 million cars across Europe and North America, a record year for the brand."
+
+
+@pytest.fixture
+def store(tmp_path) -> NearDuplicates:
+    store = NearDuplicates(tmp_path / "near.sqlite", threshold=0.7)
+    store.add(CLAIM, TRUTH, "fp", {"verdict": "Faithful"}, pair_id=1)
+    return store
+
+
+@pytest.mark.parametrize("claim", [
+    CLAIM.replace(" ,", ","),
+    CLAIM.replace("about", "approximately"),  # same qualifier kind
+    CLAIM.replace("sold", "sells"),  # light paraphrase of one content word
+])
+def test_light_paraphrases_reuse(store, claim):
+    match = store.lookup(claim, TRUTH, "fp")
+    assert match is not None and match.result == {"verdict": "Faithful"}
+
+
+@pytest.mark.parametrize("claim", [
+    CLAIM.replace("4.2", "5.2"),
+    CLAIM.replace("about", "more than"),  # another qualifier kind
+    CLAIM.replace("across Europe and North America, a record year for the brand", "in Asia, a weak year"),
+])
+def test_changed_numbers_qualifiers_or_content_do_not_reuse(store, claim):
+    assert store.lookup(claim, TRUTH, "fp") is None
+
+
+def test_other_config_fingerprint_does_not_reuse(store):
+    assert store.lookup(CLAIM, TRUTH, "other") is None
+
+
+def test_store_from_an_older_gate_is_kept_aside(tmp_path):
+    path = tmp_path / "near.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE entries (entry INTEGER PRIMARY KEY, numbers TEXT)")
+    conn.execute("INSERT INTO entries (numbers) VALUES ('[]')")
+    conn.commit()
+    conn.close()
+    with pytest.warns(RuntimeWarning, match="older version"):
+        store = NearDuplicates(path)
+    assert store.lookup(CLAIM, TRUTH, "fp") is None
+    kept = sqlite3.connect(tmp_path / "near.sqlite.v0")
+    assert kept.execute("SELECT count(*) FROM entries").fetchone() == (1,)
+    kept.close()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        NearDuplicates(path)  # the new store opens again as it is
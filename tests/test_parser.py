@@ -0,0 +1,54 @@
+"""Chunked parse: the whole-claim omission pass and how its facts merge with the chunk facts."""
+
+import pytest
+
+from agents import parser
+from schemas import Fact, FactFrame
+
+# Omission mutation: the claim drops the truth's time frame and region, so no single chunk is wrong.
+TRUTH = "In the first quarter of 2020, sales in Europe rose 12%. Profits were flat over the same period."
+CLAIM = "Sales rose 12%. Profits were flat."
+
+
+@pytest.fixture
+def prompts(monkeypatch) -> list[str]:
+    """Fake parser model: answers chunk and omission prompts, records every prompt it sees."""
+    seen = []
+
+    def invoke(_model, prompt: str, _config):
+        seen.append(prompt)
+        if "leaves out or weakens" in prompt:
+            return FactFrame(facts=[
+                Fact(category="time frame", claim_says=None, truth_says="in the first quarter of 2020"),
+                Fact(category="figure", claim_says="12%", truth_says="rose 12%"),  # a chunk has it already
+            ])
+        if "Sales rose 12%" in prompt:
+            return FactFrame(facts=[Fact(category="figure", claim_says="rose 12%", truth_says="Rose 12%.")])
+        return FactFrame(facts=[Fact(category="trend", claim_says="flat", truth_says="flat")])
+
+    monkeypatch.setattr(parser, "_create_parser", lambda config: None)
+    monkeypatch.setattr(parser, "invoke", invoke)
+    return seen
+
+
+def _config(**parse) -> dict:
+    return {"parse": {"mode": "chunked", "chunk_chars": 20} | parse, "passages": {"enabled": False}}
+
+
+def test_omission_pass_sees_the_whole_claim(prompts):
+    frame = parser.parse(CLAIM, TRUTH, _config())
+    assert len(prompts) == 3  # two chunks and the omission pass
+    omission_prompt = next(p for p in prompts if "leaves out or weakens" in p)
+    assert f'"{CLAIM}"' in omission_prompt
+    assert [(f.category, f.truth_says) for f in frame.facts] == [
+        ("figure", "Rose 12%."),
+        ("trend", "flat"),
+        ("time frame", "in the first quarter of 2020"),
+    ]
+    assert frame.facts[-1].note == "omitted in claim"
+
+
+def test_omission_pass_can_be_turned_off(prompts):
+    frame = parser.parse(CLAIM, TRUTH, _config(omissions=False))
+    assert len(prompts) == 2
+    assert all("omitted in claim" != f.note for f in frame.facts)
@@ -0,0 +1,31 @@
+"""Passage selection for long truths: the context stays within max_chars."""
+
+from retrieval import select_passages
+
+FILLER = "The committee also reviewed unrelated budget items in some detail. "
+
+
+def test_oversize_best_passage_is_cut_to_max_chars():
+    long_hit = "In 2019 Forbes valued the club at $500 million, " + "and the report went on at length " * 40 + "."
+    truth = FILLER * 3 + long_hit + " " + FILLER * 3
+    selection = select_passages("Forbes valued the club at $400 million in 2019.", truth, max_chars=300)
+    [span] = selection.spans
+    assert span["start"] == truth.index(long_hit)
+    assert span["end"] - span["start"] <= 300
+    assert truth[span["end"]] == " "  # cut at a word boundary
+    assert selection.text.startswith("[...] In 2019 Forbes")
+    assert selection.text.endswith("[...]")
+
+
+def test_best_passage_drops_neighbours_that_do_not_fit():
+    hit = "In 2019 Forbes valued the club at $500 million."
+    truth = FILLER * 3 + hit + " " + FILLER * 3
+    selection = select_passages("Forbes valued the club at $400 million in 2019.", truth, max_chars=len(hit) + 20)
+    assert [truth[s["start"]:s["end"]] for s in selection.spans] == [hit]
+
+
+def test_passages_fill_up_to_max_chars():
+    truth = " ".join(f"Sentence {i} mentions Forbes and figure {i}." for i in range(60))
+    selection = select_passages("Forbes figure 7 and figure 30.", truth, max_chars=400)
+    assert sum(s["end"] - s["start"] for s in selection.spans) <= 400
+    assert any("figure 7." in truth[s["start"]:s["end"]] for s in selection.spans)
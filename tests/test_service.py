@@ -0,0 +1,116 @@
+"""The ASGI service against the stub: coalescing, request validation, admission control."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from service import create_app
+from workflow import get_graph
+from workflow.checkpoint import get_checkpointer
+
+PAIRS = [
+    {"claim": "Forbes valued the club at over $400 million in 2019.", "truth": "In 2019, Forbes estimated the club was worth approximately $500 million."},
+    {"claim": "The video had 4.2 billion YouTube views by October 2019.", "truth": "As of October 9, 2019, the video has received over 4.2 billion views on YouTube."},
+    {"claim": "Amharic had 30 million speakers in 2007.", "truth": "With approximately 47 million speakers as of 2007, Amharic is the second-most spoken Semitic language."},
+]
+
+
+async def call(app, method: str, path: str, body=None) -> tuple[int, list]:
+    """One request straight through the ASGI app: (status, JSON body or NDJSON lines)."""
+    request = {"type": "http.request", "body": b"" if body is None else json.dumps(body).encode(), "more_body": False}
+    sent = []
+
+    async def receive():
+        return request
+
+    async def send(message):
+        sent.append(message)
+
+    await app({"type": "http", "method": method, "path": path}, receive, send)
+    data = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body").decode()
+    return sent[0]["status"], [json.loads(line) for line in data.splitlines() if line]
+
+
+def _app(config: dict, **service):
+    app = create_app(config | {"service": (config.get("service") or {}) | {"max_batch": None} | service})
+    app.service.warm()
+    return app
+
+
+def test_concurrent_requests_for_one_pair_share_a_run(config):
+    async def main():
+        app = _app(config)
+        return await asyncio.gather(*(call(app, "POST", "/judge", PAIRS[0] | {"id": i}) for i in range(3))), app
+
+    responses, app = asyncio.run(main())
+    assert [status for status, _ in responses] == [200, 200, 200]
+    results = [body[0] for _, body in responses]
+    assert [r["id"] for r in results] == [0, 1, 2]
+    assert sum(bool(r.get("coalesced")) for r in results) == 2
+    assert len({json.dumps(r["verdict"], sort_keys=True) for r in results}) == 1
+    assert app.service.pairs.shared == 2
+
+
+def test_batch_repeats_reuse_the_first_result(config):
+    status, lines = asyncio.run(call(_app(config), "POST", "/judge/batch", {"pairs": [PAIRS[0], PAIRS[1], PAIRS[0]]}))
+    assert status == 200
+    assert len(lines) == 3
+    assert sum(bool(r.get("coalesced")) for r in lines) == 1
+    assert all(r["verdict"]["verdict"] in ("Faithful", "Mutated") for r in lines)
+
+
+def test_malformed_requests_get_400(config):
+    async def main():
+        app = _app(config, max_in_flight=1, max_queue=1, max_batch=2)
+        return [
+            await call(app, "POST", "/judge", {"claim": "no truth"}),
+            await call(app, "POST", "/judge/batch", {"pairs": [{"claim": 1, "truth": "x"}]}),
+            await call(app, "POST", "/judge/batch", {"pairs": PAIRS}),
+        ], app
+
+    responses, app = asyncio.run(main())
+    assert [status for status, _ in responses] == [400, 400, 400]
+    assert "Batch too large: 3 > 2" in responses[2][1][0]["error"]
+    assert app.service.metrics.queued == 0
+
+
+def test_batch_pairs_count_against_the_queue(config):
+    release = threading.Event()
+
+    async def main():
+        app = _app(config, max_in_flight=1, max_queue=1)
+        service = app.service
+        run = service._run
+        service._run = lambda pair, cfg: release.wait(10) and run(pair, cfg)  # hold the worker
+        batch = asyncio.create_task(call(app, "POST", "/judge/batch", {"pairs": PAIRS[:2]}))
+        while service.metrics.in_flight == 0:
+            await asyncio.sleep(0.01)
+        busy = await call(app, "POST", "/judge", PAIRS[2])  # the batch's second pair holds the queue slot
+        queued = service.metrics.queued
+        release.set()
+        done = await batch
+        return busy, queued, done, service
+
+    (busy_status, busy_body), queued, (status, lines), service = asyncio.run(main())
+    assert busy_status == 503
+    assert busy_body[0]["error"].startswith("Service at capacity")
+    assert queued == 1
+    assert status == 200 and len(lines) == 2
+    assert (service.metrics.in_flight, service.metrics.queued) == (0, 0)
+    assert service.metrics.rejected["/judge"] == 1
+
+
+def test_max_batch_beyond_capacity_is_rejected_at_startup(config):
+    with pytest.raises(ValueError, match="max_batch"):
+        create_app(config | {"service": {"max_in_flight": 2, "max_queue": 2, "max_batch": 5}})
+    assert create_app(config | {"service": {"max_in_flight": 2, "max_queue": 2}}).service.max_batch == 4
+
+
+def test_warm_compiles_the_checkpointed_graph(config, tmp_path):
+    config = config | {"checkpoint": {"enabled": True, "path": str(tmp_path / "checkpoints.sqlite")}}
+    _app(config)
+    misses = get_graph.cache_info().misses
+    get_graph(get_checkpointer(config))  # what the first request's run_pipeline asks for
+    assert get_graph.cache_info().misses == misses
@@ -0,0 +1,92 @@
+"""The offline OpenAI stub: a full pipeline, streaming usage, `n` copies, 429s, and a second backend."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import stub_openai
+from workflow import run_pipeline
+
+
+def _post(server, body: dict) -> tuple[int, dict, bytes]:
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+    request = urllib.request.Request(url, json.dumps(body).encode(), {"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, dict(response.headers), response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), e.read()
+
+
+def _chat(**body) -> dict:
+    return {"model": "stub", "messages": [{"role": "user", "content": "Is the claim Faithful or Mutated?"}]} | body
+
+
+def test_pipeline_runs_through_the_stub(config):
+    state = run_pipeline("Sales rose 12% in 2020.", "In 2020, sales in Europe rose 12%.", config)
+    assert state["verdict"].verdict in ("Faithful", "Mutated")
+    assert set(state["initial_vote_outputs"]) == {a["name"] for a in config["agents"]}
+    assert state["fact_frame"].facts
+
+
+def test_streaming_reports_usage_last(stub):
+    status, _, data = _post(stub, _chat(stream=True, stream_options={"include_usage": True}))
+    assert status == 200
+    events = [line[len("data: "):] for line in data.decode().splitlines() if line.startswith("data: ")]
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(e) for e in events[:-1]]
+    assert "".join(c["choices"][0]["delta"].get("content", "") for c in chunks if c["choices"]) in ("Faithful", "Mutated")
+    usage = chunks[-1]["usage"]
+    assert chunks[-1]["choices"] == []
+    assert usage["total_tokens"] == usage["prompt_tokens"] + usage["completion_tokens"] > 0
+
+
+def test_n_returns_that_many_choices(stub):
+    status, _, data = _post(stub, _chat(n=3))
+    choices = json.loads(data)["choices"]
+    assert status == 200
+    assert [c["index"] for c in choices] == [0, 1, 2]
+    assert len({c["message"]["content"] for c in choices}) == 1  # deterministic for one prompt
+
+
+def test_requests_beyond_max_concurrency_get_429():
+    server = stub_openai.serve(0, latency=0.3, max_concurrency=1, background=True)
+    try:
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(_post(server, _chat()))) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        statuses = sorted(status for status, _, _ in results)
+        assert statuses[0] == 200 and statuses[1:] == [429, 429]
+        limited = next(r for r in results if r[0] == 429)
+        assert limited[1]["retry-after-ms"] == "200"
+        assert json.loads(limited[2])["error"]["type"] == "rate_limit_exceeded"
+        assert _post(server, _chat())[0] == 200  # the slot is free again
+    finally:
+        server.shutdown()
+
+
+def test_components_on_a_second_backend_share_its_concurrency_limit(config, stub):
+    local = stub_openai.serve(0, latency=0.05, max_concurrency=2, background=True)
+    try:
+        backend = {"provider": "openai_compatible", "base_url": f"http://127.0.0.1:{local.server_address[1]}/v1"}
+        components = dict(config["components"])
+        components["parser"] = components["parser"] | backend | {"max_concurrency": 2}
+        components["agents"] = components["agents"] | backend | {"max_concurrency": 4}  # the smaller limit wins
+        components["debate_status"] = components["debate_status"] | backend  # no limit of its own
+        config = config | {"components": components}
+        hosted = stub.stats["requests"]
+        claims = [f"Sales rose {n}% in 2020." for n in (3, 5, 7)]
+        with ThreadPoolExecutor(3) as pool:
+            states = list(pool.map(lambda c: run_pipeline(c, "In 2020, sales in Europe rose 12%.", config), claims))
+        assert all(s["verdict"].verdict in ("Faithful", "Mutated") for s in states)
+        # parse + four initial votes per pair, at least, went to the second backend
+        assert local.stats["requests"] >= 3 * 5
+        assert local.stats["peak"] <= 2 and local.stats["rate_limited"] == 0
+        assert stub.stats["requests"] > hosted  # the foreperson stayed on the default endpoint
+    finally:
+        local.shutdown()